@@ -0,0 +1,298 @@
+/*
+params.c
+Copyright (C) 2010 Michael Bayer mike_mp@zzzcomputing.com
+
+This module is part of SQLAlchemy and is released under
+the MIT License: http://www.opensource.org/licenses/mit-license.php
+*/
+
+#include <Python.h>
+
+/*
+ * Unpack a sequence of (key or index, processor) pairs into two
+ * arrays of borrowed references.  The sequence returned in *fast owns
+ * the pairs, and must be released by the caller.
+ */
+static int
+unpack_layout(PyObject *layout, PyObject **fast, Py_ssize_t *size,
+              PyObject ***keys, PyObject ***processors)
+{
+    Py_ssize_t i;
+    PyObject *pair;
+
+    *fast = PySequence_Fast(layout, "layout must be a sequence");
+    if (*fast == NULL)
+        return -1;
+
+    *size = PySequence_Fast_GET_SIZE(*fast);
+    *keys = PyMem_New(PyObject *, *size);
+    *processors = PyMem_New(PyObject *, *size);
+    if (*keys == NULL || *processors == NULL) {
+        PyMem_Free(*keys);
+        PyMem_Free(*processors);
+        Py_DECREF(*fast);
+        PyErr_NoMemory();
+        return -1;
+    }
+
+    for (i = 0; i < *size; i++) {
+        pair = PySequence_Fast_GET_ITEM(*fast, i);
+        if (!PyTuple_Check(pair) || PyTuple_GET_SIZE(pair) != 2) {
+            PyErr_SetString(PyExc_TypeError,
+                            "layout items must be 2-tuples");
+            PyMem_Free(*keys);
+            PyMem_Free(*processors);
+            Py_DECREF(*fast);
+            return -1;
+        }
+        (*keys)[i] = PyTuple_GET_ITEM(pair, 0);
+        (*processors)[i] = PyTuple_GET_ITEM(pair, 1);
+    }
+    return 0;
+}
+
+static PyObject *
+positional_params(PyObject *self, PyObject *args)
+{
+    PyObject *compiled_parameters, *positiontup, *layout, *sequence_format;
+    PyObject *params_fast = NULL, *keys_fast = NULL, *layout_fast = NULL;
+    PyObject **layout_keys = NULL, **layout_processors = NULL;
+    Py_ssize_t *positions = NULL;
+    PyObject *result = NULL, *row, *params, *value, *converted;
+    Py_ssize_t num_params, num_keys, num_layout, i, j;
+
+    if (!PyArg_UnpackTuple(args, "positional_params", 4, 4,
+                           &compiled_parameters, &positiontup, &layout,
+                           &sequence_format))
+        return NULL;
+
+    params_fast = PySequence_Fast(compiled_parameters,
+                                  "compiled_parameters must be a sequence");
+    if (params_fast == NULL)
+        goto error;
+    keys_fast = PySequence_Fast(positiontup, "positiontup must be a sequence");
+    if (keys_fast == NULL)
+        goto error;
+    if (unpack_layout(layout, &layout_fast, &num_layout,
+                      &layout_keys, &layout_processors) == -1) {
+        layout_fast = NULL;
+        goto error;
+    }
+
+    num_params = PySequence_Fast_GET_SIZE(params_fast);
+    num_keys = PySequence_Fast_GET_SIZE(keys_fast);
+
+    positions = PyMem_New(Py_ssize_t, num_layout);
+    if (positions == NULL && num_layout) {
+        PyErr_NoMemory();
+        goto error;
+    }
+    for (j = 0; j < num_layout; j++) {
+        positions[j] = PyInt_AsSsize_t(layout_keys[j]);
+        if (positions[j] == -1 && PyErr_Occurred())
+            goto error;
+        if (positions[j] < 0 || positions[j] >= num_keys) {
+            PyErr_SetString(PyExc_IndexError, "layout position out of range");
+            goto error;
+        }
+    }
+
+    result = PyList_New(num_params);
+    if (result == NULL)
+        goto error;
+
+    for (i = 0; i < num_params; i++) {
+        params = PySequence_Fast_GET_ITEM(params_fast, i);
+        if (!PyDict_Check(params)) {
+            PyErr_SetString(PyExc_TypeError,
+                            "compiled parameters must be dictionaries");
+            goto error;
+        }
+
+        row = PyList_New(num_keys);
+        if (row == NULL)
+            goto error;
+
+        for (j = 0; j < num_keys; j++) {
+            value = PyDict_GetItem(params,
+                                   PySequence_Fast_GET_ITEM(keys_fast, j));
+            if (value == NULL) {
+                PyErr_SetObject(PyExc_KeyError,
+                                PySequence_Fast_GET_ITEM(keys_fast, j));
+                Py_DECREF(row);
+                goto error;
+            }
+            Py_INCREF(value);
+            PyList_SET_ITEM(row, j, value);
+        }
+
+        for (j = 0; j < num_layout; j++) {
+            value = PyList_GET_ITEM(row, positions[j]);
+            converted = PyObject_CallFunctionObjArgs(layout_processors[j],
+                                                     value, NULL);
+            if (converted == NULL) {
+                Py_DECREF(row);
+                goto error;
+            }
+            Py_DECREF(value);
+            PyList_SET_ITEM(row, positions[j], converted);
+        }
+
+        if (sequence_format == (PyObject *)&PyList_Type) {
+            converted = row;
+        } else {
+            if (sequence_format == (PyObject *)&PyTuple_Type)
+                converted = PyList_AsTuple(row);
+            else
+                converted = PyObject_CallFunctionObjArgs(sequence_format,
+                                                         row, NULL);
+            Py_DECREF(row);
+            if (converted == NULL)
+                goto error;
+        }
+        PyList_SET_ITEM(result, i, converted);
+    }
+
+    PyMem_Free(positions);
+    PyMem_Free(layout_keys);
+    PyMem_Free(layout_processors);
+    Py_DECREF(layout_fast);
+    Py_DECREF(keys_fast);
+    Py_DECREF(params_fast);
+    return result;
+
+error:
+    Py_XDECREF(result);
+    PyMem_Free(positions);
+    if (layout_fast != NULL) {
+        PyMem_Free(layout_keys);
+        PyMem_Free(layout_processors);
+        Py_DECREF(layout_fast);
+    }
+    Py_XDECREF(keys_fast);
+    Py_XDECREF(params_fast);
+    return NULL;
+}
+
+static PyObject *
+named_params(PyObject *self, PyObject *args)
+{
+    PyObject *compiled_parameters, *layout, *encoding;
+    PyObject *params_fast = NULL, *layout_fast = NULL;
+    PyObject **layout_keys = NULL, **layout_processors = NULL;
+    PyObject *result = NULL, *param, *params, *value, *converted;
+    PyObject *encoded, *key;
+    Py_ssize_t num_params, num_layout, i, j, pos;
+    int status;
+
+    if (!PyArg_UnpackTuple(args, "named_params", 3, 3,
+                           &compiled_parameters, &layout, &encoding))
+        return NULL;
+
+    params_fast = PySequence_Fast(compiled_parameters,
+                                  "compiled_parameters must be a sequence");
+    if (params_fast == NULL)
+        return NULL;
+    if (unpack_layout(layout, &layout_fast, &num_layout,
+                      &layout_keys, &layout_processors) == -1) {
+        Py_DECREF(params_fast);
+        return NULL;
+    }
+
+    num_params = PySequence_Fast_GET_SIZE(params_fast);
+    result = PyList_New(num_params);
+    if (result == NULL)
+        goto error;
+
+    for (i = 0; i < num_params; i++) {
+        params = PySequence_Fast_GET_ITEM(params_fast, i);
+        if (!PyDict_Check(params)) {
+            PyErr_SetString(PyExc_TypeError,
+                            "compiled parameters must be dictionaries");
+            goto error;
+        }
+
+        param = PyDict_Copy(params);
+        if (param == NULL)
+            goto error;
+        /* the list owns param from here on */
+        PyList_SET_ITEM(result, i, param);
+
+        for (j = 0; j < num_layout; j++) {
+            value = PyDict_GetItem(param, layout_keys[j]);
+            if (value == NULL)
+                continue;
+            converted = PyObject_CallFunctionObjArgs(layout_processors[j],
+                                                     value, NULL);
+            if (converted == NULL)
+                goto error;
+            status = PyDict_SetItem(param, layout_keys[j], converted);
+            Py_DECREF(converted);
+            if (status == -1)
+                goto error;
+        }
+
+        if (encoding != Py_None) {
+            encoded = PyDict_New();
+            if (encoded == NULL)
+                goto error;
+            pos = 0;
+            while (PyDict_Next(param, &pos, &key, &value)) {
+                key = PyObject_CallMethod(key, "encode", "O", encoding);
+                if (key == NULL) {
+                    Py_DECREF(encoded);
+                    goto error;
+                }
+                status = PyDict_SetItem(encoded, key, value);
+                Py_DECREF(key);
+                if (status == -1) {
+                    Py_DECREF(encoded);
+                    goto error;
+                }
+            }
+            /* releases param */
+            PyList_SetItem(result, i, encoded);
+        }
+    }
+
+    PyMem_Free(layout_keys);
+    PyMem_Free(layout_processors);
+    Py_DECREF(layout_fast);
+    Py_DECREF(params_fast);
+    return result;
+
+error:
+    Py_XDECREF(result);
+    PyMem_Free(layout_keys);
+    PyMem_Free(layout_processors);
+    Py_DECREF(layout_fast);
+    Py_DECREF(params_fast);
+    return NULL;
+}
+
+#ifndef PyMODINIT_FUNC  /* declarations for DLL import/export */
+#define PyMODINIT_FUNC void
+#endif
+
+
+static PyMethodDef module_methods[] = {
+    {"positional_params", positional_params, METH_VARARGS,
+     "Convert a list of compiled parameter dictionaries into sequences "
+     "ordered by positiontup, applying the processors in layout."},
+    {"named_params", named_params, METH_VARARGS,
+     "Copy a list of compiled parameter dictionaries, applying the "
+     "processors in layout and optionally encoding the keys."},
+    {NULL, NULL, 0, NULL}        /* Sentinel */
+};
+
+PyMODINIT_FUNC
+initcparams(void)
+{
+    PyObject *m;
+
+    m = Py_InitModule3("cparams", module_methods,
+                       "Module containing C versions of bind parameter "
+                       "conversion functions.");
+    if (m == NULL)
+        return;
+}
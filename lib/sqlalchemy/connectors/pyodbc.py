@@ -13,6 +13,8 @@ class PyODBCConnector(Connector):
     supports_unicode = sys.maxunicode == 65535
     supports_unicode_statements = supports_unicode
     supports_native_decimal = True
+    # pyodbc cursors fetch rows from the server on demand
+    supports_server_side_cursors = True
     default_paramstyle = 'named'
     
     # for non-DSN connections, this should
@@ -18,6 +18,25 @@ strings, also pass ``use_unicode=0`` in the connection arguments::
 
   # set client encoding to utf8; all strings come back as utf8 str
   create_engine('mysql:///mydb?charset=utf8&use_unicode=0')
+
+Streaming Results
+-----------------
+
+MySQL-Python normally buffers the full result of a statement in client
+memory before returning the first row.  When the ``stream_results``
+execution option is set, or ``server_side_cursors=True`` is passed to
+:func:`~sqlalchemy.create_engine()`, results are instead read with an
+unbuffered ``SSCursor``, fetching at most ``max_row_buffer`` rows (100 by
+default) per round trip::
+
+  conn.execution_options(stream_results=True, max_row_buffer=1000)
+
+While an unbuffered result is being read, no other statement may be
+executed on the same connection; the result must be fully consumed or
+closed first.  :meth:`~sqlalchemy.orm.query.Query.yield_per()` sets
+``stream_results``, so lazy loads, "selectin" and "subquery" eager loads
+and autoflushes can't take place while iterating such a query, unless
+streaming is turned off again with ``execution_options(stream_results=False)``.
 """
 
 import decimal
@@ -38,6 +57,10 @@ class MySQL_mysqldbExecutionContext(MySQLExecutionContext):
             return self._rowcount
         else:
             return self.cursor.rowcount
+    
+    def create_server_side_cursor(self):
+        return self._connection.connection.cursor(
+                                    self.dialect.dbapi.cursors.SSCursor)
         
         
 class MySQL_mysqldbCompiler(MySQLCompiler):
@@ -73,6 +96,7 @@ class MySQL_mysqldb(MySQLDialect):
     supports_unicode_statements = False
     supports_sane_rowcount = True
     supports_sane_multi_rowcount = True
+    supports_server_side_cursors = True
 
     default_paramstyle = 'format'
     execution_ctx_cls = MySQL_mysqldbExecutionContext
@@ -87,6 +111,10 @@ class MySQL_mysqldb(MySQLDialect):
         }
     )
     
+    def __init__(self, server_side_cursors=False, **kwargs):
+        MySQLDialect.__init__(self, **kwargs)
+        self.server_side_cursors = server_side_cursors
+    
     @classmethod
     def dbapi(cls):
         return __import__('MySQLdb')
@@ -11,7 +11,7 @@ import re
 class MySQL_pyodbcExecutionContext(MySQLExecutionContext):
 
     def get_lastrowid(self):
-        cursor = self.create_cursor()
+        cursor = self.create_default_cursor()
         cursor.execute("SELECT LAST_INSERT_ID()")
         lastrowid = cursor.fetchone()[0]
         cursor.close()
@@ -40,7 +40,7 @@ class _ZxJDBCBit(BIT):
 
 class MySQL_zxjdbcExecutionContext(MySQLExecutionContext):
     def get_lastrowid(self):
-        cursor = self.create_cursor()
+        cursor = self.create_default_cursor()
         cursor.execute("SELECT LAST_INSERT_ID()")
         lastrowid = cursor.fetchone()[0]
         cursor.close()
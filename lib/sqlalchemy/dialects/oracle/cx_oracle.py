@@ -21,7 +21,9 @@ URL, or as keyword arguments to :func:`~sqlalchemy.create_engine()` are:
 * *allow_twophase* - enable two-phase transactions.  Defaults to ``True``.
 
 * *arraysize* - set the cx_oracle.arraysize value on cursors, in SQLAlchemy
-  it defaults to 50.  See the section on "LOB Objects" below.
+  it defaults to 50.  See the section on "LOB Objects" below.  For statements
+  executed with the ``stream_results`` execution option, the ``max_row_buffer``
+  execution option, if present, is used as the arraysize instead.
   
 * *auto_convert_lobs* - defaults to True, see the section on LOB objects.
 
@@ -234,12 +236,20 @@ class Oracle_cx_oracleExecutionContext(OracleExecutionContext):
                     self.parameters[0][quoted_bind_names.get(name, name)] = \
                                                         self.out_parameters[name]
         
-    def create_cursor(self):
+    def create_default_cursor(self):
         c = self._connection.connection.cursor()
         if self.dialect.arraysize:
             c.arraysize = self.dialect.arraysize
         return c
 
+    def create_server_side_cursor(self):
+        # cx_oracle cursors stream natively, fetching
+        # arraysize rows per round trip.
+        c = self.create_default_cursor()
+        if 'max_row_buffer' in self.execution_options:
+            c.arraysize = self.execution_options['max_row_buffer']
+        return c
+
     def get_result_proxy(self):
         if hasattr(self, 'out_parameters') and self.compiled.returning:
             returning_params = dict((k, v.getvalue()) for k, v in self.out_parameters.items())
@@ -308,6 +318,7 @@ class Oracle_cx_oracle(OracleDialect):
     colspecs = colspecs
     
     execute_sequence_format = list
+    supports_server_side_cursors = True
     
     def __init__(self, 
                 auto_setinputsizes=True, 
@@ -130,7 +130,7 @@ PGUuid = UUID
 class ARRAY(sqltypes.MutableType, sqltypes.Concatenable, sqltypes.TypeEngine):
     __visit_name__ = 'ARRAY'
     
-    def __init__(self, item_type, mutable=True):
+    def __init__(self, item_type, mutable=True, track_mutations=False):
         """Construct an ARRAY.
 
         E.g.::
@@ -148,6 +148,10 @@ class ARRAY(sqltypes.MutableType, sqltypes.Concatenable, sqltypes.TypeEngine):
           considered mutable.  If so, generic copy operations (typically used by the ORM) will
           shallow-copy values.
           
+        :param track_mutations: Defaults to False: when True, the ORM tracks in-place changes
+          to lists as they occur, rather than comparing each list against a copy at flush
+          time.  See :meth:`~sqlalchemy.types.AbstractType.tracks_mutations`.
+
         """
         if isinstance(item_type, ARRAY):
             raise ValueError("Do not nest ARRAY types; ARRAY(basetype) "
@@ -156,11 +160,12 @@ class ARRAY(sqltypes.MutableType, sqltypes.Concatenable, sqltypes.TypeEngine):
             item_type = item_type()
         self.item_type = item_type
         self.mutable = mutable
+        self.track_mutations = track_mutations
 
     def copy_value(self, value):
         if value is None:
             return None
-        elif self.mutable:
+        elif self.mutable or self.track_mutations:
             return list(value)
         else:
             return value
@@ -169,7 +174,10 @@ class ARRAY(sqltypes.MutableType, sqltypes.Concatenable, sqltypes.TypeEngine):
         return x == y
 
     def is_mutable(self):
-        return self.mutable
+        return self.mutable and not self.track_mutations
+
+    def tracks_mutations(self):
+        return self.track_mutations
 
     def dialect_impl(self, dialect, **kwargs):
         impl = super(ARRAY, self).dialect_impl(dialect, **kwargs)
@@ -182,7 +190,8 @@ class ARRAY(sqltypes.MutableType, sqltypes.Concatenable, sqltypes.TypeEngine):
     def adapt(self, impltype):
         return impltype(
             self.item_type,
-            mutable=self.mutable
+            mutable=self.mutable,
+            track_mutations=self.track_mutations
         )
         
     def bind_processor(self, dialect):
@@ -22,7 +22,8 @@ psycopg2-specific keyword arguments which are accepted by :func:`~sqlalchemy.cre
   are not immediately pre-fetched and buffered after statement execution, but are instead left 
   on the server and only retrieved as needed.    SQLAlchemy's :class:`~sqlalchemy.engine.base.ResultProxy`
   uses special row-buffering behavior when this feature is enabled, such that groups of 100 rows 
-  at a time are fetched over the wire to reduce conversational overhead.
+  at a time are fetched over the wire to reduce conversational overhead; the
+  ``max_row_buffer`` execution option changes this size.
 * *use_native_unicode* - Enable the usage of Psycopg2 "native unicode" mode per connection.  True  
   by default.
 * *isolation_level* - Sets the transaction isolation level for each transaction
@@ -43,16 +44,17 @@ The following per-statement execution options are respected:
 * *stream_results* - Enable or disable usage of server side cursors for the SELECT-statement.
   If *None* or not set, the *server_side_cursors* option of the connection is used. If
   auto-commit is enabled, the option is ignored.
+* *max_row_buffer* - The largest number of rows fetched from a server side cursor
+  per round trip.  Defaults to 100.
 
 """
 
-import random, re
+import random
 import decimal
 
 from sqlalchemy import util
 from sqlalchemy import processors
 from sqlalchemy.engine import base, default
-from sqlalchemy.sql import expression
 from sqlalchemy.sql import operators as sql_operators
 from sqlalchemy import types as sqltypes
 from sqlalchemy.dialects.postgresql.base import PGDialect, PGCompiler, \
@@ -96,44 +98,12 @@ class _PGArray(ARRAY):
                     self.item_type.convert_unicode:
             self.item_type.convert_unicode = "force"
 
-# When we're handed literal SQL, ensure it's a SELECT-query. Since
-# 8.3, combining cursors and "FOR UPDATE" has been fine.
-SERVER_SIDE_CURSOR_RE = re.compile(
-    r'\s*SELECT',
-    re.I | re.UNICODE)
-
 class PostgreSQL_psycopg2ExecutionContext(PGExecutionContext):
-    def create_cursor(self):
-        # TODO: coverage for server side cursors + select.for_update()
-        
-        if self.dialect.server_side_cursors:
-            is_server_side = \
-                self.execution_options.get('stream_results', True) and (
-                    (self.compiled and isinstance(self.compiled.statement, expression.Selectable) \
-                    or \
-                    (
-                        (not self.compiled or 
-                        isinstance(self.compiled.statement, expression._TextClause)) 
-                        and self.statement and SERVER_SIDE_CURSOR_RE.match(self.statement))
-                    )
-                )
-        else:
-            is_server_side = self.execution_options.get('stream_results', False)
-
-        self.__is_server_side = is_server_side
-        if is_server_side:
-            # use server-side cursors:
-            # http://lists.initd.org/pipermail/psycopg/2007-January/005251.html
-            ident = "c_%s_%s" % (hex(id(self))[2:], hex(random.randint(0, 65535))[2:])
-            return self._connection.connection.cursor(ident)
-        else:
-            return self._connection.connection.cursor()
-
-    def get_result_proxy(self):
-        if self.__is_server_side:
-            return base.BufferedRowResultProxy(self)
-        else:
-            return base.ResultProxy(self)
+    def create_server_side_cursor(self):
+        # use server-side cursors:
+        # http://lists.initd.org/pipermail/psycopg/2007-January/005251.html
+        ident = "c_%s_%s" % (hex(id(self))[2:], hex(random.randint(0, 65535))[2:])
+        return self._connection.connection.cursor(ident)
 
 
 class PostgreSQL_psycopg2Compiler(PGCompiler):
@@ -154,6 +124,7 @@ class PostgreSQL_psycopg2(PGDialect):
     supports_unicode_statements = False
     default_paramstyle = 'pyformat'
     supports_sane_multi_rowcount = False
+    supports_server_side_cursors = True
     execution_ctx_cls = PostgreSQL_psycopg2ExecutionContext
     statement_compiler = PostgreSQL_psycopg2Compiler
     preparer = PostgreSQL_psycopg2IdentifierPreparer
@@ -171,6 +171,9 @@ class _SQLite_pysqliteDate(DATE):
 class SQLite_pysqlite(SQLiteDialect):
     default_paramstyle = 'qmark'
     poolclass = pool.SingletonThreadPool
+    
+    # pysqlite steps through a result as rows are fetched
+    supports_server_side_cursors = True
 
     colspecs = util.update_copy(
         SQLiteDialect.colspecs,
@@ -126,6 +126,13 @@ def create_engine(*args, **kwargs):
       error, use the Python warnings filter documented at:
       http://docs.python.org/library/warnings.html
 
+    :param compiled_cache_size=100: the number of :class:`~sqlalchemy.engine.base.Compiled`
+        objects the Engine will retain in its ``compiled_cache``, an LRU cache
+        which allows a statement that is structurally identical to one 
+        already executed to skip the SQL compilation step.  Bind parameter
+        values are not part of the cache key.  Set to ``0`` or ``None``
+        to disable the cache.
+
     :param connect_args: a dictionary of options which will be
         passed directly to the DBAPI's ``connect()`` method as
         additional keyword arguments.
@@ -198,6 +205,42 @@ def create_engine(*args, **kwargs):
         inside the connection pool. This used with :class:`~sqlalchemy.pool.QueuePool` as
         well as :class:`~sqlalchemy.pool.SingletonThreadPool`.
 
+    :param pool_idle_timeout=None: number of seconds a connection may
+        remain unused in the pool before the ``pool_maintenance_interval``
+        thread closes it.  This is only used with 
+        :class:`~sqlalchemy.pool.QueuePool`.
+
+    :param pool_leak_threshold=None: number of seconds a connection may
+        remain checked out before the pool reports it as leaked, logging
+        the stack trace at which it was checked out.  See 
+        :meth:`~sqlalchemy.pool.Pool.leaked`.
+
+    :param pool_maintenance_interval=None: if set, a background thread
+        opens the rest of ``pool_size`` connections once the first
+        connection has been made, and
+        every given number of seconds replaces pooled connections which
+        are about to exceed ``pool_recycle``, as well as closing those 
+        which exceed ``pool_idle_timeout``, so that checkouts don't pay
+        for reconnecting.  This is only used with 
+        :class:`~sqlalchemy.pool.QueuePool`.
+
+    :param pool_pre_ping=False: if True, the pool tests each connection 
+        upon checkout using a lightweight statement such as ``SELECT 1``,
+        via the dialect's ``do_ping()`` method.  When the test fails,
+        the connection is transparently replaced.  When the dialect's
+        ``is_disconnect()`` recognizes the error, such as after a
+        database restart or failover, all other connections opened
+        before it are replaced as well.
+
+    :param pool_pre_ping_interval=0: number of seconds since a connection
+        was last returned to the pool within which ``pool_pre_ping``
+        doesn't test it.
+
+    :param pool_record_timing=False: if True, the pool records the time
+        spent waiting for connections and the time connections are held
+        in its ``metrics`` attribute, a 
+        :class:`~sqlalchemy.pool.PoolMetrics`.
+
     :param pool_recycle=-1: this setting causes the pool to recycle
         connections after the given number of seconds has passed. It
         defaults to -1, or no timeout. For example, setting to 3600
@@ -211,6 +254,23 @@ def create_engine(*args, **kwargs):
         up on getting a connection from the pool. This is only used
         with :class:`~sqlalchemy.pool.QueuePool`.
 
+    :param pool_use_lifo=False: if True, the most recently returned
+        connection is checked out first, rather than the least recently
+        returned.  This is only used with :class:`~sqlalchemy.pool.QueuePool`.
+
+    :param slow_statement_log_size=100: the number of slow statements
+        retained by ``statement_stats``.
+
+    :param slow_statement_threshold=None: if set, statements whose execution
+        takes at least this number of seconds are recorded in the Engine's
+        ``statement_stats``, along with their parameter count, duration
+        and the number of rows fetched.  Implies ``statement_stats=True``.
+
+    :param statement_stats=False: if True, the Engine maintains cumulative
+        counts of statements executed, time spent executing them and rows
+        fetched, as a :class:`~sqlalchemy.engine.base.StatementStats`
+        object available as its ``statement_stats`` attribute.
+
     :param strategy='plain': used to invoke alternate :class:`~sqlalchemy.engine.base.Engine.`
         implementations. Currently available is the ``threadlocal``
         strategy, which is described in :ref:`threadlocal_strategy`.
@@ -251,9 +311,20 @@ def _coerce_config(configuration, prefix):
         ('echo', bool),
         ('echo_pool', bool),
         ('pool_recycle', int),
+        ('pool_pre_ping', bool),
+        ('pool_pre_ping_interval', int),
+        ('pool_use_lifo', bool),
+        ('pool_maintenance_interval', int),
+        ('pool_idle_timeout', int),
+        ('pool_record_timing', bool),
+        ('pool_leak_threshold', float),
         ('pool_size', int),
         ('max_overflow', int),
         ('pool_threadlocal', bool),
+        ('compiled_cache_size', int),
+        ('statement_stats', bool),
+        ('slow_statement_threshold', float),
+        ('slow_statement_log_size', int),
     ):
         util.coerce_kw_type(options, option, type_)
     return options
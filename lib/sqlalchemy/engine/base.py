@@ -19,7 +19,8 @@ __all__ = [
     'RowProxy', 'SchemaIterator', 'StringIO', 'Transaction', 'TwoPhaseTransaction',
     'connection_memoize']
 
-import inspect, StringIO, sys, operator
+import inspect, StringIO, sys, operator, time, array
+from collections import deque
 from itertools import izip
 from sqlalchemy import exc, schema, util, types, log
 from sqlalchemy.sql import expression
@@ -108,6 +109,11 @@ class Dialect(object):
       ``UPDATE`` and ``DELETE`` statements when executed via
       executemany.
 
+    supports_server_side_cursors
+      Indicate whether the dialect can stream result rows from the
+      database as they are fetched, in response to the
+      ``stream_results`` execution option.
+
     preexecute_autoincrement_sequences
       True if 'implicit' primary key functions must be executed separately
       in order to get their value.   This is currently oriented towards
@@ -458,6 +464,20 @@ class Dialect(object):
 
         raise NotImplementedError()
 
+    def do_ping(self, dbapi_connection):
+        """Test the liveness of a DB-API connection, raising an exception if 
+        it's not usable.
+        
+        An error for which :meth:`is_disconnect` is true is raised as a
+        :class:`~sqlalchemy.exc.DisconnectionError`, upon which the pool
+        replaces all of its connections rather than only this one.
+        Used by the ``pool_pre_ping`` option of 
+        :func:`~sqlalchemy.create_engine`.
+        
+        """
+
+        raise NotImplementedError()
+
     def visit_pool(self, pool):
         """Executed after a pool is created."""
 
@@ -520,7 +540,8 @@ class ExecutionContext(object):
 
         Some dialects may wish to change the behavior of
         connection.cursor(), such as postgresql which may return a PG
-        "server side" cursor.
+        "server side" cursor when the ``stream_results`` execution
+        option is in effect.
         """
 
         raise NotImplementedError()
@@ -613,6 +634,12 @@ class Compiled(object):
     defaults.
     """
 
+    # a (cursor.description, plan) tuple used by ResultMetaData
+    _result_metadata = None
+
+    # a (dialect, processors, layout) tuple used by DefaultExecutionContext
+    _parameter_plan = None
+
     def __init__(self, dialect, statement, bind=None):
         """Construct a new ``Compiled`` object.
 
@@ -680,6 +707,227 @@ class Compiled(object):
         return self.execute(*multiparams, **params).scalar()
 
 
+class CompiledCache(object):
+    """An LRU cache of ``Compiled`` objects, keyed on statement structure.
+
+    The key consists of the structure of the statement, not including
+    the values of its bind parameters, along with the dialect, the
+    column keys and the "inline" flag the statement is compiled with.
+    A statement structurally identical to one already compiled re-uses
+    the existing ``Compiled``; the bind values of the new statement are
+    then applied as execution parameters.
+
+    Each :class:`~sqlalchemy.engine.base.Engine` maintains a
+    ``CompiledCache`` as its ``compiled_cache`` attribute; the ``hits``
+    and ``misses`` counters indicate its effectiveness.  Statements
+    which can't be keyed are compiled on each execution and are
+    counted as misses.
+
+    """
+
+    def __init__(self, capacity=100):
+        self.capacity = capacity
+        self._cache = util.LRUCache(capacity)
+        self.hits = self.misses = 0
+
+    def __len__(self):
+        return len(self._cache)
+
+    def clear(self):
+        """Remove all entries and reset the counters."""
+
+        self._cache.clear()
+        self.hits = self.misses = 0
+
+    def compile(self, elem, dialect, column_keys, inline):
+        """Return a ``Compiled`` for the given ClauseElement.
+
+        Returns a tuple of ``(compiled, params, result_map)``.  When the
+        ``Compiled`` was produced from a different statement, ``params``
+        is a dictionary of the bind values present in ``elem``, to be
+        merged underneath the execution parameters, and ``result_map``
+        is the ``Compiled``'s result map in terms of the columns of
+        ``elem``.  Otherwise both are ``None``.
+
+        """
+        anon_map = {}
+        nodes = []
+        if elem.supports_execution:
+            key = elem._gen_cache_key(anon_map, nodes)
+        if not elem.supports_execution or expression._uncacheable in anon_map:
+            entry = key = None
+        else:
+            key = (dialect, key, frozenset(column_keys), inline,
+                    tuple(sorted(elem._execution_options.iteritems())))
+            try:
+                entry = self._cache.get(key)
+            except TypeError:
+                # unhashable values within the statement, such
+                # as dialect-specific keyword arguments
+                entry = key = None
+
+        if entry is None:
+            self.misses += 1
+            compiled = elem.compile(dialect=dialect, column_keys=column_keys,
+                                    inline=inline)
+            if key is not None:
+                entry = self._create_entry(compiled, nodes)
+                if entry is not None:
+                    self._cache[key] = entry
+            return compiled, None, None
+
+        self.hits += 1
+        compiled, binds, result_map = entry
+
+        params = {}
+        for idx, name in binds:
+            bindparam = nodes[idx]
+            if not bindparam.required:
+                if util.callable(bindparam.value):
+                    params[name] = bindparam.value()
+                else:
+                    params[name] = bindparam.value
+        if isinstance(elem, expression._ValuesBase) and elem.parameters:
+            for k, v in elem.parameters.iteritems():
+                if expression._is_literal(v):
+                    params[expression._column_as_key(k)] = v
+
+        translated = {}
+        for key, (name, refs, type_) in result_map.iteritems():
+            if refs is not None:
+                objs = []
+                for idx, obj in refs:
+                    if idx is None:
+                        objs.append(obj)
+                    else:
+                        objs.append(nodes[idx])
+                translated[key] = (name, tuple(objs), type_)
+            else:
+                translated[key] = (name, None, type_)
+
+        return compiled, params, translated
+
+    def _create_entry(self, compiled, nodes):
+        """Build the cache entry for a newly compiled statement.
+
+        Bind parameters and result columns are recorded by their position
+        within ``nodes``, so that their counterparts can be located within
+        a later statement having the same key.  Returns ``None`` if the
+        result map refers to elements outside of the statement, as is the
+        case when a dialect rewrites the statement during compilation.
+
+        """
+        positions = {}
+        for idx, node in enumerate(nodes):
+            positions.setdefault(id(node), idx)
+
+        binds = []
+        for idx, node in enumerate(nodes):
+            if isinstance(node, expression._BindParamClause) and \
+                    positions[id(node)] == idx:
+                name = compiled.bind_names.get(node)
+                if name is not None:
+                    binds.append((idx, name))
+
+        result_map = {}
+        for key, (name, objs, type_) in compiled.result_map.iteritems():
+            if objs is not None:
+                refs = []
+                for obj in objs:
+                    if isinstance(obj, expression.ClauseElement):
+                        if id(obj) not in positions:
+                            return None
+                        refs.append((positions[id(obj)], obj))
+                    else:
+                        refs.append((None, obj))
+                objs = tuple(refs)
+            result_map[key] = (name, objs, type_)
+
+        return compiled, tuple(binds), result_map
+
+
+class StatementStats(object):
+    """Cumulative statement execution counters, and a log of slow statements.
+
+    An :class:`~sqlalchemy.engine.base.Engine` created with
+    ``statement_stats=True`` or a ``slow_statement_threshold`` maintains
+    a ``StatementStats`` as its ``statement_stats`` attribute.  The time
+    spent within the DB-API ``execute()`` and ``executemany()`` calls
+    of each statement is measured by the ``Connection`` directly.
+
+    The counters are ``executions``, the number of statements executed,
+    ``parameter_sets``, the number of parameter sets sent, ``time``, the
+    total number of seconds spent executing, and ``rows``, the number of
+    rows fetched from results.  They're updated without locking, so are
+    approximate when the engine is used by concurrent threads.
+
+    Statements taking at least ``slow_threshold`` seconds are recorded as
+    :class:`~sqlalchemy.engine.base.SlowStatement` entries, retaining the
+    most recent ``log_size`` of them.
+
+    """
+
+    def __init__(self, slow_threshold=None, log_size=100):
+        self.slow_threshold = slow_threshold
+        self.log_size = log_size
+        self._slow = deque()
+        self.reset()
+
+    def reset(self):
+        """Set the counters to zero and clear the slow statement log."""
+
+        self.executions = self.parameter_sets = self.rows = 0
+        self.time = 0.0
+        self._slow.clear()
+
+    def slow_statements(self):
+        """Return the logged slow statements, oldest first."""
+
+        return list(self._slow)
+
+    def _executed(self, context, statement, parameter_count, duration):
+        self.executions += 1
+        self.parameter_sets += parameter_count
+        self.time += duration
+        if self.slow_threshold is not None and duration >= self.slow_threshold:
+            entry = SlowStatement(statement, parameter_count, duration)
+            self._slow.append(entry)
+            while len(self._slow) > self.log_size:
+                self._slow.popleft()
+            if context is not None:
+                context._slow_statement = entry
+
+    def _fetched(self, context, rows):
+        self.rows += rows
+        entry = context._slow_statement
+        if entry is not None:
+            entry.rows += rows
+
+class SlowStatement(object):
+    """An entry in the slow statement log of 
+    :class:`~sqlalchemy.engine.base.StatementStats`.
+
+    Has the attributes ``statement``, the SQL string, ``parameter_count``,
+    the number of parameter sets executed, ``duration`` in seconds,
+    ``rows``, the number of rows fetched from the result once it's closed,
+    and ``timestamp``, the ``time.time()`` at which it completed.
+
+    """
+
+    __slots__ = 'statement', 'parameter_count', 'duration', 'rows', 'timestamp'
+
+    def __init__(self, statement, parameter_count, duration):
+        self.statement = statement
+        self.parameter_count = parameter_count
+        self.duration = duration
+        self.rows = 0
+        self.timestamp = time.time()
+
+    def __repr__(self):
+        return "SlowStatement(%r, parameter_count=%d, duration=%.3f, rows=%d)" % (
+                    self.statement, self.parameter_count, self.duration, self.rows)
+
+
 class TypeCompiler(object):
     """Produces DDL specification for TypeEngine objects."""
 
@@ -1108,12 +1356,27 @@ class Connection(Connectable):
         else:
             keys = []
 
+        compiled_cache = self.engine.compiled_cache
+        if compiled_cache is not None:
+            compiled, bind_values, result_map = compiled_cache.compile(
+                                        elem, self.dialect, keys, len(params) > 1)
+            if bind_values:
+                # bind values present in the statement itself, 
+                # superseded by those passed to execute()
+                params = [util.update_copy(bind_values, p) for p in params] or \
+                            [bind_values]
+        else:
+            compiled = elem.compile(
+                            dialect=self.dialect, column_keys=keys, 
+                            inline=len(params) > 1)
+            result_map = None
+
         context = self.__create_execution_context(
-                        compiled_sql=elem.compile(
-                                        dialect=self.dialect, column_keys=keys, 
-                                        inline=len(params) > 1),
+                        compiled_sql=compiled,
                         parameters=params
                     )
+        if result_map is not None:
+            context.result_map = result_map
         return self.__execute_context(context)
 
     def _execute_compiled(self, compiled, multiparams, params):
@@ -1209,21 +1472,32 @@ class Connection(Connectable):
         if self._echo:
             self.engine.logger.info(statement)
             self.engine.logger.info("%r", parameters)
+        stats = self.engine.statement_stats
+        if stats is not None:
+            start = time.time()
         try:
             self.dialect.do_execute(cursor, statement, parameters, context=context)
         except Exception, e:
             self._handle_dbapi_exception(e, statement, parameters, cursor, context)
             raise
+        if stats is not None:
+            stats._executed(context, statement, 1, time.time() - start)
 
     def _cursor_executemany(self, cursor, statement, parameters, context=None):
         if self._echo:
             self.engine.logger.info(statement)
             self.engine.logger.info("%r", parameters)
+        stats = self.engine.statement_stats
+        if stats is not None:
+            start = time.time()
         try:
             self.dialect.do_executemany(cursor, statement, parameters, context=context)
         except Exception, e:
             self._handle_dbapi_exception(e, statement, parameters, cursor, context)
             raise
+        if stats is not None:
+            stats._executed(context, statement, len(parameters), 
+                                time.time() - start)
 
     # poor man's multimethod/generic function thingy
     executors = {
@@ -1389,12 +1663,24 @@ class Engine(Connectable):
 
     """
 
-    def __init__(self, pool, dialect, url, echo=None, proxy=None):
+    def __init__(self, pool, dialect, url, echo=None, proxy=None, 
+                        compiled_cache_size=100, statement_stats=False,
+                        slow_statement_threshold=None, 
+                        slow_statement_log_size=100):
         self.pool = pool
         self.url = url
         self.dialect = dialect
         self.echo = echo
         self.engine = self
+        if compiled_cache_size:
+            self.compiled_cache = CompiledCache(compiled_cache_size)
+        else:
+            self.compiled_cache = None
+        if statement_stats or slow_statement_threshold is not None:
+            self.statement_stats = StatementStats(slow_statement_threshold, 
+                                                    slow_statement_log_size)
+        else:
+            self.statement_stats = None
         self.logger = log.instance_logger(self, echoflag=echo)
         if proxy:
             self.Connection = _proxy_connection_cls(Connection, proxy)
@@ -1767,17 +2053,63 @@ class ResultMetaData(object):
     """Handle cursor.description, applying additional info from an execution context."""
     
     def __init__(self, parent, metadata):
-        self._processors = processors = []
+        self._echo = parent._echo
+        context = parent.context
+        compiled = context.compiled
+
+        if compiled is not None:
+            # the processors and keys derived from cursor.description are
+            # the same each time a Compiled is executed, so are built once
+            # per Compiled, provided the description doesn't change
+            description = [m[0:2] for m in metadata]
+            cached = compiled._result_metadata
+            if cached is not None and cached[0] == description:
+                plan = cached[1]
+            else:
+                plan = self._create_plan(context, metadata)
+                compiled._result_metadata = (description, plan)
+            processors, keymap, keys, objcols = plan
+            keymap = keymap.copy()
+            keys = list(keys)
+        else:
+            processors, keymap, keys, objcols = \
+                            self._create_plan(context, metadata)
 
         # We do not strictly need to store the processor in the key mapping,
         # though it is faster in the Python version (probably because of the
         # saved attribute lookup self._processors)
-        self._keymap = keymap = {}
-        self.keys = []
-        self._echo = parent._echo
-        context = parent.context
+        self._processors = processors
+        self._keymap = keymap
+        self.keys = keys
+
+        # ColumnElements as keys.  These are taken from the current
+        # result_map, which may refer to a different statement than
+        # the one the Compiled was produced from
+        if objcols:
+            result_map = context.result_map
+            for key, rec in objcols:
+                obj = result_map[key][1]
+                if obj:
+                    for o in obj:
+                        keymap[o] = rec
+
+        if self._echo:
+            self.logger = context.engine.logger
+            self.logger.debug(
+                "Col %r", tuple(x[0] for x in metadata))
+
+    def _create_plan(self, context, metadata):
+        """Return the processors, string/integer keymap, keys, and
+        the result_map keys which locate ColumnElement keys, for the
+        given cursor.description."""
+
+        processors = []
+        keymap = {}
+        keys = []
+        objcols = []
         dialect = context.dialect
         typemap = dialect.dbapi_type_map
+        result_map = context.result_map
 
         for i, (colname, coltype) in enumerate(m[0:2] for m in metadata):
             if dialect.description_encoding:
@@ -1791,9 +2123,11 @@ class ResultMetaData(object):
             else:
                 origname = None
 
-            if context.result_map:
+            obj = None
+            if result_map:
                 try:
-                    name, obj, type_ = context.result_map[colname.lower()]
+                    key = colname.lower()
+                    name, obj, type_ = result_map[key]
                 except KeyError:
                     name, obj, type_ = \
                         colname, None, typemap.get(coltype, types.NULLTYPE)
@@ -1826,15 +2160,11 @@ class ResultMetaData(object):
             if dialect.requires_name_normalize:
                 colname = dialect.normalize_name(colname)
                 
-            self.keys.append(colname)
+            keys.append(colname)
             if obj:
-                for o in obj:
-                    keymap[o] = rec
+                objcols.append((key, rec))
 
-        if self._echo:
-            self.logger = context.engine.logger
-            self.logger.debug(
-                "Col %r", tuple(x[0] for x in metadata))
+        return processors, keymap, keys, objcols
 
     def _key_fallback(self, key):
         map = self._keymap
@@ -1923,6 +2253,9 @@ class ResultProxy(object):
         self.connection = context.root_connection
         self._echo = self.connection._echo and \
                         context.engine._should_log_debug()
+        self._stats = context.engine.statement_stats
+        if self._stats is not None:
+            self._rows_fetched = 0
         self._init_metadata()
 
     def _init_metadata(self):
@@ -2023,6 +2356,8 @@ class ResultProxy(object):
         if not self.closed:
             self.closed = True
             self.cursor.close()
+            if self._stats is not None:
+                self._stats._fetched(self.context, self._rows_fetched)
             if _autoclose_connection and \
                 self.connection.should_close_with_result:
                 self.connection.close()
@@ -2115,6 +2450,8 @@ class ResultProxy(object):
         metadata = self._metadata
         keymap = metadata._keymap
         processors = metadata._processors
+        if self._stats is not None:
+            self._rows_fetched += len(rows)
         if self._echo:
             log = self.context.engine.logger.debug
             l = []
@@ -2205,6 +2542,82 @@ class ResultProxy(object):
         else:
             return None
 
+    def fetchcolumns(self, size=1000, arrays=False):
+        """Fetch all remaining rows, returning one sequence per column.
+
+        Rows are fetched from the cursor ``size`` at a time, and their
+        values appended to each column after applying that column's 
+        result processor, without constructing a ``RowProxy`` for each 
+        row.  The result set is then closed.
+        
+        :param size: the number of rows requested from the cursor's
+          ``fetchmany()`` at a time.
+
+        :param arrays: if True, each column is returned as a NumPy array
+          if NumPy is installed.  Otherwise, columns consisting entirely
+          of integers or entirely of floats are returned as an 
+          ``array.array``, and other columns as lists.  Defaults to 
+          False, returning lists.
+
+        """
+        metadata = self._metadata
+        if metadata is None:
+            raise exc.InvalidRequestError(
+                        "This result object does not return rows.")
+        processors = metadata._processors
+        columns = [[] for p in processors]
+
+        try:
+            while True:
+                rows = self._fetch_column_rows(size)
+                if not rows:
+                    break
+                if self._stats is not None:
+                    self._rows_fetched += len(rows)
+                if self._echo:
+                    log = self.context.engine.logger.debug
+                    for row in rows:
+                        log("Row %r", row)
+                for column, processor, values in \
+                                izip(columns, processors, izip(*rows)):
+                    if processor is not None:
+                        column.extend(map(processor, values))
+                    else:
+                        column.extend(values)
+        except Exception, e:
+            self.connection._handle_dbapi_exception(e, None, None, self.cursor, self.context)
+            raise
+        self.close()
+
+        if arrays:
+            try:
+                import numpy
+            except ImportError:
+                columns = [_as_array(column) for column in columns]
+            else:
+                columns = [numpy.array(column) for column in columns]
+        return columns
+
+    def _fetch_column_rows(self, size):
+        """Return the next rows for fetchcolumns(), before processing."""
+
+        return self._fetchmany_impl(size)
+
+def _as_array(values):
+    """Return an ``array.array`` of the given values if they're all
+    integers or all floats, else the values."""
+
+    for typecode, types_ in (('l', (int, long)), ('d', (float,))):
+        for value in values:
+            if type(value) not in types_:
+                break
+        else:
+            try:
+                return array.array(typecode, values)
+            except OverflowError:
+                return values
+    return values
+
 class BufferedRowResultProxy(ResultProxy):
     """A ResultProxy with row buffering behavior.
 
@@ -2212,22 +2625,28 @@ class BufferedRowResultProxy(ResultProxy):
     before ``fetchone()`` is called.  This is to allow the results of
     ``cursor.description`` to be available immediately, when
     interfacing with a DB-API that requires rows to be consumed before
-    this information is available (currently psycopg2, when used with
-    server-side cursors).
+    this information is available, and to fetch rows in batches from
+    cursors which stream their results from the server (server side
+    cursors with psycopg2, ``SSCursor`` with mysql-python).
 
     The pre-fetching behavior fetches only one row initially, and then
-    grows its buffer size by a fixed amount with each successive need
-    for additional rows up to a size of 100.
+    grows its buffer size with each successive need for additional rows
+    up to a size of 100, or the value of the ``max_row_buffer``
+    execution option if present.
     """
 
+    max_row_buffer = 100
+
     def _init_metadata(self):
+        self._max_row_buffer = self.context.execution_options.get(
+                                    'max_row_buffer', self.max_row_buffer)
         self.__buffer_rows()
         super(BufferedRowResultProxy, self)._init_metadata()
 
     # this is a "growth chart" for the buffering of rows.
     # each successive __buffer_rows call will use the next
-    # value in the list for the buffer size until the max
-    # is reached
+    # value in the list for the buffer size; beyond the chart
+    # the size doubles until the max is reached
     size_growth = {
         1 : 5,
         5 : 10,
@@ -2238,8 +2657,9 @@ class BufferedRowResultProxy(ResultProxy):
 
     def __buffer_rows(self):
         size = getattr(self, '_bufsize', 1)
-        self.__rowbuffer = self.cursor.fetchmany(size)
-        self._bufsize = self.size_growth.get(size, size)
+        self.__rowbuffer = deque(self.cursor.fetchmany(size))
+        self._bufsize = min(self._max_row_buffer, 
+                                self.size_growth.get(size, size * 2))
 
     def _fetchone_impl(self):
         if self.closed:
@@ -2248,7 +2668,7 @@ class BufferedRowResultProxy(ResultProxy):
             self.__buffer_rows()
             if len(self.__rowbuffer) == 0:
                 return None
-        return self.__rowbuffer.pop(0)
+        return self.__rowbuffer.popleft()
 
     def _fetchmany_impl(self, size=None):
         result = []
@@ -2260,8 +2680,8 @@ class BufferedRowResultProxy(ResultProxy):
         return result
 
     def _fetchall_impl(self):
-        ret = self.__rowbuffer + list(self.cursor.fetchall())
-        self.__rowbuffer[:] = []
+        ret = list(self.__rowbuffer) + list(self.cursor.fetchall())
+        self.__rowbuffer.clear()
         return ret
 
 class FullyBufferedResultProxy(ResultProxy):
@@ -2364,6 +2784,22 @@ class BufferedColumnResultProxy(ResultProxy):
             l.append(row)
         return l
 
+    def _fetch_column_rows(self, size):
+        # process each row before requesting the next one, as in 
+        # fetchmany(); the processors of the metadata itself are None
+        processors = self._metadata._orig_processors
+        rows = []
+        for i in xrange(size):
+            row = self._fetchone_impl()
+            if row is None:
+                break
+            row = list(row)
+            for index, processor in enumerate(processors):
+                if processor is not None:
+                    row[index] = processor(row[index])
+            rows.append(row)
+        return rows
+
 def connection_memoize(key):
     """Decorator, memoize a function in a connection.info stash.
 
@@ -20,6 +20,40 @@ from sqlalchemy import exc, types as sqltypes, util
 AUTOCOMMIT_REGEXP = re.compile(r'\s*(?:UPDATE|INSERT|CREATE|DELETE|DROP|ALTER)',
                                re.I | re.UNICODE)
 
+# When we're handed literal SQL, ensure it's a SELECT-query before
+# streaming it through a server side cursor.
+SERVER_SIDE_CURSOR_RE = re.compile(
+    r'\s*SELECT',
+    re.I | re.UNICODE)
+
+# Conversion of compiled parameter dictionaries into the form sent to the
+# DB-API, for each parameter set of an execute() or executemany().
+try:
+    from sqlalchemy.cparams import positional_params, named_params
+except ImportError:
+    def positional_params(compiled_parameters, positiontup, layout, 
+                                                    sequence_format):
+        parameters = []
+        for compiled_params in compiled_parameters:
+            param = [compiled_params[key] for key in positiontup]
+            for i, processor in layout:
+                param[i] = processor(param[i])
+            parameters.append(sequence_format(param))
+        return parameters
+
+    def named_params(compiled_parameters, layout, encoding):
+        parameters = []
+        for compiled_params in compiled_parameters:
+            param = dict(compiled_params)
+            for key, processor in layout:
+                if key in param:
+                    param[key] = processor(param[key])
+            if encoding is not None:
+                param = dict((key.encode(encoding), value) 
+                                for key, value in param.iteritems())
+            parameters.append(param)
+        return parameters
+
 
 class DefaultDialect(base.Dialect):
     """Default implementation of Dialect"""
@@ -63,6 +97,13 @@ class DefaultDialect(base.Dialect):
     supports_sane_multi_rowcount = True
     dbapi_type_map = {}
     default_paramstyle = 'named'
+    
+    # dialects which can stream results set this
+    # and implement create_server_side_cursor() 
+    # on their execution context.
+    supports_server_side_cursors = False
+    server_side_cursors = False
+    
     supports_default_values = False
     supports_empty_insert = True
     
@@ -230,6 +271,23 @@ class DefaultDialect(base.Dialect):
     def is_disconnect(self, e):
         return False
 
+    @util.memoized_property
+    def _ping_statement(self):
+        return str(expression.select([expression.literal_column("1")]).\
+                            compile(dialect=self))
+
+    def do_ping(self, dbapi_connection):
+        cursor = dbapi_connection.cursor()
+        try:
+            try:
+                cursor.execute(self._ping_statement)
+            except Exception, e:
+                if self.is_disconnect(e):
+                    raise exc.DisconnectionError(str(e))
+                raise
+        finally:
+            cursor.close()
+
 
 class DefaultExecutionContext(base.ExecutionContext):
     execution_options = util.frozendict()
@@ -240,6 +298,8 @@ class DefaultExecutionContext(base.ExecutionContext):
     result_map = None
     compiled = None
     statement = None
+    _slow_statement = None
+    _is_server_side = False
     
     def __init__(self, 
                     dialect, 
@@ -289,12 +349,10 @@ class DefaultExecutionContext(base.ExecutionContext):
             # compiled clauseelement.  process bind params, process table defaults,
             # track collections used by ResultProxy to target and process results
 
-            self.processors = dict(
-                (key, value) for key, value in
-                ( (compiled.bind_names[bindparam],
-                   bindparam.bind_processor(self.dialect))
-                  for bindparam in compiled.bind_names )
-                if value is not None)
+            plan = compiled._parameter_plan
+            if plan is None or plan[0] is not dialect:
+                plan = compiled._parameter_plan = self._create_parameter_plan()
+            self.processors = plan[1]
 
             self.result_map = compiled.result_map
 
@@ -414,48 +472,95 @@ class DefaultExecutionContext(base.ExecutionContext):
             return [self.dialect.execute_sequence_format(p) for p in params]
         
 
+    def _create_parameter_plan(self):
+        """Return the bind processors for the current ``Compiled``, along 
+        with the layout used to convert its parameters.
+
+        The result is stored on the ``Compiled`` so that it's produced 
+        once, rather than upon each execution.  For a positional paramstyle
+        the layout is a list of (position, processor) for each position
+        having a processor; otherwise it's a list of (key, processor).
+
+        """
+        compiled = self.compiled
+        dialect = self.dialect
+        processors = {}
+        for bindparam, name in compiled.bind_names.iteritems():
+            processor = bindparam.bind_processor(dialect)
+            if processor is not None:
+                processors[name] = processor
+
+        if dialect.positional:
+            layout = [(i, processors[key]) 
+                        for i, key in enumerate(compiled.positiontup)
+                        if key in processors]
+        else:
+            layout = processors.items()
+        return dialect, processors, layout
+
     def __convert_compiled_params(self, compiled_parameters):
         """Convert the dictionary of bind parameter values into a dict or list
         to be sent to the DBAPI's execute() or executemany() method.
         """
 
-        processors = self.processors
-        parameters = []
+        layout = self.compiled._parameter_plan[2]
         if self.dialect.positional:
-            for compiled_params in compiled_parameters:
-                param = []
-                for key in self.compiled.positiontup:
-                    if key in processors:
-                        param.append(processors[key](compiled_params[key]))
-                    else:
-                        param.append(compiled_params[key])
-                parameters.append(self.dialect.execute_sequence_format(param))
+            parameters = positional_params(compiled_parameters, 
+                                        self.compiled.positiontup, layout,
+                                        self.dialect.execute_sequence_format)
         else:
-            encode = not self.dialect.supports_unicode_statements
-            for compiled_params in compiled_parameters:
-                param = {}
-                if encode:
-                    encoding = self.dialect.encoding
-                    for key in compiled_params:
-                        if key in processors:
-                            param[key.encode(encoding)] = processors[key](compiled_params[key])
-                        else:
-                            param[key.encode(encoding)] = compiled_params[key]
-                else:
-                    for key in compiled_params:
-                        if key in processors:
-                            param[key] = processors[key](compiled_params[key])
-                        else:
-                            param[key] = compiled_params[key]
-                parameters.append(param)
+            if self.dialect.supports_unicode_statements:
+                encoding = None
+            else:
+                encoding = self.dialect.encoding
+            parameters = named_params(compiled_parameters, layout, encoding)
         return self.dialect.execute_sequence_format(parameters)
 
     def should_autocommit_text(self, statement):
         return AUTOCOMMIT_REGEXP.match(statement)
 
     def create_cursor(self):
+        if self.dialect.supports_server_side_cursors and \
+                self._use_server_side_cursor():
+            self._is_server_side = True
+            return self.create_server_side_cursor()
+        else:
+            self._is_server_side = False
+            return self.create_default_cursor()
+    
+    def _use_server_side_cursor(self):
+        # TODO: coverage for server side cursors + select.for_update()
+        
+        use_server_side = self.execution_options.get('stream_results')
+        if use_server_side is None:
+            use_server_side = self.dialect.server_side_cursors
+        
+        # only statements which return rows are streamed
+        return use_server_side and (
+                (self.compiled and 
+                    isinstance(self.compiled.statement, expression.Selectable)) 
+                or
+                (
+                    (not self.compiled or 
+                    isinstance(self.compiled.statement, expression._TextClause)) 
+                    and self.statement and 
+                    SERVER_SIDE_CURSOR_RE.match(self.statement)
+                )
+            )
+    
+    def create_default_cursor(self):
         return self._connection.connection.cursor()
 
+    def create_server_side_cursor(self):
+        """Return a cursor which fetches rows from the database as they
+        are requested, rather than buffering the full result.
+        
+        The default returns a plain cursor, which is appropriate for 
+        DBAPIs whose cursors already stream, such as cx_oracle and pyodbc.
+        
+        """
+        return self.create_default_cursor()
+
     def pre_exec(self):
         pass
 
@@ -495,7 +600,10 @@ class DefaultExecutionContext(base.ExecutionContext):
         pass
 
     def get_result_proxy(self):
-        return base.ResultProxy(self)
+        if self._is_server_side:
+            return base.BufferedRowResultProxy(self)
+        else:
+            return base.ResultProxy(self)
     
     @property
     def rowcount(self):
@@ -631,6 +739,9 @@ class DefaultExecutionContext(base.ExecutionContext):
                             param[c.key] = val
                 del self.current_parameters
 
+            self.postfetch_cols = self.compiled.postfetch
+            self.prefetch_cols = self.compiled.prefetch
+
         else:
             self.current_parameters = compiled_parameters = self.compiled_parameters[0]
 
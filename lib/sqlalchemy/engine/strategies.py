@@ -93,12 +93,21 @@ class DefaultEngineStrategy(EngineStrategy):
             translate = {'echo': 'echo_pool',
                          'timeout': 'pool_timeout',
                          'recycle': 'pool_recycle',
-                         'use_threadlocal':'pool_threadlocal'}
+                         'use_threadlocal':'pool_threadlocal',
+                         'pre_ping':'pool_pre_ping',
+                         'pre_ping_interval':'pool_pre_ping_interval',
+                         'use_lifo':'pool_use_lifo',
+                         'maintenance_interval':'pool_maintenance_interval',
+                         'idle_timeout':'pool_idle_timeout',
+                         'record_timing':'pool_record_timing',
+                         'leak_threshold':'pool_leak_threshold'}
             for k in util.get_cls_kwargs(poolclass):
                 tk = translate.get(k, k)
                 if tk in kwargs:
                     pool_args[k] = kwargs.pop(tk)
             pool_args.setdefault('use_threadlocal', self.pool_threadlocal)
+            if pool_args.get('pre_ping') is True:
+                pool_args['pre_ping'] = dialect.do_ping
             pool = poolclass(creator, **pool_args)
         else:
             if isinstance(pool, poollib._DBProxy):
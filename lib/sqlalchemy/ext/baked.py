@@ -0,0 +1,236 @@
+"""Baked queries, which cache the construction of an ORM ``Query``.
+
+Building a :class:`~sqlalchemy.orm.query.Query` involves a series of
+generative steps, the assembly of its ``select()`` construct by
+``_compile_context()``, and then the compilation of that construct into
+a string.  For a query which is run many times with only differing
+parameters, this work is the same each time.  A "baked" query captures
+the functions which construct the ``Query``, and performs them only once,
+keyed on the code of those functions.  The resulting statement, and its
+``Compiled`` form for each dialect, are reused for subsequent calls, which
+only bind new parameter values::
+
+    from sqlalchemy import bindparam
+    from sqlalchemy.ext.baked import Bakery
+
+    bakery = Bakery()
+
+    def lookup(session, name):
+        bq = bakery(lambda session: session.query(User))
+        bq += lambda q: q.filter(User.name == bindparam('name'))
+        return bq(session).params(name=name).one()
+
+Each function receives the ``Query`` built so far and returns a new one.
+The first function receives the ``Session``.  Since a function is run only
+for the first call at a given point in the code, the values which vary
+between calls must be established using :func:`~sqlalchemy.sql.expression.bindparam`
+and passed to ``params()``; a literal value, such as a variable captured
+by the function, is baked into the statement the first time through.
+Similarly, functions whose outcome depends on conditions besides their
+own code should be given distinct code, i.e. added in separate branches::
+
+    bq = bakery(lambda session: session.query(User))
+    if name is not None:
+        bq += lambda q: q.filter(User.name == bindparam('name'))
+
+The ``BakedQuery`` may also be created once, for example at the module
+level, and called many times.
+
+"""
+
+import copy
+
+from sqlalchemy import exc as sa_exc, util
+from sqlalchemy.orm import exc as orm_exc
+
+__all__ = ['Bakery', 'BakedQuery']
+
+
+class Bakery(object):
+    """A cache of baked queries.
+
+    Calling a :class:`Bakery` with a function that produces a ``Query``
+    given a ``Session`` returns a new :class:`BakedQuery`.
+
+    """
+
+    def __init__(self, size=200):
+        self._cache = util.LRUCache(size)
+
+    def __call__(self, initial_fn):
+        return BakedQuery(self, initial_fn)
+
+    def clear(self):
+        """Remove all baked queries from this :class:`Bakery`."""
+
+        self._cache.clear()
+
+    def __len__(self):
+        return len(self._cache)
+
+
+class BakedQuery(object):
+    """A series of ``Query`` construction steps whose outcome is cached."""
+
+    def __init__(self, bakery, initial_fn):
+        self.bakery = bakery
+        self.steps = [initial_fn]
+        self._cache_key = (initial_fn.func_code,)
+
+    def add_criteria(self, fn):
+        """Add a construction step to this :class:`BakedQuery`.
+
+        ``fn`` receives a ``Query`` and returns a new ``Query``.  This
+        method modifies the :class:`BakedQuery` in place, and is also
+        available as the ``+=`` operator.
+
+        """
+        self.steps.append(fn)
+        self._cache_key += (fn.func_code,)
+        return self
+
+    __iadd__ = add_criteria
+
+    def with_criteria(self, fn):
+        """Return a copy of this :class:`BakedQuery` with an additional step."""
+
+        bq = self._clone()
+        return bq.add_criteria(fn)
+
+    __add__ = with_criteria
+
+    def _clone(self):
+        bq = self.__class__.__new__(self.__class__)
+        bq.__dict__ = self.__dict__.copy()
+        bq.steps = list(self.steps)
+        return bq
+
+    def __call__(self, session):
+        """Return a :class:`Result` for this :class:`BakedQuery` against
+        the given ``Session``."""
+
+        return Result(self, session)
+
+    def _bake(self, session):
+        query = self.steps[0](session)
+        for step in self.steps[1:]:
+            query = step(query)
+
+        context = query._compile_context()
+        context.statement.use_labels = True
+
+        # the Session, as well as any parameters, are established
+        # for each call.
+        query = query._clone()
+        query.session = context.session = None
+        query._params = util.frozendict()
+        context.query = query
+
+        entry = _BakedEntry(query, context)
+        self.bakery._cache[self._cache_key] = entry
+        return entry
+
+
+class _BakedEntry(object):
+    """The Query, QueryContext and Compiled objects for a BakedQuery."""
+
+    def __init__(self, query, context):
+        self.query = query
+        self.context = context
+        self.compiled = {}
+
+    def compiled_for(self, dialect):
+        try:
+            return self.compiled[dialect]
+        except KeyError:
+            compiled = self.compiled[dialect] = \
+                                self.context.statement.compile(dialect=dialect)
+            return compiled
+
+
+class Result(object):
+    """Invokes a :class:`BakedQuery` against a ``Session``.
+
+    The methods here mirror those of ``Query`` which return results.
+
+    """
+
+    def __init__(self, bq, session):
+        self.bq = bq
+        self.session = session
+        self._params = {}
+
+    def params(self, *args, **kw):
+        """Specify parameters to be used with this result.
+
+        Accepts \**kwargs, or optionally a single dictionary, in the
+        same way as ``Query.params()``.
+
+        """
+        if len(args) == 1:
+            kw.update(args[0])
+        elif len(args) > 0:
+            raise sa_exc.ArgumentError(
+                    "params() takes zero or one positional argument, "
+                    "which is a dictionary.")
+        self._params.update(kw)
+        return self
+
+    def __iter__(self):
+        bq = self.bq
+        entry = bq.bakery._cache.get(bq._cache_key)
+        if entry is None:
+            entry = bq._bake(self.session)
+
+        query = entry.query._clone()
+        query.session = self.session
+        query._params = self._params
+
+        context = copy.copy(entry.context)
+        context.query = query
+        context.session = self.session
+        context.attributes = context.attributes.copy()
+
+        if query._autoflush and not query._populate_existing:
+            self.session._autoflush()
+
+        engine = self.session.get_bind(query._mapper_zero_or_none(),
+                                            clause=context.statement)
+        result = self.session._connection_for_bind(
+                                            engine, close_with_result=True).\
+                                execute(entry.compiled_for(engine.dialect),
+                                            self._params)
+        return query.instances(result, context)
+
+    def all(self):
+        """Return the results represented by this :class:`Result` as a list."""
+
+        return list(self)
+
+    def first(self):
+        """Return the first row, or None if the result contains no rows.
+
+        The LIMIT is applied as an additional baked step.
+
+        """
+        bq = self.bq.with_criteria(lambda q: q.slice(0, 1))
+        ret = list(Result(bq, self.session).params(self._params))
+        if len(ret) > 0:
+            return ret[0]
+        else:
+            return None
+
+    def one(self):
+        """Return exactly one result or raise an exception."""
+
+        ret = list(self)
+
+        l = len(ret)
+        if l == 1:
+            return ret[0]
+        elif l == 0:
+            raise orm_exc.NoResultFound("No row was found for one()")
+        else:
+            raise orm_exc.MultipleResultsFound(
+                "Multiple rows were found for one()")
+
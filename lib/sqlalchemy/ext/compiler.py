@@ -163,6 +163,8 @@ A big part of using the compiler extension is subclassing SQLAlchemy expression
   
 """
 
+from sqlalchemy.sql.expression import ClauseElement
+
 def compiles(class_, *specs):
     def decorate(fn):
         existing = getattr(class_, '_compiler_dispatcher', None)
@@ -172,6 +174,13 @@ def compiles(class_, *specs):
             # TODO: why is the lambda needed ?
             setattr(class_, '_compiler_dispatch', lambda *arg, **kw: existing(*arg, **kw))
             setattr(class_, '_compiler_dispatcher', existing)
+            
+            # a custom compilation may depend on any attribute 
+            # of the element, so its structure can't be keyed 
+            # within the compiled statement cache.
+            if issubclass(class_, ClauseElement):
+                setattr(class_, '_gen_cache_key', 
+                            ClauseElement.__dict__['_gen_cache_key'])
         
         if specs:
             for s in specs:
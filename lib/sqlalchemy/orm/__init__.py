@@ -94,7 +94,11 @@ __all__ = (
     'reconstructor',
     'relation',
     'scoped_session',
+    'selectinload',
+    'selectinload_all',
     'sessionmaker',
+    'subqueryload',
+    'subqueryload_all',
     'synonym',
     'undefer',
     'undefer_group',
@@ -287,7 +291,7 @@ def relation(argument, secondary=None, **kwargs):
       eager loads will automatically stop chaining joins when they
       encounter a mapper which is already higher up in the chain.
 
-    :param lazy=(True|False|None|'dynamic'):
+    :param lazy=(True|False|None|'dynamic'|'selectin'|'subquery'):
       specifies how the related items should be loaded. Values include:
 
       True - items should be loaded lazily when the property is first
@@ -307,6 +311,22 @@ def relation(argument, secondary=None, **kwargs):
                   dynamic property will not be visible until the data
                   is flushed to the database.
 
+      'selectin' - items should be loaded for all parent objects of
+                   a result once the parents are loaded, using a
+                   second SELECT per batch of parents which locates
+                   the related rows using IN.  See also
+                   ``selectin_batch_size``.
+
+      'subquery' - items should be loaded for all parent objects of
+                   a result once the parents are loaded, using a
+                   second SELECT which joins the related table to 
+                   the original query, embedded as a subquery.  Only
+                   relations of the entities the query selects are
+                   loaded this way; those loaded further along a
+                   path, such as the ``items`` of each ``Order`` in
+                   ``subqueryload_all('orders.items')``, locate their
+                   rows using IN, as with 'selectin'.
+
     :param order_by:
       indicates the ordering that should be applied when loading these
       items.
@@ -399,6 +419,14 @@ def relation(argument, secondary=None, **kwargs):
       computed based on the foreign key relationships of the association and
       child tables.
 
+    :param selectin_batch_size=500:
+      the maximum number of distinct parent key values rendered into
+      the IN clause of a single SELECT when ``lazy='selectin'``
+      or the :func:`selectinload` option is used.  Also applies
+      to ``lazy='subquery'`` when the original query can't be
+      embedded as a subquery, and to subquery loads of relations
+      below the first level of a path.
+
     :param single_parent=(True|False):
       when True, installs a validator which will prevent objects
       from being associated with more than one parent at a time.
@@ -887,6 +915,7 @@ def clear_mappers():
                 mapper.dispose()
             except KeyError:
                 pass
+        mapperlib._dependency_sort_cache.clear()
     finally:
         mapperlib._COMPILE_MUTEX.release()
 
@@ -974,6 +1003,98 @@ def lazyload(*keys):
     """
     return strategies.EagerLazyOption(keys, lazy=True)
 
+@sa_util.accepts_a_list_as_starargs(list_deprecation='deprecated')
+def selectinload(*keys):
+    """Return a ``MapperOption`` that will convert the property of the given
+    name into a "select IN" load.
+
+    Once the parent objects of a result are loaded, the related items for
+    all of them are loaded using one additional SELECT per batch of parents,
+    which locates the related rows using IN against the parents' key
+    values.  This avoids both the per-parent SELECT of a lazy load and the
+    repetition of parent rows produced by the JOIN of an eager load.
+
+    Used with ``query.options()``.
+
+    examples::
+    
+        # load the "orders" collection on all "User" objects
+        # using a second SELECT
+        query(User).options(selectinload(User.orders))
+
+        # to load across several levels, use selectinload_all();
+        # one additional SELECT is emitted per level.
+        query(User).options(selectinload_all(User.orders, Order.items))
+
+    """
+    return strategies.EagerLazyOption(keys, lazy='selectin')
+
+@sa_util.accepts_a_list_as_starargs(list_deprecation='deprecated')
+def selectinload_all(*keys):
+    """Return a ``MapperOption`` that will convert all properties along the
+    given dot-separated path into a "select IN" load.
+
+    Used with ``query.options()``.
+
+    For example::
+
+        query.options(selectinload_all('orders.items.keywords'))...
+
+    will set all of 'orders', 'orders.items', and 'orders.items.keywords' to
+    load using one additional SELECT each.
+
+    """
+    return strategies.EagerLazyOption(keys, lazy='selectin', chained=True)
+
+@sa_util.accepts_a_list_as_starargs(list_deprecation='deprecated')
+def subqueryload(*keys):
+    """Return a ``MapperOption`` that will convert the property of the given
+    name into a subquery eager load.
+
+    Once the parent objects of a result are loaded, the related items for
+    all of them are loaded using one additional SELECT, which joins the
+    related table to the original query embedded as a subquery.  Unlike
+    ``eagerload()``, the columns of each parent row are not repeated for
+    each related row.
+
+    Used with ``query.options()``.
+
+    examples::
+    
+        # load the "orders" collection on all "User" objects
+        # using a second SELECT
+        query(User).options(subqueryload(User.orders))
+
+        # to load across several levels, use subqueryload_all();
+        # one additional SELECT is emitted per level.
+        query(User).options(subqueryload_all(User.orders, Order.items))
+
+    Only the first level of a path embeds the original query.  Relations
+    further along, such as ``Order.items`` above, are loaded using IN
+    against the parent key values, in the same way as
+    :func:`selectinload`, with one SELECT per ``selectin_batch_size``
+    parents.
+
+    """
+    return strategies.EagerLazyOption(keys, lazy='subquery')
+
+@sa_util.accepts_a_list_as_starargs(list_deprecation='deprecated')
+def subqueryload_all(*keys):
+    """Return a ``MapperOption`` that will convert all properties along the
+    given dot-separated path into a subquery eager load.
+
+    Used with ``query.options()``.
+
+    For example::
+
+        query.options(subqueryload_all('orders.items.keywords'))...
+
+    will set all of 'orders', 'orders.items', and 'orders.items.keywords' to
+    load using one additional SELECT each.
+
+    """
+    return strategies.EagerLazyOption(keys, lazy='subquery', chained=True)
+
 def noload(*keys):
     """Return a ``MapperOption`` that will convert the property of the
     given name into a non-load.
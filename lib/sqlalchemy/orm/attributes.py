@@ -318,7 +318,7 @@ class AttributeImpl(object):
         attribute represented by this ``InstrumentedAttribute``.
 
         """
-        state.parents[id(self.parent_token)] = value
+        state._parents_for_write()[id(self.parent_token)] = value
 
     def set_callable(self, state, callable_):
         """Set a callable function for this attribute on the given object.
@@ -335,7 +335,7 @@ class AttributeImpl(object):
         ``InstrumentedAttribute`` constructor.
 
         """
-        state.callables[self.key] = callable_
+        state._callables_for_write()[self.key] = callable_
 
     def get_history(self, state, dict_, passive=PASSIVE_OFF):
         raise NotImplementedError()
@@ -412,7 +412,8 @@ class AttributeImpl(object):
 
         state.commit(dict_, [self.key])
 
-        state.callables.pop(self.key, None)
+        if self.key in state.callables:
+            del state.callables[self.key]
         state.dict[self.key] = value
 
         return value
@@ -531,6 +532,207 @@ class MutableScalarAttributeImpl(ScalarAttributeImpl):
         state.mutable_dict[self.key] = value
 
 
+class TrackedScalarAttributeImpl(ScalarAttributeImpl):
+    """represents a scalar value-holding InstrumentedAttribute, whose
+    ``dict`` and ``list`` values are replaced with :class:`MutableDict` 
+    and :class:`MutableList` wrappers which report in-place changes.
+    
+    Unlike :class:`MutableScalarAttributeImpl`, loaded values are not 
+    copied and compared at flush time; a copy of the previous value is 
+    made only once a change occurs.
+    
+    """
+
+    uses_objects = False
+
+    def __init__(self, class_, key, callable_, 
+                    copy_function=None, **kwargs):
+        super(TrackedScalarAttributeImpl, self).__init__(
+                                            class_, 
+                                            key, 
+                                            callable_, 
+                                            **kwargs)
+        if copy_function is None:
+            raise sa_exc.ArgumentError(
+                        "TrackedScalarAttributeImpl requires a copy function")
+        self.copy = copy_function
+
+    def get(self, state, dict_, passive=PASSIVE_OFF):
+        value = ScalarAttributeImpl.get(self, state, dict_, passive=passive)
+        if value.__class__ in _mutable_wrappers:
+            value = dict_[self.key] = self._adopt(state, value)
+        return value
+
+    def set(self, state, dict_, value, initiator, passive=PASSIVE_OFF):
+        if initiator is self:
+            return
+
+        old = dict_.get(self.key, NO_VALUE)
+        if self.extensions:
+            value = self.fire_replace_event(state, dict_, value, old, initiator)
+        state.modified_event(dict_, self, True, old)
+        if isinstance(old, _MutableWrapper) and old._sa_parent is not None and \
+                old._sa_parent[0] is state:
+            old._sa_parent = None
+        dict_[self.key] = self._adopt(state, value)
+
+    def _adopt(self, state, value):
+        """Return value as a wrapper which reports changes to state."""
+        
+        if isinstance(value, _MutableWrapper):
+            if value._sa_parent is not None and value._sa_parent[0] is not state:
+                # wrappers report to one parent only
+                value = value.__class__(value)
+        elif value.__class__ in _mutable_wrappers:
+            value = _mutable_wrappers[value.__class__](value)
+        else:
+            return value
+        value._sa_parent = (state, self)
+        return value
+
+    def changing(self, state, value):
+        """Called by a wrapper before its contents are changed."""
+        
+        dict_ = state.dict
+        if dict_.get(self.key) is not value:
+            # replaced or expired since
+            value._sa_parent = None
+        else:
+            state.modified_event(dict_, self, True, value)
+
+class _MutableWrapper(object):
+    """Base for values which report in-place changes to the
+    attribute which holds them."""
+    
+    __slots__ = ()
+    
+    def _changing(self):
+        parent = self._sa_parent
+        if parent is not None:
+            state, impl = parent
+            impl.changing(state, self)
+
+class MutableDict(_MutableWrapper, dict):
+    """A ``dict`` which reports changes to its owning instance.
+    
+    Only changes to the dictionary itself are detected, not changes
+    within the values it contains.
+    
+    """
+    
+    __slots__ = ('_sa_parent',)
+    
+    def __init__(self, *args, **kw):
+        dict.__init__(self, *args, **kw)
+        self._sa_parent = None
+        
+    def __setitem__(self, key, value):
+        self._changing()
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key):
+        self._changing()
+        dict.__delitem__(self, key)
+
+    def clear(self):
+        self._changing()
+        dict.clear(self)
+
+    def pop(self, *args):
+        self._changing()
+        return dict.pop(self, *args)
+
+    def popitem(self):
+        self._changing()
+        return dict.popitem(self)
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self._changing()
+        return dict.setdefault(self, key, default)
+
+    def update(self, *args, **kw):
+        self._changing()
+        dict.update(self, *args, **kw)
+
+    def __reduce_ex__(self, proto):
+        # pickles as a plain dict
+        return (dict, (dict(self),))
+
+class MutableList(_MutableWrapper, list):
+    """A ``list`` which reports changes to its owning instance.
+
+    Only changes to the list itself are detected, not changes
+    within the values it contains.
+
+    """
+    
+    __slots__ = ('_sa_parent',)
+
+    def __init__(self, *args):
+        list.__init__(self, *args)
+        self._sa_parent = None
+
+    def __setitem__(self, index, value):
+        self._changing()
+        list.__setitem__(self, index, value)
+
+    def __delitem__(self, index):
+        self._changing()
+        list.__delitem__(self, index)
+
+    # Py2K
+    def __setslice__(self, start, end, values):
+        self._changing()
+        list.__setslice__(self, start, end, values)
+
+    def __delslice__(self, start, end):
+        self._changing()
+        list.__delslice__(self, start, end)
+    # end Py2K
+    
+    def __iadd__(self, other):
+        self._changing()
+        return list.__iadd__(self, other)
+
+    def __imul__(self, n):
+        self._changing()
+        return list.__imul__(self, n)
+
+    def append(self, value):
+        self._changing()
+        list.append(self, value)
+
+    def extend(self, values):
+        self._changing()
+        list.extend(self, values)
+
+    def insert(self, index, value):
+        self._changing()
+        list.insert(self, index, value)
+
+    def pop(self, *args):
+        self._changing()
+        return list.pop(self, *args)
+
+    def remove(self, value):
+        self._changing()
+        list.remove(self, value)
+
+    def reverse(self):
+        self._changing()
+        list.reverse(self)
+
+    def sort(self, *args, **kw):
+        self._changing()
+        list.sort(self, *args, **kw)
+
+    def __reduce_ex__(self, proto):
+        # pickles as a plain list
+        return (list, (list(self),))
+
+_mutable_wrappers = {dict:MutableDict, list:MutableList}
+
 class ScalarObjectAttributeImpl(ScalarAttributeImpl):
     """represents a scalar-holding InstrumentedAttribute, 
        where the target object is also instrumented.
@@ -787,7 +989,8 @@ class CollectionAttributeImpl(AttributeImpl):
             for item in value:
                 collection.append_without_event(item)
 
-        state.callables.pop(self.key, None)
+        if self.key in state.callables:
+            del state.callables[self.key]
         state.dict[self.key] = user_data
 
         state.commit(dict_, [self.key])
@@ -1376,7 +1579,7 @@ def register_attribute(class_, key, **kw):
 def register_attribute_impl(class_, key,         
         uselist=False, callable_=None, 
         useobject=False, mutable_scalars=False, 
-        impl_class=None, **kw):
+        track_mutations=False, impl_class=None, **kw):
     
     manager = manager_of_class(class_)
     if uselist:
@@ -1393,6 +1596,8 @@ def register_attribute_impl(class_, key,
                                        typecallable=typecallable, **kw)
     elif useobject:
         impl = ScalarObjectAttributeImpl(class_, key, callable_, **kw)
+    elif track_mutations:
+        impl = TrackedScalarAttributeImpl(class_, key, callable_, **kw)
     elif mutable_scalars:
         impl = MutableScalarAttributeImpl(class_, key, callable_,
                                           class_manager=manager, **kw)
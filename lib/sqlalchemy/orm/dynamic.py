@@ -92,7 +92,8 @@ class DynamicAttributeImpl(attributes.AttributeImpl):
     def _modified_event(self, state, dict_):
 
         if self.key not in state.committed_state:
-            state.committed_state[self.key] = CollectionHistory(self, state)
+            state._committed_state_for_write()[self.key] = \
+                                    CollectionHistory(self, state)
 
         state.modified_event(dict_, 
                                 self, 
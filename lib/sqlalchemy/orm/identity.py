@@ -8,6 +8,7 @@ import weakref
 
 from sqlalchemy import util as base_util
 from sqlalchemy.orm import attributes
+from sqlalchemy.orm.state import _dead_ref
 
 
 class IdentityMap(dict):
@@ -40,7 +41,7 @@ class IdentityMap(dict):
             self._mutable_attrs.add(state)
     
     def _manage_removed_state(self, state):
-        del state._instance_dict
+        state._instance_dict = _dead_ref
         self._mutable_attrs.discard(state)
         self._modified.discard(state)
 
@@ -193,6 +194,60 @@ class WeakInstanceDict(IdentityMap):
     def prune(self):
         return 0
         
+class LRUInstanceDict(WeakInstanceDict):
+    """A weak-referencing identity map which also holds strong
+    references to the most recently used instances.
+
+    Approximately ``capacity`` instances which were most recently added
+    or retrieved are kept resident even when not referenced elsewhere.
+    Older instances fall back to being weakly referenced, as with
+    ``WeakInstanceDict``; those with pending changes remain strongly
+    referenced by their state until flushed, and pending or deleted
+    instances are referenced by the ``Session`` itself, so only clean
+    persistent instances are ever released.
+
+    The strong references are held in a ``util.LRUCache``, which
+    trims itself back to ``capacity`` once it grows past
+    ``capacity * 1.5`` entries, so that between ``capacity`` and
+    one and a half times ``capacity`` instances may be resident.
+
+    """
+
+    def __init__(self, capacity=1000):
+        WeakInstanceDict.__init__(self)
+        self._strong_refs = base_util.LRUCache(capacity)
+
+    def __getitem__(self, key):
+        o = WeakInstanceDict.__getitem__(self, key)
+        self._touch(key, o)
+        return o
+
+    def get(self, key, default=None):
+        o = WeakInstanceDict.get(self, key, default)
+        if o is not default:
+            self._touch(key, o)
+        return o
+
+    def _touch(self, key, o):
+        if self._strong_refs.get(key) is None:
+            self._strong_refs[key] = o
+
+    def _manage_incoming_state(self, state):
+        WeakInstanceDict._manage_incoming_state(self, state)
+        self._strong_refs[state.key] = state.obj()
+
+    def _manage_removed_state(self, state):
+        WeakInstanceDict._manage_removed_state(self, state)
+        dict.pop(self._strong_refs, state.key, None)
+
+    def prune(self):
+        """release strong references to all instances, removing those
+        which are unreferenced and non-dirty."""
+
+        ref_count = len(self)
+        self._strong_refs.clear()
+        return ref_count - len(self)
+
 class StrongInstanceDict(IdentityMap):
     def all_states(self):
         return [attributes.instance_state(o) for o in self.itervalues()]
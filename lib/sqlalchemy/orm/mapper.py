@@ -17,7 +17,7 @@ available in :class:`~sqlalchemy.orm.`.
 import types
 import weakref
 import operator
-from itertools import chain
+from itertools import chain, groupby
 deque = __import__('collections').deque
 
 from sqlalchemy import sql, util, log, exc as sa_exc
@@ -54,6 +54,11 @@ NO_ATTRIBUTE = util.symbol('NO_ATTRIBUTE')
 # lock used to synchronize the "mapper compile" step
 _COMPILE_MUTEX = util.threading.RLock()
 
+# topological orderings of base mappers computed by UOWTransaction,
+# keyed on the mapper dependencies and the mappers taking part in a
+# flush.  cleared whenever mappers are compiled or altered.
+_dependency_sort_cache = util.LRUCache(100)
+
 # initialize these lazily
 ColumnProperty = None
 SynonymProperty = None
@@ -662,6 +667,8 @@ class Mapper(object):
         if init:
             prop.init()
             prop.post_instrument_class(self)
+            if self.compiled:
+                _reset_compiled_caches()
 
 
     def compile(self):
@@ -703,6 +710,7 @@ class Mapper(object):
                         if not mapper.compiled:
                             mapper._post_configure_properties()
 
+                    _reset_compiled_caches()
                     _new_mappers = False
                     return self
                 finally:
@@ -945,6 +953,18 @@ class Mapper(object):
         params = [(primary_key, sql.bindparam(None, type_=primary_key.type)) for primary_key in self.primary_key]
         return sql.and_(*[k==v for (k, v) in params]), util.column_dict(params)
 
+    @util.memoized_property
+    def _get_statement_cache(self):
+        """A dictionary of QueryContext and Compiled objects used by
+        query.get() and many-to-one lazyloads to load this item by
+        primary key, without constructing a new statement.
+
+        Reset whenever mappers are compiled or properties are added,
+        as either may change the statement.
+
+        """
+        return {}
+
     @util.memoized_property
     def _equivalent_columns(self):
         """Create a map of all *equivalent* columns, based on
@@ -1345,29 +1365,9 @@ class Mapper(object):
                 hasdata = False
 
                 if isinsert:
-                    for col in mapper._cols_by_table[table]:
-                        if col is mapper.version_id_col:
-                            params[col.key] = 1
-                        elif mapper.polymorphic_on is not None and \
-                                mapper.polymorphic_on.shares_lineage(col):
-                            value = mapper.polymorphic_identity
-                            if ((col.default is None and
-                                 col.server_default is None) or
-                                value is not None):
-                                params[col.key] = value
-                        elif col in pks:
-                            value = mapper._get_state_attr_by_column(state, col)
-                            if value is not None:
-                                params[col.key] = value
-                        else:
-                            value = mapper._get_state_attr_by_column(state, col)
-                            if ((col.default is None and
-                                 col.server_default is None) or
-                                value is not None):
-                                if isinstance(value, sql.ClauseElement):
-                                    value_params[col] = value
-                                else:
-                                    params[col.key] = value
+                    params, value_params = mapper._collect_insert_params(
+                                                table, state, 
+                                                mapper._get_state_attr_by_column)
                     insert.append((state, params, mapper, connection, value_params))
                 else:
                     for col in mapper._cols_by_table[table]:
@@ -1438,13 +1438,41 @@ class Mapper(object):
 
                 statement = table.update(clause)
                 
+                # consecutive UPDATEs against the same connection with the
+                # same set of parameter keys are sent using executemany(), 
+                # provided the dialect can report the total rowcount, so
+                # that the rowcount check below still counts real rows.
+                def update_batch_key(rec):
+                    state, params, mapper, connection, value_params = rec
+                    return (
+                        connection,
+                        tuple(sorted(params)),
+                        bool(value_params)
+                    )
+                
                 rows = 0
-                for state, params, mapper, connection, value_params in update:
-                    c = connection.execute(statement.values(value_params), params)
-                    mapper._postfetch(uowtransaction, connection, table, 
+                for (connection, keys, has_value_params), records in \
+                                                groupby(update, update_batch_key):
+                    records = list(records)
+                    if not has_value_params and len(records) > 1 and \
+                            connection.dialect.supports_sane_multi_rowcount:
+                        c = connection.execute(statement, 
+                                                [rec[1] for rec in records])
+                        for (state, params, mapper, connection, value_params), \
+                                last_updated_params in \
+                                zip(records, c.context.compiled_parameters):
+                            mapper._postfetch(uowtransaction, connection, table, 
+                                        state, c, last_updated_params, value_params)
+                        
+                        rows += c.rowcount
+                        continue
+                        
+                    for state, params, mapper, connection, value_params in records:
+                        c = connection.execute(statement.values(value_params), params)
+                        mapper._postfetch(uowtransaction, connection, table, 
                                         state, c, c.last_updated_params(), value_params)
 
-                    rows += c.rowcount
+                        rows += c.rowcount
 
                 if connection.dialect.supports_sane_rowcount:
                     if rows != len(update):
@@ -1459,18 +1487,45 @@ class Mapper(object):
                     
             if insert:
                 statement = table.insert()
-                for state, params, mapper, connection, value_params in insert:
-                    c = connection.execute(statement.values(value_params), params)
-                    primary_key = c.inserted_primary_key
-
-                    if primary_key is not None:
-                        # set primary key attributes
-                        for i, col in enumerate(mapper._pks_by_table[table]):
-                            if mapper._get_state_attr_by_column(state, col) is None and \
-                                                                len(primary_key) > i:
-                                mapper._set_state_attr_by_column(state, col, primary_key[i])
+                pks = table_to_mapper[table]._pks_by_table[table]
+                
+                # consecutive INSERTs against the same connection with the 
+                # same set of parameter keys, which don't need the newly 
+                # generated primary key back, are sent using executemany().
+                def batch_key(rec):
+                    state, params, mapper, connection, value_params = rec
+                    return (
+                        connection, 
+                        tuple(sorted(params)), 
+                        bool(value_params),
+                        not [col for col in pks if col.key not in params]
+                    )
+                    
+                for (connection, keys, has_value_params, has_all_pks), records in \
+                                                        groupby(insert, batch_key):
+                    records = list(records)
+                    if has_all_pks and not has_value_params and len(records) > 1:
+                        c = connection.execute(statement, 
+                                                [rec[1] for rec in records])
+                        for (state, params, mapper, connection, value_params), \
+                                last_inserted_params in \
+                                zip(records, c.context.compiled_parameters):
+                            mapper._postfetch(uowtransaction, connection, table, 
+                                        state, c, last_inserted_params, value_params)
+                        continue
+                        
+                    for state, params, mapper, connection, value_params in records:
+                        c = connection.execute(statement.values(value_params), params)
+                        primary_key = c.inserted_primary_key
+
+                        if primary_key is not None:
+                            # set primary key attributes
+                            for i, col in enumerate(mapper._pks_by_table[table]):
+                                if mapper._get_state_attr_by_column(state, col) is None and \
+                                                                    len(primary_key) > i:
+                                    mapper._set_state_attr_by_column(state, col, primary_key[i])
                                 
-                    mapper._postfetch(uowtransaction, connection, table, 
+                        mapper._postfetch(uowtransaction, connection, table, 
                                         state, c, c.last_inserted_params(), value_params)
 
                         
@@ -1501,6 +1556,45 @@ class Mapper(object):
                     if 'after_update' in mapper.extension:
                         mapper.extension.after_update(mapper, connection, state.obj())
 
+    def _collect_insert_params(self, table, source, getter):
+        """Return the ``(params, value_params)`` used to ``INSERT`` a row 
+        into the given table.
+        
+        ``getter`` is called as ``getter(source, column)`` to retrieve 
+        the value of each column.  This is shared by :meth:`_save_obj`, 
+        which passes an InstanceState, and :meth:`_bulk_insert`, which 
+        passes a plain dictionary.
+        
+        """
+        params = {}
+        value_params = {}
+        pks = self._pks_by_table[table]
+        
+        for col in self._cols_by_table[table]:
+            if col is self.version_id_col:
+                params[col.key] = 1
+            elif self.polymorphic_on is not None and \
+                    self.polymorphic_on.shares_lineage(col):
+                value = self.polymorphic_identity
+                if ((col.default is None and
+                     col.server_default is None) or
+                    value is not None):
+                    params[col.key] = value
+            elif col in pks:
+                value = getter(source, col)
+                if value is not None:
+                    params[col.key] = value
+            else:
+                value = getter(source, col)
+                if ((col.default is None and
+                     col.server_default is None) or
+                    value is not None):
+                    if isinstance(value, sql.ClauseElement):
+                        value_params[col] = value
+                    else:
+                        params[col.key] = value
+        return params, value_params
+        
     def _postfetch(self, uowtransaction, connection, table, 
                                 state, resultproxy, params, value_params):
         """Expire attributes in need of newly persisted database state."""
@@ -1537,6 +1631,143 @@ class Mapper(object):
                                                 uowtransaction,
                                                 self.passive_updates)
 
+    def _bulk_insert(self, mappings, session_transaction):
+        """Issue ``INSERT`` statements for a list of dictionaries keyed on 
+        attribute name.
+        
+        This is the "bulk" counterpart to :meth:`_save_obj`, called by 
+        :meth:`.Session.bulk_insert_mappings` and 
+        :meth:`.Session.bulk_save_objects`.  No InstanceState is involved; 
+        extensions are not called, dependencies between mappers are not 
+        considered, and generated primary key values are not returned.  
+        Rows whose primary key is present are sent using executemany().
+        
+        """
+        connection = session_transaction.connection(self.base_mapper)
+        
+        # the primary key generated for one table of a joined-table 
+        # inheritance chain is needed for the next, so work on copies 
+        # of the given dictionaries.
+        needs_keys = len(self.tables) > 1
+        if needs_keys:
+            mappings = [dict(mapping) for mapping in mappings]
+        else:
+            mappings = list(mappings)
+            
+        def getter(mapping, col):
+            prop = self._get_col_to_prop(col)
+            value = mapping.get(prop.key)
+            if value is not None:
+                value = prop.get_col_value(col, value)
+            return value
+            
+        for table in self._sorted_tables.iterkeys():
+            if table not in self._pks_by_table:
+                continue
+            
+            pks = self._pks_by_table[table]
+            self._bulk_populate_inherit_keys(table, mappings)
+            
+            records = []
+            for mapping in mappings:
+                params, value_params = \
+                            self._collect_insert_params(table, mapping, getter)
+                records.append((mapping, params, value_params))
+
+            def batch_key(rec):
+                mapping, params, value_params = rec
+                return (
+                    tuple(sorted(params)), 
+                    bool(value_params),
+                    not [col for col in pks if col.key not in params]
+                )
+                
+            statement = table.insert()
+            for (keys, has_value_params, has_all_pks), group in \
+                                            groupby(records, batch_key):
+                if has_all_pks and not has_value_params:
+                    connection.execute(statement, 
+                                    [params for mapping, params, value_params in group])
+                    continue
+                    
+                for mapping, params, value_params in group:
+                    c = connection.execute(statement.values(value_params), params)
+                    primary_key = c.inserted_primary_key
+                    if needs_keys and primary_key is not None:
+                        for col, value in zip(pks, primary_key):
+                            key = self._get_col_to_prop(col).key
+                            if mapping.get(key) is None:
+                                mapping[key] = value
+
+    def _bulk_update(self, mappings, session_transaction):
+        """Issue ``UPDATE`` statements for a list of dictionaries keyed on 
+        attribute name.
+        
+        Each dictionary must contain the primary key attributes of the 
+        row; the remaining keys present are the attributes to be updated.
+        Rows which update the same set of columns are sent using 
+        executemany().  Called by :meth:`.Session.bulk_update_mappings` 
+        and :meth:`.Session.bulk_save_objects`.
+        
+        """
+        connection = session_transaction.connection(self.base_mapper)
+        
+        if len(self.tables) > 1:
+            mappings = [dict(mapping) for mapping in mappings]
+        else:
+            mappings = list(mappings)
+        
+        for table in self._sorted_tables.iterkeys():
+            if table not in self._pks_by_table:
+                continue
+                
+            pks = self._pks_by_table[table]
+            self._bulk_populate_inherit_keys(table, mappings)
+
+            records = []
+            for mapping in mappings:
+                params = {}
+                for col in self._cols_by_table[table]:
+                    prop = self._get_col_to_prop(col)
+                    if col in pks:
+                        value = mapping.get(prop.key)
+                        if value is None:
+                            raise sa_exc.InvalidRequestError(
+                                    "Primary key attribute '%s' is required "
+                                    "for a bulk update of mapper %s" % 
+                                    (prop.key, self))
+                        params[col._label] = prop.get_col_value(col, value)
+                    elif prop.key in mapping:
+                        params[col.key] = prop.get_col_value(col, mapping[prop.key])
+                if len(params) > len(pks):
+                    records.append(params)
+
+            if not records:
+                continue
+                
+            clause = sql.and_()
+            for col in pks:
+                clause.clauses.append(col == sql.bindparam(col._label, type_=col.type))
+            statement = table.update(clause)
+            
+            for keys, group in groupby(records, lambda params: tuple(sorted(params))):
+                group = list(group)
+                c = connection.execute(statement, group)
+                if c.supports_sane_multi_rowcount() and c.rowcount != len(group):
+                    raise orm_exc.ConcurrentModificationError(
+                            "Updated rowcount %d does not match number of "
+                            "rows updated %d" % (c.rowcount, len(group)))
+
+    def _bulk_populate_inherit_keys(self, table, mappings):
+        """Copy primary key values into the dictionaries given to 
+        :meth:`_bulk_insert` or :meth:`_bulk_update` for the inheriting 
+        table given, from the table it inherits."""
+        
+        for m in self.iterate_to_root():
+            if m.local_table is table and m._inherits_equated_pairs:
+                for mapping in mappings:
+                    sync.populate_from_dict(mapping, m, m._inherits_equated_pairs)
+
     def _delete_obj(self, states, uowtransaction):
         """Issue ``DELETE`` statements for a list of objects.
 
@@ -1596,16 +1827,32 @@ class Mapper(object):
         """Register ``DependencyProcessor`` instances with a
         ``unitofwork.UOWTransaction``.
 
-        This call `register_dependencies` on all attached
-        ``MapperProperty`` instances.
+        This replays the `register_dependencies` calls made by all
+        attached ``MapperProperty`` instances, as recorded by
+        ``_flush_plan``.
         
         """
-        for dep in self._props.values() + self._dependency_processors:
-            dep.register_dependencies(uowcommit)
+        for mapper, dependency in self._flush_plan.dependencies:
+            uowcommit.register_dependency(mapper, dependency)
 
     def _register_processors(self, uowcommit):
+        for mapper, processor, mapperfrom in self._flush_plan.processors:
+            uowcommit.register_processor(mapper, processor, mapperfrom)
+
+    @util.memoized_property
+    def _flush_plan(self):
+        """The dependencies and processors this mapper registers with
+        each ``unitofwork.UOWTransaction``.
+
+        These only change when mappers are configured, so they're
+        collected once rather than on every flush.
+
+        """
+        plan = _FlushPlan()
         for dep in self._props.values() + self._dependency_processors:
-            dep.register_processors(uowcommit)
+            dep.register_dependencies(plan)
+            dep.register_processors(plan)
+        return plan
 
     def _instance_processor(self, context, path, adapter, 
                                 polymorphic_from=None, extension=None, 
@@ -1668,6 +1915,7 @@ class Mapper(object):
                 populator(state, dict_, row, isnew)
 
         session_identity_map = context.session.identity_map
+        loaded_states = context.loaded_states
 
         if not extension:
             extension = self.extension
@@ -1767,6 +2015,8 @@ class Mapper(object):
                 # session._finalize_loaded() must be called.
                 state.session_id = context.session.hash_key
                 session_identity_map.add(state)
+                if loaded_states is not None:
+                    loaded_states.append(state)
 
             if currentload or populate_existing:
                 if isnew:
@@ -1916,6 +2166,27 @@ def _event_on_resurrect(state, instance):
         instrumenting_mapper._set_state_attr_by_column(state, col, val)
     
     
+class _FlushPlan(object):
+    """Records the calls made by ``MapperProperty.register_dependencies()``
+    and ``register_processors()``, standing in for a
+    ``unitofwork.UOWTransaction``."""
+
+    def __init__(self):
+        self.dependencies = []
+        self.processors = []
+
+    def register_dependency(self, mapper, dependency):
+        self.dependencies.append((mapper, dependency))
+
+    def register_processor(self, mapper, processor, mapperfrom):
+        self.processors.append((mapper, processor, mapperfrom))
+
+def _reset_compiled_caches():
+    for mapper in list(_mapper_registry):
+        util.reset_memoized(mapper, '_get_statement_cache')
+        util.reset_memoized(mapper, '_flush_plan')
+    _dependency_sort_cache.clear()
+
 def _sort_states(states):
     return sorted(states, key=operator.attrgetter('sort_key'))
 
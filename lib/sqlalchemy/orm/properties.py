@@ -364,6 +364,7 @@ class RelationProperty(StrategizedProperty):
         enable_typechecks=True, join_depth=None,
         comparator_factory=None,
         single_parent=False, innerjoin=False,
+        selectin_batch_size=500,
         strategy_class=None, _local_remote_pairs=None, query_class=None):
 
         self.uselist = uselist
@@ -386,6 +387,7 @@ class RelationProperty(StrategizedProperty):
         self.innerjoin = innerjoin
 
         self.join_depth = join_depth
+        self.selectin_batch_size = selectin_batch_size
         self.local_remote_pairs = _local_remote_pairs
         self.extension = extension
         self.comparator_factory = comparator_factory or RelationProperty.Comparator
@@ -399,6 +401,10 @@ class RelationProperty(StrategizedProperty):
             self.strategy_class = dynamic.DynaLoader
         elif self.lazy is False:
             self.strategy_class = strategies.EagerLoader
+        elif self.lazy == 'selectin':
+            self.strategy_class = strategies.SelectInLoader
+        elif self.lazy == 'subquery':
+            self.strategy_class = strategies.SubqueryLoader
         elif self.lazy is None:
             self.strategy_class = strategies.NoLoader
         else:
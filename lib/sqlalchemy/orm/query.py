@@ -18,6 +18,7 @@ iterable result sets.
 
 """
 
+import copy
 from itertools import chain
 from operator import itemgetter
 
@@ -61,6 +62,8 @@ class Query(object):
     _with_labels = False
     _criterion = None
     _yield_per = None
+    _expunge_yielded = False
+    _loaded_states = None
     _lockmode = None
     _order_by = False
     _group_by = False
@@ -490,7 +493,7 @@ class Query(object):
         entity.set_with_polymorphic(self, cls_or_mappers, selectable=selectable, discriminator=discriminator)
 
     @_generative()
-    def yield_per(self, count):
+    def yield_per(self, count, expunge=False):
         """Yield only ``count`` rows at a time.
 
         WARNING: use this method with caution; if the same instance is present
@@ -498,20 +501,47 @@ class Query(object):
         overwritten.
 
         In particular, it's usually impossible to use this setting with
-        eagerly loaded collections (i.e. any lazy=False) since those
+        eagerly joined collections (i.e. any lazy=False) since those
         collections will be cleared for a new load when encountered in a
-        subsequent result batch.
+        subsequent result batch.  Relations loaded with ``lazy='selectin'``
+        or ``lazy='subquery'`` are loaded separately for each batch, using
+        IN against the parent keys of that batch.
 
         Also note that many DBAPIs do not "stream" results, pre-buffering
         all rows before making them available, including mysql-python and 
         psycopg2.  yield_per() will also set the ``stream_results`` execution
-        option to ``True``, which currently is only understood by psycopg2
-        and causes server side cursors to be used.
+        option to ``True``, which causes server side cursors to be used on
+        psycopg2 and unbuffered cursors on mysql-python, and sets the
+        ``max_row_buffer`` execution option to ``count`` so that no more 
+        than ``count`` rows are fetched from the cursor at a time.
         
+        With mysql-python, no other statement can be executed on the
+        connection while an unbuffered cursor is being read.  Lazy loads,
+        "selectin" and "subquery" eager loads and autoflushes that occur
+        while iterating a yield_per() query will fail with a "commands out
+        of sync" error.  To use these with mysql-python, turn streaming
+        back off, which buffers the full result::
+
+            q = session.query(User).yield_per(100).\\
+                    execution_options(stream_results=False)
+        
+        :param expunge: when ``True``, the instances loaded by each batch,
+          including those loaded by "selectin" and "subquery" eager 
+          loaders, are expunged from the :class:`~sqlalchemy.orm.session.Session`
+          when the next batch is requested, so that the size of the
+          Session does not grow with the size of the result.  Instances
+          which were already present in the Session remain.  Expunged
+          instances are detached; attributes which weren't loaded can't
+          be loaded afterwards, and changes made to them won't be flushed.
+          An object related to parents in more than one batch is loaded
+          once per batch.
+          
         """
         self._yield_per = count
+        self._expunge_yielded = expunge
         self._execution_options = self._execution_options.copy()
         self._execution_options['stream_results'] = True
+        self._execution_options['max_row_buffer'] = count
         
     def get(self, ident):
         """Return an instance of the object based on the given identifier, or None if not found.
@@ -694,11 +724,14 @@ class Query(object):
         """ Set non-SQL options for the resulting statement, 
         such as dialect-specific options.
         
-        The only option currently understood is ``stream_results=True``, 
-        only used by Psycopg2 to enable "server side cursors".  This option
-        only has a useful effect if used in conjunction with
-        :meth:`~sqlalchemy.orm.query.Query.yield_per()`,
-        which currently sets ``stream_results`` to ``True`` automatically.
+        Options understood by all dialects include ``stream_results=True``,
+        which fetches rows from the database as they are consumed on
+        dialects that support it (see
+        :meth:`~sqlalchemy.sql.expression.Executable.execution_options`),
+        and ``max_row_buffer``, the number of rows fetched at a time
+        when streaming.  These options only have a useful effect if used 
+        in conjunction with :meth:`~sqlalchemy.orm.query.Query.yield_per()`,
+        which sets both automatically.
 
         """
         _execution_options = self._execution_options.copy()
@@ -1404,6 +1437,10 @@ class Query(object):
             context = QueryContext(self)
 
         context.runid = _new_runid()
+        context.post_load = []
+        if self._yield_per and self._expunge_yielded and \
+                context.loaded_states is None:
+            context.loaded_states = []
 
         filtered = bool(list(self._mapper_entities))
         single_entity = filtered and len(self._entities) == 1
@@ -1463,12 +1500,20 @@ class Query(object):
             for ii, (dict_, attrs) in context.partials.iteritems():
                 ii.commit(dict_, attrs)
 
+            for load in context.post_load:
+                load()
+
             for row in rows:
                 yield row
 
             if not self._yield_per:
                 break
 
+            if context.loaded_states:
+                for state in context.loaded_states:
+                    session._expunge_state(state)
+                del context.loaded_states[:]
+
     def merge_result(self, iterator, load=True):
         """Merge a result into this Query's Session.
         
@@ -1552,6 +1597,15 @@ class Query(object):
         else:
             ident = util.to_list(ident)
 
+        if refresh_state is None and \
+                lockmode is None and \
+                only_load_props is None and \
+                ident is not None and \
+                None not in ident and \
+                self._is_simple_get() and \
+                len(ident) >= len(self._mapper_zero().primary_key):
+            return self._get_from_cached_statement(ident)
+
         if refresh_state is None:
             q = self._clone()
             q._no_criterion_condition("get")
@@ -1601,6 +1655,97 @@ class Query(object):
         except orm_exc.NoResultFound:
             return None
 
+    # Query attributes which may be present on a Query
+    # that loads using the mapper's cached "get" statement.
+    _simple_get_attributes = frozenset([
+        'session', '_entities', '_mapper_adapter_map',
+        '_polymorphic_adapters', '_autoflush', '_params',
+        '_current_path', '_disable_orm_filtering'])
+
+    def _is_simple_get(self):
+        """Return True if this Query can load by primary key using
+        the mapper's cached "get" statement.
+
+        This is the case when no criterion, options or other 
+        modifiers have been applied to the Query, and the methods 
+        which produce results have not been overridden by a subclass.
+
+        """
+        cls = self.__class__
+        if cls is not Query and (
+                cls.__iter__.im_func is not Query.__iter__.im_func or
+                cls._execute_and_instances.im_func is not 
+                        Query._execute_and_instances.im_func or
+                cls.instances.im_func is not Query.instances.im_func):
+            return False
+
+        if len(self._entities) != 1:
+            return False
+        entity = self._entities[0]
+        if not isinstance(entity, _MapperEntity) or \
+                entity.is_aliased_class:
+            return False
+
+        for key in self.__dict__:
+            if key not in self._simple_get_attributes:
+                return False
+        return True
+
+    def _get_from_cached_statement(self, ident):
+        """Load an instance by primary key using the mapper's cached
+        QueryContext and Compiled object, binding only the primary key
+        values.
+
+        """
+        mapper = self._mapper_zero()
+        cache_key = (self._entities[0].entity_zero, self._current_path, 
+                        getattr(self, '_disable_orm_filtering', None))
+        cache = mapper._get_statement_cache
+        try:
+            template, bind_keys, compiled_cache = cache[cache_key]
+        except KeyError:
+            q = self._clone()
+            (_get_clause, _get_params) = mapper._get_clause
+            q._criterion = q._adapt_clause(_get_clause, True, False)
+            q._order_by = None
+            template = q._compile_context()
+            template.statement.use_labels = True
+            template.query = template.session = None
+            template.restatable = False
+            bind_keys = [_get_params[primary_key].key 
+                            for primary_key in mapper.primary_key]
+            compiled_cache = {}
+            cache[cache_key] = template, bind_keys, compiled_cache
+
+        context = copy.copy(template)
+        context.query = self
+        context.session = self.session
+        context.attributes = context.attributes.copy()
+
+        if self._autoflush:
+            self.session._autoflush()
+
+        engine = self.session.get_bind(mapper, clause=context.statement)
+        try:
+            compiled = compiled_cache[engine.dialect]
+        except KeyError:
+            compiled = compiled_cache[engine.dialect] = \
+                            context.statement.compile(dialect=engine.dialect)
+
+        result = self.session._connection_for_bind(
+                                        engine, close_with_result=True).\
+                            execute(compiled, dict(zip(bind_keys, ident)))
+        ret = list(self.instances(result, context))
+
+        l = len(ret)
+        if l == 1:
+            return ret[0]
+        elif l == 0:
+            return None
+        else:
+            raise orm_exc.MultipleResultsFound(
+                "Multiple rows were found for one()")
+
     @property
     def _select_args(self):
         return {
@@ -2336,6 +2481,10 @@ class QueryContext(object):
     adapter = None
     froms = ()
     
+    # indicates that running the Query again would 
+    # produce the same statement and parameters.
+    restatable = True
+    
     def __init__(self, query):
 
         if query._statement is not None:
@@ -2361,6 +2510,10 @@ class QueryContext(object):
         self.create_eager_joins = []
         self.propagate_options = set(o for o in query._with_options if o.propagate_to_loaders)
         self.attributes = query._attributes.copy()
+        
+        # states newly loaded by this query and the
+        # eager loads it runs, when expunged per batch.
+        self.loaded_states = query._loaded_states
 
 class AliasOption(interfaces.MapperOption):
 
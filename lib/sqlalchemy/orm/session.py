@@ -7,7 +7,7 @@
 """Provides the Session class and related utilities."""
 
 import weakref
-from itertools import chain
+from itertools import chain, groupby
 import sqlalchemy.exceptions as sa_exc
 from sqlalchemy import util, sql, engine, log
 from sqlalchemy.sql import util as sql_util, expression
@@ -163,6 +163,14 @@ def sessionmaker(bind=None, class_=None, autoflush=True, autocommit=False,
       when using the value ``False``, the identity map uses a regular Python
       dictionary to store instances. The session will maintain all instances
       present until they are removed using expunge(), clear(), or purge().
+      When given a positive integer, the map is weak-referencing but
+      additionally keeps approximately that many of the most recently
+      loaded or accessed instances resident, using least-recently-used
+      ordering; the number held may grow to one and a half times the given
+      value before older instances are released.  Instances beyond that
+      number remain present only while referenced elsewhere or while they
+      have pending changes.  ``0`` and ``None`` select the strongly
+      referencing map, the same as ``False``.
 
     """
     kwargs['bind'] = bind
@@ -515,6 +523,7 @@ class Session(object):
 
     public_methods = (
         '__contains__', '__iter__', 'add', 'add_all', 'begin', 'begin_nested',
+        'bulk_insert_mappings', 'bulk_save_objects', 'bulk_update_mappings', 
         'close', 'commit', 'connection', 'delete', 'execute', 'expire',
         'expire_all', 'expunge', 'expunge_all', 'flush', 'get_bind', 'is_modified', 
         'merge', 'query', 'refresh', 'rollback', 
@@ -531,7 +540,12 @@ class Session(object):
 
         """
         
-        if weak_identity_map:
+        if isinstance(weak_identity_map, (int, long)) and \
+                not isinstance(weak_identity_map, bool) and \
+                weak_identity_map > 0:
+            self._identity_cls = util.partial(identity.LRUInstanceDict,
+                                                weak_identity_map)
+        elif weak_identity_map:
             self._identity_cls = identity.WeakInstanceDict
         else:
             self._identity_cls = identity.StrongInstanceDict
@@ -950,7 +964,8 @@ class Session(object):
         """Remove unreferenced instances cached in the identity map.
 
         Note that this method is only meaningful if "weak_identity_map" is set
-        to False.  The default weak identity map is self-pruning.
+        to False or to an integer.  The default weak identity map is
+        self-pruning.
 
         Removes any object in this Session's identity map that is not
         referenced in user code, modified, new or scheduled for deletion.
@@ -1423,6 +1438,85 @@ class Session(object):
         for ext in self.extensions:
             ext.after_flush_postexec(self, flush_context)
 
+    def bulk_save_objects(self, objects):
+        """Perform a bulk save of the given list of objects.
+        
+        Objects without an identity key are INSERTed, and those with an 
+        identity key are UPDATEd with their modified attributes, using 
+        ``executemany()`` where possible.  The unit of work is bypassed: 
+        the objects are not added to this ``Session`` or its identity 
+        map, relations and dependencies between objects are not 
+        considered, ``MapperExtension`` and ``SessionExtension`` hooks 
+        are not called, and primary key values generated for new rows 
+        are not set on the objects.
+        
+        Consecutive objects of the same class are grouped together, so 
+        objects should be ordered by class for best efficiency.  
+        Statements are issued within the current transaction.
+        
+        """
+        for (mapper, isupdate), states in groupby(
+                    (_state_for_unknown_persistence_instance(obj) for obj in objects),
+                    lambda state: (_state_mapper(state), state.key is not None)):
+            if isupdate:
+                states = list(states)
+                self._bulk_save_mappings(
+                    mapper, [_state_bulk_update_dict(state, mapper) for state in states],
+                    True)
+                for state in states:
+                    if state.session_id == self.hash_key:
+                        state.commit_all(state.dict, self.identity_map)
+                    else:
+                        state.commit_all(state.dict)
+            else:
+                self._bulk_save_mappings(
+                    mapper, (state.dict for state in states), False)
+                
+    def bulk_insert_mappings(self, mapper, mappings):
+        """Perform a bulk insert of the given list of dictionaries.
+        
+        Each dictionary represents a row for the given mapper or mapped 
+        class, keyed on attribute name; for a joined-table inheritance 
+        mapper, rows are INSERTed into each table.  Consecutive 
+        dictionaries which contain the same keys, including their 
+        primary key, are sent using a single ``executemany()``.  No 
+        objects are created, and extensions and relations are not 
+        involved; see :meth:`bulk_save_objects`.
+        
+        """
+        self._bulk_save_mappings(mapper, mappings, False)
+        
+    def bulk_update_mappings(self, mapper, mappings):
+        """Perform a bulk update of the given list of dictionaries.
+        
+        Each dictionary must contain the primary key attributes of the 
+        row to be updated; all other keys present are the attributes to
+        be updated.  As with :meth:`bulk_insert_mappings`, no objects 
+        or extensions are involved, and consecutive dictionaries which 
+        contain the same keys are sent using a single ``executemany()``.
+        
+        """
+        self._bulk_save_mappings(mapper, mappings, True)
+        
+    def _bulk_save_mappings(self, mapper, mappings, isupdate):
+        mapper = _class_to_mapper(mapper)
+        
+        # don't autoflush pending changes when beginning the transaction
+        self._flushing = True
+        try:
+            transaction = self.begin(subtransactions=True)
+            try:
+                if isupdate:
+                    mapper._bulk_update(mappings, transaction)
+                else:
+                    mapper._bulk_insert(mappings, transaction)
+                transaction.commit()
+            except:
+                transaction.rollback()
+                raise
+        finally:
+            self._flushing = False
+        
     def is_modified(self, instance, include_collections=True, passive=False):
         """Return True if instance has modified attributes.
 
@@ -1562,6 +1656,17 @@ def _state_for_unknown_persistence_instance(instance):
 
     return state
 
+def _state_bulk_update_dict(state, mapper):
+    """Return a dictionary of the modified attributes of the given state, 
+    along with its primary key attributes."""
+    
+    dict_ = state.dict
+    ret = dict((key, dict_[key]) for key in state.committed_state if key in dict_)
+    for col in mapper.primary_key:
+        key = mapper._get_col_to_prop(col).key
+        ret[key] = state.get_impl(key).get_committed_value(state, dict_)
+    return ret
+
 def make_transient(instance):
     """Make the given instance 'transient'.
     
@@ -1575,7 +1680,7 @@ def make_transient(instance):
     s = _state_session(state)
     if s:
         s._expunge_state(state)
-    del state.key
+    state.key = None
     
     
 def object_session(instance):
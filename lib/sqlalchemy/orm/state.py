@@ -1,4 +1,4 @@
-from sqlalchemy.util import EMPTY_SET
+from sqlalchemy.util import EMPTY_SET, EMPTY_DICT
 import weakref
 from sqlalchemy import util
 from sqlalchemy.orm.attributes import PASSIVE_NO_RESULT, PASSIVE_OFF, \
@@ -9,51 +9,66 @@ from sqlalchemy.orm import attributes, exc as orm_exc, interfaces
 import sys
 attributes.state = sys.modules['sqlalchemy.orm.state']
 
+def _dead_ref():
+    """Stands in for a weakref whose referent is gone."""
+    
+    return None
+
 class InstanceState(object):
-    """tracks state information at the instance level."""
-
-    session_id = None
-    key = None
-    runid = None
-    load_options = EMPTY_SET
-    load_path = ()
-    insert_order = None
-    mutable_dict = None
-    _strong_obj = None
-    modified = False
-    expired = False
+    """tracks state information at the instance level.
+    
+    Every loaded instance carries one of these, so attributes are held
+    in slots.  The ``committed_state``, ``parents``, ``pending`` and
+    ``callables`` dictionaries start out as the shared, read-only
+    ``EMPTY_DICT`` and are replaced by a new dictionary only when
+    written to.
+    
+    """
+
+    __slots__ = (
+        'class_', 'manager', 'obj', '_instance_dict', 'session_id', 'key',
+        'runid', 'load_options', 'load_path', 'insert_order',
+        'committed_state', 'parents', 'pending', 'callables',
+        'mutable_dict', '_strong_obj', 'modified', 'expired', '__weakref__'
+    )
     
     def __init__(self, obj, manager):
         self.class_ = obj.__class__
         self.manager = manager
         self.obj = weakref.ref(obj, self._cleanup)
+        self._init_slots()
+
+    def _init_slots(self):
+        self._instance_dict = _dead_ref
+        self.session_id = self.key = self.runid = self.insert_order = None
+        self.load_options = EMPTY_SET
+        self.load_path = ()
+        self.committed_state = self.parents = EMPTY_DICT
+        self.pending = self.callables = EMPTY_DICT
+        self.mutable_dict = self._strong_obj = None
+        self.modified = self.expired = False
 
-    @util.memoized_property
-    def committed_state(self):
-        return {}
-    
-    @util.memoized_property
-    def parents(self):
-        return {}
+    def _committed_state_for_write(self):
+        if self.committed_state is EMPTY_DICT:
+            self.committed_state = {}
+        return self.committed_state
 
-    @util.memoized_property
-    def pending(self):
-        return {}
+    def _parents_for_write(self):
+        if self.parents is EMPTY_DICT:
+            self.parents = {}
+        return self.parents
 
-    @util.memoized_property
-    def callables(self):
-        return {}
+    def _callables_for_write(self):
+        if self.callables is EMPTY_DICT:
+            self.callables = {}
+        return self.callables
         
     def detach(self):
-        if self.session_id:
-            try:
-                del self.session_id
-            except AttributeError:
-                pass
+        self.session_id = None
 
     def dispose(self):
         self.detach()
-        del self.obj
+        self.obj = _dead_ref
     
     def _cleanup(self, ref):
         instance_dict = self._instance_dict()
@@ -63,12 +78,9 @@ class InstanceState(object):
             except AssertionError:
                 pass
         # remove possible cycles
-        self.__dict__.pop('callables', None)
+        self.callables = EMPTY_DICT
         self.dispose()
     
-    def obj(self):
-        return None
-    
     @property
     def dict(self):
         o = self.obj()
@@ -111,6 +123,8 @@ class InstanceState(object):
 
     def get_pending(self, key):
         if key not in self.pending:
+            if self.pending is EMPTY_DICT:
+                self.pending = {}
             self.pending[key] = PendingCollection()
         return self.pending[key]
 
@@ -139,12 +153,20 @@ class InstanceState(object):
     def __getstate__(self):
         d = {'instance':self.obj()}
 
-        d.update(
-            (k, self.__dict__[k]) for k in (
-                'committed_state', 'pending', 'parents', 'modified', 'expired', 
-                'callables', 'key', 'load_options', 'mutable_dict'
-            ) if k in self.__dict__ 
-        )
+        for k in ('committed_state', 'pending', 'parents', 'callables'):
+            value = getattr(self, k)
+            if value is not EMPTY_DICT:
+                d[k] = value
+        if _modified.__get__(self, InstanceState):
+            d['modified'] = True
+        if self.expired:
+            d['expired'] = True
+        if self.key is not None:
+            d['key'] = self.key
+        if self.load_options:
+            d['load_options'] = self.load_options
+        if self.mutable_dict is not None:
+            d['mutable_dict'] = self.mutable_dict
         if self.load_path:
             d['load_path'] = interfaces.serialize_path(self.load_path)
         return d
@@ -161,22 +183,21 @@ class InstanceState(object):
                         self.class_)
         elif manager.mapper and not manager.mapper.compiled:
             manager.mapper.compile()
-            
-        self.committed_state = state.get('committed_state', {})
-        self.pending = state.get('pending', {})
-        self.parents = state.get('parents', {})
+        
+        self._init_slots()
+        self.committed_state = state.get('committed_state', EMPTY_DICT)
+        self.pending = state.get('pending', EMPTY_DICT)
+        self.parents = state.get('parents', EMPTY_DICT)
         self.modified = state.get('modified', False)
         self.expired = state.get('expired', False)
-        self.callables = state.get('callables', {})
+        self.callables = state.get('callables', EMPTY_DICT)
             
         if self.modified:
             self._strong_obj = state['instance']
-            
-        self.__dict__.update([
-            (k, state[k]) for k in (
-                'key', 'load_options', 'mutable_dict'
-            ) if k in state 
-        ])
+        
+        self.key = state.get('key', None)
+        self.load_options = state.get('load_options', EMPTY_SET)
+        self.mutable_dict = state.get('mutable_dict', self.mutable_dict)
 
         if 'load_path' in state:
             self.load_path = interfaces.deserialize_path(state['load_path'])
@@ -192,7 +213,8 @@ class InstanceState(object):
            callables associated with it."""
 
         dict_.pop(key, None)
-        self.callables.pop(key, None)
+        if key in self.callables:
+            del self.callables[key]
 
     def expire_attribute_pre_commit(self, dict_, key):
         """a fast expire that can be called by column loaders during a load.
@@ -204,14 +226,14 @@ class InstanceState(object):
 
         """
         dict_.pop(key, None)
-        self.callables[key] = self
+        self._callables_for_write()[key] = self
 
     def set_callable(self, dict_, key, callable_):
         """Remove the given attribute and set the given callable
            as a loader."""
            
         dict_.pop(key, None)
-        self.callables[key] = callable_
+        self._callables_for_write()[key] = callable_
     
     def expire_attributes(self, dict_, attribute_names, instance_dict=None):
         """Expire all or a group of attributes.
@@ -235,22 +257,21 @@ class InstanceState(object):
         else:
             filter_deferred = False
 
-        to_clear = (
-            self.__dict__.get('pending', None),
-            self.__dict__.get('committed_state', None),
-            self.mutable_dict
-        )
+        to_clear = [d for d in (
+                        self.pending,
+                        self.committed_state,
+                        self.mutable_dict
+                    ) if d]
         
         for key in attribute_names:
             impl = self.manager[key].impl
             if impl.accepts_scalar_loader and \
                 (not filter_deferred or impl.expire_missing or key in dict_):
-                self.callables[key] = self
+                self._callables_for_write()[key] = self
             dict_.pop(key, None)
             
             for d in to_clear:
-                if d is not None:
-                    d.pop(key, None)
+                d.pop(key, None)
 
     def __call__(self, **kw):
         """__call__ allows the InstanceState to act as a deferred
@@ -306,9 +327,6 @@ class InstanceState(object):
         """
         return set([k for k, v in self.callables.items() if v is self])
 
-    def _instance_dict(self):
-        return None
-
     def _is_really_none(self):
         return self.obj()
         
@@ -327,7 +345,7 @@ class InstanceState(object):
                 previous = attr.copy(previous)
 
             if needs_committed:
-                self.committed_state[attr.key] = previous
+                self._committed_state_for_write()[attr.key] = previous
 
         if not self.modified:
             instance_dict = self._instance_dict()
@@ -351,9 +369,10 @@ class InstanceState(object):
         class_manager = self.manager
         for key in keys:
             if key in dict_ and key in class_manager.mutable_attributes:
-                self.committed_state[key] = self.manager[key].impl.copy(dict_[key])
-            else:
-                self.committed_state.pop(key, None)
+                self._committed_state_for_write()[key] = \
+                                self.manager[key].impl.copy(dict_[key])
+            elif key in self.committed_state:
+                del self.committed_state[key]
         
         self.expired = False
         
@@ -378,18 +397,17 @@ class InstanceState(object):
 
         """
         
-        self.__dict__.pop('committed_state', None)
-        self.__dict__.pop('pending', None)
+        self.committed_state = self.pending = EMPTY_DICT
 
-        if 'callables' in self.__dict__:
-            callables = self.callables
-            for key in list(callables):
-                if key in dict_ and callables[key] is self:
-                    del callables[key]
+        callables = self.callables
+        for key in list(callables):
+            if key in dict_ and callables[key] is self:
+                del callables[key]
 
         for key in self.manager.mutable_attributes:
             if key in dict_:
-                self.committed_state[key] = self.manager[key].impl.copy(dict_[key])
+                self._committed_state_for_write()[key] = \
+                                self.manager[key].impl.copy(dict_[key])
                 
         if instance_dict and self.modified:
             instance_dict._modified.discard(self)
@@ -397,6 +415,10 @@ class InstanceState(object):
         self.modified = self.expired = False
         self._strong_obj = None
 
+# the slot descriptor for InstanceState.modified, which
+# MutableAttrInstanceState wraps with a property
+_modified = InstanceState.modified
+
 class MutableAttrInstanceState(InstanceState):
     """InstanceState implementation for objects that reference 'mutable' 
     attributes.
@@ -406,12 +428,14 @@ class MutableAttrInstanceState(InstanceState):
     
     """
     
-    @util.memoized_property
-    def mutable_dict(self):
-        return {}
+    __slots__ = ()
+    
+    def _init_slots(self):
+        InstanceState._init_slots(self)
+        self.mutable_dict = {}
         
     def _get_modified(self, dict_=None):
-        if self.__dict__.get('modified', False):
+        if _modified.__get__(self, InstanceState):
             return True
         else:
             if dict_ is None:
@@ -423,7 +447,7 @@ class MutableAttrInstanceState(InstanceState):
                 return False
     
     def _set_modified(self, value):
-        self.__dict__['modified'] = value
+        _modified.__set__(self, value)
         
     modified = property(_get_modified, _set_modified)
     
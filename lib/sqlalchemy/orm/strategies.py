@@ -23,6 +23,7 @@ def _register_attribute(strategy, mapper, useobject,
         typecallable=None,
         copy_function=None, 
         mutable_scalars=False, 
+        track_mutations=False,
         uselist=False,
         callable_=None, 
         proxy_property=None, 
@@ -52,6 +53,7 @@ def _register_attribute(strategy, mapper, useobject,
                 prop.key, 
                 parent_token=prop,
                 mutable_scalars=mutable_scalars,
+                track_mutations=track_mutations,
                 uselist=uselist, 
                 copy_function=copy_function, 
                 compare_function=compare_function, 
@@ -107,6 +109,7 @@ class ColumnLoader(LoaderStrategy):
             compare_function=coltype.compare_values,
             copy_function=coltype.copy_value,
             mutable_scalars=self.columns[0].type.is_mutable(),
+            track_mutations=coltype.tracks_mutations(),
             active_history = active_history
        )
         
@@ -215,6 +218,7 @@ class DeferredColumnLoader(LoaderStrategy):
              compare_function=self.columns[0].type.compare_values,
              copy_function=self.columns[0].type.copy_value,
              mutable_scalars=self.columns[0].type.is_mutable(),
+             track_mutations=self.columns[0].type.tracks_mutations(),
              callable_=self._class_level_loader,
              expire_missing=False
         )
@@ -800,6 +804,271 @@ class EagerLoader(AbstractRelationLoader):
 
 log.class_logger(EagerLoader)
 
+class SelectInLoader(AbstractRelationLoader):
+    """Strategize a relation() that loads for all parent objects in a result
+    once they have been loaded, using a second SELECT which locates the 
+    related rows using IN against the parents' key values.
+    
+    One SELECT is emitted per batch of ``selectin_batch_size`` distinct
+    parent keys.
+    
+    """
+    
+    def init(self):
+        super(SelectInLoader, self).init()
+        self.batch_size = self.parent_property.selectin_batch_size
+        
+        self._lazywhere, bind_to_col, equated = \
+                    LazyLoader._create_lazy_clause(self.parent_property)
+                    
+        # locate the "remote" column compared to each bind
+        # in the lazy clause; "bind == remote" becomes 
+        # "remote IN (values)".
+        remote_cols = {}
+        binds = []
+        def visit_bindparam(bindparam):
+            if bindparam.key in bind_to_col:
+                binds.append(bindparam.key)
+        def visit_binary(binary):
+            if binary.operator is operators.eq:
+                for bind, col in ((binary.left, binary.right), 
+                                    (binary.right, binary.left)):
+                    if isinstance(bind, expression._BindParamClause) and \
+                            bind.key in bind_to_col:
+                        remote_cols[bind.key] = col
+        visitors.traverse(self._lazywhere, {}, 
+                            {'bindparam':visit_bindparam, 'binary':visit_binary})
+
+        # a join condition which can't be expressed using IN
+        # degrades to a lazy load.
+        self.use_in = bool(binds) and len(binds) == len(remote_cols)
+        if self.use_in:
+            self._bind_keys = remote_cols.keys()
+            self._parent_cols = [bind_to_col[k] for k in self._bind_keys]
+            self._remote_cols = [remote_cols[k] for k in self._bind_keys]
+            
+            # for a many-to-one against the primary key of the target,
+            # locate the position of each primary key column so that
+            # objects already in the identity map need not be loaded.
+            self._get_positions = None
+            if self.parent_property._get_strategy(LazyLoader).use_get:
+                positions = util.column_dict(
+                    [(c, i) for i, c in enumerate(self._remote_cols)])
+                if not [c for c in self.mapper.primary_key if c not in positions]:
+                    self._get_positions = [positions[c] 
+                                            for c in self.mapper.primary_key]
+        else:
+            self.logger.info("%s will degrade to a lazy load" % self)
+            
+    def init_class_attribute(self, mapper):
+        self.parent_property._get_strategy(LazyLoader).init_class_attribute(mapper)
+
+    def _in_clause(self, values):
+        def replace(elem):
+            if isinstance(elem, expression._BinaryExpression) and \
+                    elem.operator is operators.eq:
+                for bind, col in ((elem.left, elem.right), (elem.right, elem.left)):
+                    if isinstance(bind, expression._BindParamClause) and \
+                            bind.key in values:
+                        return col.in_(values[bind.key])
+            return None
+        return visitors.replacement_traverse(self._lazywhere, {}, replace)
+        
+    def create_row_processor(self, context, path, mapper, row, adapter):
+        if not self.use_in:
+            return self.parent_property._get_strategy(LazyLoader).\
+                                create_row_processor(context, path, mapper, row, adapter)
+
+        path = path + (self.key,)
+        key = self.key
+        states = []
+        def load():
+            self._load_for_states(context, path, mapper, states)
+        context.post_load.append(load)
+        
+        # the attribute is initialized here, so that it is not
+        # treated as unloaded by the queries which populate it.
+        if self.uselist:
+            def new_execute(state, dict_, row, isnew):
+                collection = attributes.init_state_collection(state, dict_, key)
+                states.append((state, collection))
+        else:
+            def new_execute(state, dict_, row, isnew):
+                dict_[key] = None
+                states.append((state, dict_))
+        return new_execute, None
+    
+    def _load_for_states(self, context, path, mapper, states):
+        if not states:
+            return
+            
+        by_key = {}
+        for state, target in states:
+            key = tuple([mapper._get_state_attr_by_column(state, col) 
+                            for col in self._parent_cols])
+            by_key.setdefault(key, []).append(target)
+        del states[:]
+        
+        related = self._load_related(context, path, 
+                                    [k for k in by_key if None not in k])
+                
+        for key, targets in by_key.iteritems():
+            items = related.get(key, ())
+            if self.uselist:
+                for collection in targets:
+                    for item in items:
+                        collection.append_without_event(item)
+            elif items:
+                if len(items) > 1:
+                    util.warn(
+                        "Multiple rows returned with "
+                        "uselist=False for eagerly-loaded attribute '%s' " % self)
+                for dict_ in targets:
+                    dict_[self.key] = items[0]
+
+    def _related_query(self, context, path, key_cols):
+        """Return a Query for the related mapper which also selects 
+        the given columns, representing the parent key of each row."""
+        
+        q = context.session.query(self.mapper, *key_cols).\
+                    _adapt_all_clauses().\
+                    autoflush(False).\
+                    _with_current_path(context.query._current_path + path)
+                    
+        if context.propagate_options:
+            q = q._conditional_options(*context.propagate_options)
+        if context.populate_existing:
+            q = q.populate_existing()
+        if context.loaded_states is not None:
+            q._loaded_states = context.loaded_states
+        if self.parent_property.order_by:
+            q = q.order_by(*util.to_list(self.parent_property.order_by))
+        return q
+        
+    def _load_related(self, context, path, keys):
+        """Return a dictionary of related instances keyed on the 
+        tuple of parent key values."""
+        
+        related = {}
+        if self._get_positions is not None and not context.populate_existing:
+            identity_map = context.session.identity_map
+            remaining = []
+            for key in keys:
+                identity_key = self.mapper.identity_key_from_primary_key(
+                                    [key[i] for i in self._get_positions])
+                instance = identity_map.get(identity_key)
+                if instance is not None:
+                    related[key] = [instance]
+                else:
+                    remaining.append(key)
+            keys = remaining
+        
+        if not keys:
+            return related
+            
+        q = self._related_query(context, path, self._remote_cols)
+        for i in range(0, len(keys), self.batch_size):
+            batch = keys[i:i + self.batch_size]
+            values = {}
+            for idx, bind_key in enumerate(self._bind_keys):
+                values[bind_key] = util.unique_list([k[idx] for k in batch])
+            for row in q.filter(self._in_clause(values)):
+                related.setdefault(tuple(row[1:]), []).append(row[0])
+        return related
+
+log.class_logger(SelectInLoader)
+
+class SubqueryLoader(SelectInLoader):
+    """Strategize a relation() that loads for all parent objects in a result
+    once they have been loaded, using a second SELECT which joins the
+    related table to the original query, embedded as a subquery.
+
+    The parent key values themselves aren't sent back to the database.
+    Only relations of the entities selected by the original query, at
+    the first level of a load path, re-state it; relations further along
+    a path, such as 'items' in ``subqueryload_all('orders.items')``,
+    locate their related rows using IN, in the same way as
+    :class:`SelectInLoader`.  IN is also used when the original query
+    can't be re-stated as a subquery, such as a query against a textual
+    statement, or when the parent objects are themselves loaded by an
+    eager join, as well as for a many-to-one against the primary key of
+    the target, where the related objects may already be present in the
+    identity map.
+
+    """
+
+    def _load_related(self, context, path, keys):
+        if self._get_positions is not None and not context.populate_existing:
+            key_cols = None
+        else:
+            key_cols = self._restate_query(context, path)
+        if key_cols is None:
+            return super(SubqueryLoader, self)._load_related(context, path, keys)
+
+        # "bind == remote" becomes "subquery.col == remote"
+        bind_to_col = dict(zip(self._bind_keys, key_cols))
+        def replace(elem):
+            if isinstance(elem, expression._BindParamClause) and \
+                    elem.key in bind_to_col:
+                return bind_to_col[elem.key]
+            return None
+        criterion = visitors.replacement_traverse(self._lazywhere, {}, replace)
+
+        q = self._related_query(context, path, key_cols).\
+                    filter(criterion).\
+                    params(context.query._params)
+
+        related = {}
+        for row in q:
+            related.setdefault(tuple(row[1:]), []).append(row[0])
+        return related
+
+    def _restate_query(self, context, path):
+        """Return the parent key columns of the original query, selected
+        from that query embedded as a subquery, or None if the query
+        can't be re-stated."""
+
+        # only a relation of an entity selected by the query, at the
+        # first level of the path, can be joined to it directly.
+        query = context.query
+        if not context.restatable or \
+                query._statement is not None or \
+                query._yield_per or \
+                len(path) != 2:
+            return None
+
+        entity = path[0]
+        mapper, selectable, is_aliased_class = mapperutil._entity_info(entity)
+        if is_aliased_class:
+            cls = entity
+        else:
+            cls = mapper.class_
+
+        attrs = []
+        for col in self._parent_cols:
+            prop = mapper._columntoproperty.get(col)
+            if prop is None:
+                return None
+            attrs.append(getattr(cls, prop.key))
+
+        q = query.enable_eagerloads(False)
+        q._set_entities(attrs)
+
+        # ORDER BY is only significant if LIMIT/OFFSET are
+        # present, in which case the rows can't be made DISTINCT
+        # without also selecting the ordering columns; the limited
+        # query is instead wrapped in a SELECT DISTINCT of the key
+        # columns, so that a parent repeated by a join to a
+        # collection doesn't repeat the related rows.
+        if q._limit is None and q._offset is None:
+            q._order_by = None
+            return list(q.distinct().with_labels().subquery().c)
+        
+        subq = q.with_labels().subquery()
+        return list(sql.select(list(subq.c)).distinct().alias().c)
+
+log.class_logger(SubqueryLoader)
+
 class EagerLazyOption(StrategizedOption):
 
     def __init__(self, key, lazy=True, chained=False, mapper=None, propagate_to_loaders=True):
@@ -809,10 +1078,14 @@ class EagerLazyOption(StrategizedOption):
         self.propagate_to_loaders = propagate_to_loaders
         
     def is_chained(self):
-        return not self.lazy and self.chained
+        return self.lazy is not True and self.chained
         
     def get_strategy_class(self):
-        if self.lazy:
+        if self.lazy == 'selectin':
+            return SelectInLoader
+        elif self.lazy == 'subquery':
+            return SubqueryLoader
+        elif self.lazy:
             return LazyLoader
         elif self.lazy is False:
             return EagerLoader
@@ -60,6 +60,24 @@ def populate_dict(source, source_mapper, dict_, synchronize_pairs):
 
         dict_[r.key] = value
 
+def populate_from_dict(dict_, mapper, synchronize_pairs):
+    """Copy values between keys of a dictionary keyed on attribute name,
+    as used by the "bulk" insert and update methods of Mapper."""
+    
+    for l, r in synchronize_pairs:
+        try:
+            value = dict_.get(mapper._get_col_to_prop(l).key)
+        except exc.UnmappedColumnError:
+            _raise_col_to_prop(False, mapper, l, mapper, r)
+        
+        if value is None:
+            continue
+            
+        try:
+            dict_[mapper._get_col_to_prop(r).key] = value
+        except exc.UnmappedColumnError:
+            _raise_col_to_prop(True, mapper, l, mapper, r)
+
 def source_modified(uowcommit, source, source_mapper, synchronize_pairs):
     """return true if the source object has changes from an old to a new value on the given
     synchronize pairs
@@ -23,7 +23,7 @@ changes at once.
 from sqlalchemy import util, log, topological
 from sqlalchemy.orm import attributes, interfaces
 from sqlalchemy.orm import util as mapperutil
-from sqlalchemy.orm.mapper import _state_mapper
+from sqlalchemy.orm.mapper import _state_mapper, _dependency_sort_cache
 
 # Load lazily
 object_session = None
@@ -281,9 +281,17 @@ class UOWTransaction(object):
                 self.session._register_newly_persistent(elem.state)
 
     def _sort_dependencies(self):
-        nodes = topological.sort_with_cycles(self.dependencies,
-            [t.mapper for t in self.tasks.itervalues() if t.base_task is t]
-        )
+        # the ordering between mappers only changes when mappers are
+        # configured, so it's shared among flushes which touch the same
+        # set of mappers; only the per-state sort of cyclical mappers
+        # below is redone each time.
+        base_mappers = [t.mapper for t in self.tasks.itervalues()
+                                    if t.base_task is t]
+        key = (frozenset(self.dependencies), frozenset(base_mappers))
+        nodes = _dependency_sort_cache.get(key)
+        if nodes is None:
+            nodes = _dependency_sort_cache[key] = \
+                topological.sort_with_cycles(self.dependencies, base_mappers)
 
         ret = []
         for item, cycles in nodes:
@@ -16,7 +16,7 @@ regular DB-API connect() methods to be transparently managed by a
 SQLAlchemy connection pool.
 """
 
-import weakref, time, threading
+import weakref, time, threading, traceback
 
 from sqlalchemy import exc, log
 from sqlalchemy import queue as sqla_queue
@@ -59,7 +59,8 @@ class Pool(object):
     """Abstract base class for connection pools."""
 
     def __init__(self, creator, recycle=-1, echo=None, use_threadlocal=False,
-                 reset_on_return=True, listeners=None):
+                 reset_on_return=True, listeners=None, pre_ping=None,
+                 pre_ping_interval=0, record_timing=False, leak_threshold=None):
         """
         Construct a Pool.
 
@@ -98,6 +99,35 @@ class Pool(object):
           connections are created, checked out and checked in to the
           pool.
 
+        :param pre_ping: A callable which tests the liveness of a pooled
+          connection upon checkout; it receives the DB-API connection and
+          raises an exception if it's not usable.  If the test fails, the
+          connection is replaced.  If the exception is a
+          :class:`~sqlalchemy.exc.DisconnectionError`, indicating that
+          the database itself was lost, all other connections which were
+          opened before the failure are also replaced upon their next
+          checkout.  The value ``True`` is only accepted by
+          :func:`~sqlalchemy.create_engine` as ``pool_pre_ping=True``,
+          which supplies the dialect's
+          :meth:`~sqlalchemy.engine.base.Dialect.do_ping`, as the
+          statement to use varies by database.  Defaults to None.
+
+        :param pre_ping_interval: Number of seconds, since a connection was 
+          last checked in, within which the ``pre_ping`` test is skipped.
+          Defaults to 0, testing on every checkout.
+
+        :param record_timing: If True, the time spent waiting for each
+          checkout and the time each connection is held are recorded
+          in :attr:`metrics`, at the cost of a few calls to
+          ``time.time()`` per checkout.  Defaults to False.
+
+        :param leak_threshold: If set, number of seconds a connection
+          may remain checked out before it's considered leaked.  The
+          stack trace of each checkout is recorded; a connection
+          returned after the threshold logs a warning including the
+          stack, and :meth:`leaked` reports those currently held 
+          beyond it.  Defaults to None.
+
         """
         self.logger = log.instance_logger(self, echoflag=echo)
         self._threadconns = threading.local()
@@ -105,6 +135,20 @@ class Pool(object):
         self._recycle = recycle
         self._use_threadlocal = use_threadlocal
         self._reset_on_return = reset_on_return
+        if pre_ping is True:
+            raise exc.ArgumentError(
+                    "pre_ping requires a callable which tests a DB-API "
+                    "connection; create_engine(pool_pre_ping=True) "
+                    "supplies one for the dialect in use")
+        self._pre_ping = pre_ping or None
+        self._pre_ping_interval = pre_ping_interval
+        self._invalidate_time = 0
+        self._track_lastused = self._pre_ping is not None
+        self._record_timing = record_timing
+        self._leak_threshold = leak_threshold
+        self._track_checkout = record_timing or leak_threshold is not None
+        self._leak_records = set()
+        self.metrics = PoolMetrics()
         self.echo = echo
         self.listeners = []
         self._on_connect = []
@@ -159,6 +203,12 @@ class Pool(object):
         self.do_return_conn(record)
 
     def get(self):
+        self.metrics.checkouts += 1
+        if self._record_timing:
+            start = time.time()
+            rec = self.do_get()
+            self.metrics._wait(time.time() - start)
+            return rec
         return self.do_get()
 
     def do_get(self):
@@ -170,6 +220,45 @@ class Pool(object):
     def status(self):
         raise NotImplementedError()
 
+    def leaked(self):
+        """Return connections checked out for longer than ``leak_threshold``.
+
+        A list of ``(seconds, stack)`` tuples is returned, where ``stack``
+        is the formatted stack trace at the point of checkout.  Requires
+        the ``leak_threshold`` parameter.
+
+        """
+        if self._leak_threshold is None:
+            raise exc.InvalidRequestError(
+                    "Pool was not created with a leak_threshold")
+        now = time.time()
+        return [(now - rec.checkout_time, "".join(rec.checkout_stack))
+                for rec in list(self._leak_records)
+                if now - rec.checkout_time > self._leak_threshold]
+
+    def _checkout_tracked(self, rec):
+        rec.checkout_time = time.time()
+        if self._leak_threshold is not None:
+            rec.checkout_stack = traceback.format_stack()[:-2]
+            self._leak_records.add(rec)
+
+    def _checkin_tracked(self, rec):
+        held = time.time() - rec.checkout_time
+        if self._record_timing:
+            self.metrics._hold(held)
+        if self._leak_threshold is not None:
+            self._leak_records.discard(rec)
+            if held > self._leak_threshold:
+                self.logger.warn("Connection %r was held for %.1f seconds, "
+                            "exceeding leak_threshold; checked out at:\n%s",
+                            rec.connection, held, "".join(rec.checkout_stack))
+            rec.checkout_stack = None
+
+    def _warn_leaked(self):
+        for held, stack in self.leaked():
+            self.logger.warn("Connection checked out for %.1f seconds "
+                            "at:\n%s", held, stack)
+
     def add_listener(self, listener):
         """Add a ``PoolListener``-like object to this pool.
 
@@ -192,9 +281,91 @@ class Pool(object):
         if hasattr(listener, 'checkin'):
             self._on_checkin.append(listener)
 
+class PoolMetrics(object):
+    """Counters and timings collected by a :class:`Pool`.
+
+    Available as the ``metrics`` attribute of each pool.  Counters 
+    are maintained at all times; timings only when the pool is 
+    created with ``record_timing=True``.
+
+    :attr checkouts: number of connections checked out.
+
+    :attr timeouts: number of checkouts which raised ``TimeoutError``.
+
+    :attr recycles: number of connections replaced due to ``recycle``, 
+      ``pre_ping`` or pool maintenance.
+
+    :attr invalidations: number of connections invalidated, including
+      those which failed ``pre_ping``.
+
+    :attr overflow_high_water: largest overflow reached by a 
+      :class:`QueuePool`.
+
+    :attr wait_count, wait_time, max_wait_time: number of timed
+      checkouts, and the total and largest number of seconds spent 
+      obtaining a connection from the pool.
+
+    :attr hold_counts, hold_time, max_hold_time: number of timed
+      checkins within each bucket of ``hold_buckets``, the last entry
+      counting those above the largest bucket, and the total and
+      largest number of seconds connections were held.
+
+    """
+
+    hold_buckets = (.001, .01, .1, 1, 10, 60)
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Set all counters and timings to zero."""
+
+        self.checkouts = 0
+        self.timeouts = 0
+        self.recycles = 0
+        self.invalidations = 0
+        self.overflow_high_water = 0
+        self.wait_count = 0
+        self.wait_time = 0.0
+        self.max_wait_time = 0.0
+        self.hold_counts = [0] * (len(self.hold_buckets) + 1)
+        self.hold_time = 0.0
+        self.max_hold_time = 0.0
+
+    def _wait(self, seconds):
+        self.wait_count += 1
+        self.wait_time += seconds
+        if seconds > self.max_wait_time:
+            self.max_wait_time = seconds
+
+    def _hold(self, seconds):
+        self.hold_time += seconds
+        if seconds > self.max_hold_time:
+            self.max_hold_time = seconds
+        for i, limit in enumerate(self.hold_buckets):
+            if seconds <= limit:
+                self.hold_counts[i] += 1
+                break
+        else:
+            self.hold_counts[-1] += 1
+
+    def __repr__(self):
+        return "PoolMetrics(checkouts=%d, timeouts=%d, recycles=%d, "\
+                "invalidations=%d, overflow_high_water=%d, "\
+                "wait_time=%.3f, max_wait_time=%.3f, hold_time=%.3f, "\
+                "max_hold_time=%.3f)" % (
+                self.checkouts, self.timeouts, self.recycles, 
+                self.invalidations, self.overflow_high_water, 
+                self.wait_time, self.max_wait_time, self.hold_time, 
+                self.max_hold_time)
+
 class _ConnectionRecord(object):
+    __slots__ = '__pool', 'connection', 'info', 'starttime', 'lastused', \
+                'fairy', 'checkout_time', 'checkout_stack', '__weakref__'
+
     def __init__(self, pool):
         self.__pool = pool
+        self.fairy = self.checkout_time = self.checkout_stack = None
         self.connection = self.__connect()
         self.info = {}
         ls = pool.__dict__.pop('_on_first_connect', None)
@@ -222,27 +393,57 @@ class _ConnectionRecord(object):
                             self.connection, e.__class__.__name__, e)
         else:
             self.__pool.logger.info("Invalidate connection %r", self.connection)
+        self.__pool.metrics.invalidations += 1
         self.__close()
         self.connection = None
 
     def get_connection(self):
         if self.connection is None:
-            self.connection = self.__connect()
-            self.info.clear()
-            if self.__pool._on_connect:
-                for l in self.__pool._on_connect:
-                    l.connect(self.connection, self)
+            self.__reconnect()
         elif (self.__pool._recycle > -1 and time.time() - self.starttime > self.__pool._recycle):
             self.__pool.logger.info("Connection %r exceeded timeout; recycling",
                             self.connection)
-            self.__close()
-            self.connection = self.__connect()
-            self.info.clear()
-            if self.__pool._on_connect:
-                for l in self.__pool._on_connect:
-                    l.connect(self.connection, self)
+            self.recycle()
+        elif self.starttime < self.__pool._invalidate_time:
+            self.__pool.logger.info("Connection %r predates a failed ping; reconnecting",
+                            self.connection)
+            self.recycle()
+        elif self.__pool._pre_ping is not None and self.lastused is not None and \
+                time.time() - self.lastused >= self.__pool._pre_ping_interval:
+            try:
+                self.__pool._pre_ping(self.connection)
+            except Exception, e:
+                if isinstance(e, (SystemExit, KeyboardInterrupt)):
+                    raise
+                if isinstance(e, exc.DisconnectionError):
+                    self.__pool.logger.info("Connection %r failed ping (reason: %s:%s); "
+                                    "invalidating all pooled connections",
+                                    self.connection, e.__class__.__name__, e)
+                    self.__pool._invalidate_time = time.time()
+                else:
+                    self.__pool.logger.info("Connection %r failed ping (reason: %s:%s); "
+                                    "reconnecting",
+                                    self.connection, e.__class__.__name__, e)
+                self.__pool.metrics.invalidations += 1
+                self.__close()
+                self.__reconnect()
         return self.connection
 
+    def recycle(self):
+        """Replace the DB-API connection with a newly opened one."""
+
+        if self.connection is not None:
+            self.__close()
+            self.__pool.metrics.recycles += 1
+        self.__reconnect()
+
+    def __reconnect(self):
+        self.connection = self.__connect()
+        self.info.clear()
+        if self.__pool._on_connect:
+            for l in self.__pool._on_connect:
+                l.connect(self.connection, self)
+
     def __close(self):
         try:
             self.__pool.logger.debug("Closing connection %r", self.connection)
@@ -256,6 +457,7 @@ class _ConnectionRecord(object):
     def __connect(self):
         try:
             self.starttime = time.time()
+            self.lastused = None
             connection = self.__pool._creator()
             self.__pool.logger.debug("Created new connection %r", connection)
             return connection
@@ -264,6 +466,27 @@ class _ConnectionRecord(object):
             raise
 
 
+def _maintain_pool(ref, stop, interval):
+    pool = ref()
+    if pool is None:
+        return
+    try:
+        pool._warm()
+    except Exception, e:
+        pool.logger.warn("Error opening connections for pool: %s", e)
+    del pool
+
+    while not stop.isSet():
+        stop.wait(interval)
+        pool = ref()
+        if pool is None or stop.isSet():
+            return
+        try:
+            pool.maintain()
+        except Exception, e:
+            pool.logger.warn("Error during pool maintenance: %s", e)
+        del pool
+
 def _finalize_fairy(connection, connection_record, pool, ref=None):
     _refs.discard(connection_record)
         
@@ -284,6 +507,10 @@ def _finalize_fairy(connection, connection_record, pool, ref=None):
                 raise
     if connection_record is not None:
         connection_record.fairy = None
+        if pool._track_checkout:
+            pool._checkin_tracked(connection_record)
+        if pool._track_lastused:
+            connection_record.lastused = time.time()
         pool.logger.debug("Connection %r being returned to pool", connection)
         if pool._on_checkin:
             for l in pool._on_checkin:
@@ -305,6 +532,8 @@ class _ConnectionFairy(object):
             conn = self.connection = self._connection_record.get_connection()
             rec.fairy = weakref.ref(self, lambda ref:_finalize_fairy(conn, rec, pool, ref))
             _refs.add(rec)
+            if pool._track_checkout:
+                pool._checkout_tracked(rec)
         except:
             self.connection = None # helps with endless __getattr__ loops later on
             self._connection_record = None
@@ -401,6 +630,7 @@ class _ConnectionFairy(object):
 
         if self._connection_record is not None:
             _refs.remove(self._connection_record)
+            self._pool._leak_records.discard(self._connection_record)
             self._connection_record.fairy = None
             self._connection_record.connection = None
             self._pool.do_return_conn(self._connection_record)
@@ -485,7 +715,11 @@ class SingletonThreadPool(Pool):
             recycle=self._recycle, 
             echo=self.echo, 
             use_threadlocal=self._use_threadlocal, 
-            listeners=self.listeners)
+            listeners=self.listeners,
+            pre_ping=self._pre_ping,
+            pre_ping_interval=self._pre_ping_interval,
+            record_timing=self._record_timing,
+            leak_threshold=self._leak_threshold)
 
     def dispose(self):
         """Dispose of this pool."""
@@ -536,6 +770,7 @@ class QueuePool(Pool):
     """A Pool that imposes a limit on the number of open connections."""
 
     def __init__(self, creator, pool_size=5, max_overflow=10, timeout=30,
+                 use_lifo=False, maintenance_interval=None, idle_timeout=None,
                  **params):
         """
         Construct a QueuePool.
@@ -566,6 +801,28 @@ class QueuePool(Pool):
         :param timeout: The number of seconds to wait before giving up
           on returning a connection. Defaults to 30.
 
+        :param use_lifo: If True, the connection most recently returned
+          to the pool is the next one checked out, rather than the one
+          which has been idle the longest.  This keeps a smaller set
+          of connections in use under light load, allowing the remaining
+          ones to time out on the server side, or with ``pre_ping``, to
+          be tested less often.  Defaults to False.
+
+        :param maintenance_interval: If set, number of seconds between
+          runs of :meth:`maintain` by a background thread, which is 
+          started upon the first checkout, once that connection has
+          been opened and the pool's ``first_connect`` and ``connect``
+          listeners have run on it.  The thread first opens the rest
+          of the ``pool_size`` connections, so that subsequent
+          checkouts don't wait for them, and then keeps pooled connections
+          current, so that the cost of a reconnect doesn't fall on 
+          a checkout.  The thread exits when the pool is disposed 
+          or garbage collected.  Defaults to None.
+
+        :param idle_timeout: If set, number of seconds a connection may
+          remain unused in the pool before :meth:`maintain` closes it.
+          The pool then grows back on demand.  Defaults to None.
+
         :param recycle: If set to non -1, number of seconds between
           connection recycling, which means upon checkout, if this
           timeout is surpassed the connection will be closed and
@@ -597,20 +854,45 @@ class QueuePool(Pool):
           connections are created, checked out and checked in to the
           pool.
 
+        :param pre_ping: If True or a callable, test the liveness of
+          pooled connections upon checkout; see :class:`Pool`.
+
+        :param pre_ping_interval: Number of seconds since a connection 
+          was last checked in within which the ``pre_ping`` test is
+          skipped.  Defaults to 0.
+
+        :param record_timing: If True, record checkout wait times and
+          connection hold times in :attr:`metrics`; see :class:`Pool`.
+
+        :param leak_threshold: Number of seconds after which a checked out
+          connection is reported as leaked; see :class:`Pool`.
+
         """
         Pool.__init__(self, creator, **params)
-        self._pool = sqla_queue.Queue(pool_size)
+        self._pool = sqla_queue.Queue(pool_size, use_lifo=use_lifo)
         self._overflow = 0 - pool_size
         self._max_overflow = max_overflow
         self._timeout = timeout
         self._overflow_lock = self._max_overflow > -1 and threading.Lock() or None
+        self._maintenance_interval = maintenance_interval
+        self._idle_timeout = idle_timeout
+        if idle_timeout is not None:
+            self._track_lastused = True
+        self._maintenance_stop = None
+        self._maintenance_lock = threading.Lock()
 
     def recreate(self):
         self.logger.info("Pool recreating")
         return QueuePool(self._creator, pool_size=self._pool.maxsize, 
                           max_overflow=self._max_overflow, timeout=self._timeout, 
+                          use_lifo=self._pool.use_lifo, 
+                          maintenance_interval=self._maintenance_interval,
+                          idle_timeout=self._idle_timeout,
                           recycle=self._recycle, echo=self.echo, 
-                          use_threadlocal=self._use_threadlocal, listeners=self.listeners)
+                          use_threadlocal=self._use_threadlocal, listeners=self.listeners,
+                          pre_ping=self._pre_ping, pre_ping_interval=self._pre_ping_interval,
+                          record_timing=self._record_timing,
+                          leak_threshold=self._leak_threshold)
 
     def do_return_conn(self, conn):
         try:
@@ -626,14 +908,27 @@ class QueuePool(Pool):
                     self._overflow_lock.release()
 
     def do_get(self):
+        if self._maintenance_stop is None and self._maintenance_interval:
+            # the maintenance thread opens connections, so it's started
+            # only once the first one has been opened here, after any
+            # listeners were added to the pool.
+            rec = self._do_get()
+            self._start_maintenance()
+            return rec
+        return self._do_get()
+
+    def _do_get(self):
         try:
             wait = self._max_overflow > -1 and self._overflow >= self._max_overflow
             return self._pool.get(wait, self._timeout)
         except sqla_queue.Empty:
             if self._max_overflow > -1 and self._overflow >= self._max_overflow:
                 if not wait:
-                    return self.do_get()
+                    return self._do_get()
                 else:
+                    self.metrics.timeouts += 1
+                    if self._leak_threshold is not None:
+                        self._warn_leaked()
                     raise exc.TimeoutError("QueuePool limit of size %d overflow %d reached, connection timed out, timeout %d" % (self.size(), self.overflow(), self._timeout))
 
             if self._overflow_lock is not None:
@@ -642,17 +937,139 @@ class QueuePool(Pool):
             if self._max_overflow > -1 and self._overflow >= self._max_overflow:
                 if self._overflow_lock is not None:
                     self._overflow_lock.release()
-                return self.do_get()
+                return self._do_get()
 
             try:
                 con = self.create_connection()
                 self._overflow += 1
+                if self._overflow > self.metrics.overflow_high_water:
+                    self.metrics.overflow_high_water = self._overflow
             finally:
                 if self._overflow_lock is not None:
                     self._overflow_lock.release()
             return con
 
+    def _start_maintenance(self):
+        self._maintenance_lock.acquire()
+        try:
+            if self._maintenance_stop is not None:
+                return
+            stop = self._maintenance_stop = threading.Event()
+        finally:
+            self._maintenance_lock.release()
+            
+        # the thread references the pool weakly, and is stopped
+        # as soon as the pool is garbage collected
+        ref = weakref.ref(self, lambda ref: stop.set())
+        t = threading.Thread(target=_maintain_pool,
+                                args=(ref, stop, self._maintenance_interval))
+        t.setDaemon(True)
+        t.start()
+
+    def _warm(self):
+        """Open connections until there are ``pool_size`` in total."""
+
+        while True:
+            if self._overflow_lock is not None:
+                self._overflow_lock.acquire()
+            try:
+                if self._overflow >= 0:
+                    return
+                self._overflow += 1
+            finally:
+                if self._overflow_lock is not None:
+                    self._overflow_lock.release()
+            try:
+                rec = self.create_connection()
+            except:
+                self._discard_conn()
+                raise
+            self._put_back(rec)
+
+    def _discard_conn(self):
+        if self._overflow_lock is None:
+            self._overflow -= 1
+        else:
+            self._overflow_lock.acquire()
+            try:
+                self._overflow -= 1
+            finally:
+                self._overflow_lock.release()
+
+    def maintain(self):
+        """Close or replace connections which are idle in the pool.
+
+        Connections unused for longer than ``idle_timeout`` are closed
+        and removed from the pool.  Connections which would exceed
+        ``recycle`` before the next run, which predate a failed
+        ``pre_ping``, or which were invalidated, are replaced with
+        new connections.  Each connection is taken out of the pool
+        only while it's being closed or replaced, so that checkouts
+        made meanwhile can use the others.  Called periodically when
+        ``maintenance_interval`` is set, and may also be called
+        directly.
+
+        """
+        now = time.time()
+        if self._recycle > -1:
+            recycle_before = now - self._recycle + \
+                                    (self._maintenance_interval or 0)
+        else:
+            recycle_before = 0
+
+        # records are taken out of the queue one at a time, only while
+        # they're being handled, so that the rest remain available to
+        # checkouts.  a record is checked again once taken, as it may
+        # have been checked out and returned in the meantime.
+        for rec in self._pool.items():
+            action = self._maintenance_action(rec, now, recycle_before)
+            if action is None or not self._pool.remove(rec):
+                continue
+            action = self._maintenance_action(rec, now, recycle_before)
+            if action == 'recycle':
+                self.logger.info("Connection %r being replaced by pool maintenance",
+                                rec.connection)
+                try:
+                    rec.recycle()
+                except Exception, e:
+                    if isinstance(e, (SystemExit, KeyboardInterrupt)):
+                        raise
+                    # leave it to be reconnected upon checkout
+                    self.logger.warn("Error replacing connection: %s", e)
+                    rec.connection = None
+                self._put_back(rec)
+            elif action == 'close':
+                self.logger.info("Connection %r idle for more than %d seconds; closing",
+                                rec.connection, self._idle_timeout)
+                rec.close()
+                self._discard_conn()
+            else:
+                self._put_back(rec)
+
+    def _maintenance_action(self, rec, now, recycle_before):
+        if rec.connection is None or \
+                rec.starttime < self._invalidate_time or \
+                rec.starttime < recycle_before:
+            return 'recycle'
+        elif self._idle_timeout is not None and \
+                now - (rec.lastused or rec.starttime) > self._idle_timeout:
+            return 'close'
+        else:
+            return None
+
+    def _put_back(self, rec):
+        """Return a record opened or replaced by maintenance to the
+        queue, closing it if the queue has been filled meanwhile."""
+
+        try:
+            self._pool.put(rec, False)
+        except sqla_queue.Full:
+            rec.close()
+            self._discard_conn()
+
     def dispose(self):
+        if self._maintenance_stop is not None:
+            self._maintenance_stop.set()
         while True:
             try:
                 conn = self._pool.get(False)
@@ -710,7 +1127,11 @@ class NullPool(Pool):
             recycle=self._recycle, 
             echo=self.echo, 
             use_threadlocal=self._use_threadlocal, 
-            listeners=self.listeners)
+            listeners=self.listeners,
+            pre_ping=self._pre_ping,
+            pre_ping_interval=self._pre_ping_interval,
+            record_timing=self._record_timing,
+            leak_threshold=self._leak_threshold)
 
     def dispose(self):
         pass
@@ -773,7 +1194,11 @@ class StaticPool(Pool):
                               use_threadlocal=self._use_threadlocal,
                               reset_on_return=self._reset_on_return,
                               echo=self.echo,
-                              listeners=self.listeners)
+                              listeners=self.listeners,
+                              pre_ping=self._pre_ping,
+                              pre_ping_interval=self._pre_ping_interval,
+                              record_timing=self._record_timing,
+                              leak_threshold=self._leak_threshold)
 
     def create_connection(self):
         return self._conn
@@ -823,7 +1248,11 @@ class AssertionPool(Pool):
 
     def recreate(self):
         self.logger.info("Pool recreating")
-        return AssertionPool(self._creator, echo=self.echo, listeners=self.listeners)
+        return AssertionPool(self._creator, echo=self.echo, listeners=self.listeners,
+                            pre_ping=self._pre_ping, 
+                            pre_ping_interval=self._pre_ping_interval,
+                            record_timing=self._record_timing,
+                            leak_threshold=self._leak_threshold)
         
     def do_get(self):
         if self._checked_out:
@@ -5,7 +5,13 @@ This is to support the connection pool's usage of weakref callbacks to return
 connections to the underlying Queue, which can in extremely
 rare cases be invoked within the ``get()`` method of the Queue itself,
 producing a ``put()`` inside the ``get()`` and therefore a reentrant
-condition."""
+condition.
+
+``get()`` and ``put()`` don't acquire the mutex when an item or a free
+slot is immediately available and no other thread is waiting, relying on 
+the atomicity of ``deque.append()`` and ``deque.pop()``.  As a 
+consequence, concurrent calls to ``put()`` may exceed ``maxsize`` 
+by a small amount.  The queue can also be used in LIFO order."""
 
 from collections import deque
 from time import time as _time
@@ -24,12 +30,16 @@ class Full(Exception):
     pass
 
 class Queue:
-    def __init__(self, maxsize=0):
+    def __init__(self, maxsize=0, use_lifo=False):
         """Initialize a queue object with a given maximum size.
 
         If `maxsize` is <= 0, the queue size is infinite.
+
+        If `use_lifo` is True, the most recently put item is the
+        next one returned by get().
         """
 
+        self.use_lifo = use_lifo
         self._init(maxsize)
         # mutex must be held whenever the queue is mutating.  All methods
         # that acquire mutex must release it before returning.  mutex
@@ -42,6 +52,10 @@ class Queue:
         # Notify not_full whenever an item is removed from the queue;
         # a thread waiting to put is notified then.
         self.not_full = threading.Condition(self.mutex)
+        # Number of threads waiting on not_empty and not_full.  Only
+        # changed while mutex is held; when zero, get() and put() 
+        # needn't notify.
+        self._get_waiters = self._put_waiters = 0
 
     def qsize(self):
         """Return the approximate size of the queue (not reliable!)."""
@@ -80,7 +94,14 @@ class Queue:
         (`timeout` is ignored in that case).
         """
 
+        if not self._put_waiters and not self._full():
+            self._put(item)
+            if self._get_waiters:
+                self._notify(self.not_empty)
+            return
+            
         self.not_full.acquire()
+        self._put_waiters += 1
         try:
             if not block:
                 if self._full():
@@ -100,6 +121,7 @@ class Queue:
             self._put(item)
             self.not_empty.notify()
         finally:
+            self._put_waiters -= 1
             self.not_full.release()
 
     def put_nowait(self, item):
@@ -122,27 +144,50 @@ class Queue:
         ``Empty`` exception (`timeout` is ignored in that case).
         """
 
+        # threads already waiting are served first
+        if not self._get_waiters:
+            try:
+                item = self._get()
+            except IndexError:
+                if not block:
+                    raise Empty
+            else:
+                if self._put_waiters:
+                    self._notify(self.not_full)
+                return item
+            
         self.not_empty.acquire()
+        self._get_waiters += 1
         try:
             if not block:
-                if self._empty():
+                try:
+                    item = self._get()
+                except IndexError:
                     raise Empty
             elif timeout is None:
-                while self._empty():
-                    self.not_empty.wait()
+                while True:
+                    try:
+                        item = self._get()
+                        break
+                    except IndexError:
+                        self.not_empty.wait()
             else:
                 if timeout < 0:
                     raise ValueError("'timeout' must be a positive number")
                 endtime = _time() + timeout
-                while self._empty():
-                    remaining = endtime - _time()
-                    if remaining <= 0.0:
-                        raise Empty
-                    self.not_empty.wait(remaining)
-            item = self._get()
+                while True:
+                    try:
+                        item = self._get()
+                        break
+                    except IndexError:
+                        remaining = endtime - _time()
+                        if remaining <= 0.0:
+                            raise Empty
+                        self.not_empty.wait(remaining)
             self.not_full.notify()
             return item
         finally:
+            self._get_waiters -= 1
             self.not_empty.release()
 
     def get_nowait(self):
@@ -154,9 +199,37 @@ class Queue:
 
         return self.get(False)
 
+    def remove(self, item):
+        """Remove the given item from the queue, if present.
+
+        Return True if it was removed, or False if it wasn't in the
+        queue, such as when another thread has already taken it.
+        """
+
+        try:
+            self._remove(item)
+        except ValueError:
+            return False
+        if self._put_waiters:
+            self._notify(self.not_full)
+        return True
+
+    def items(self):
+        """Return a list of the items in the queue (not reliable!)."""
+
+        return self._items()
+
+    def _notify(self, condition):
+        condition.acquire()
+        try:
+            condition.notify()
+        finally:
+            condition.release()
+
     # Override these methods to implement other queue organizations
     # (e.g. stack or priority queue).
-    # These will only be called with appropriate locks held
+    # These may be called without the mutex held, and so must be 
+    # atomic; _get() raises IndexError if the queue is empty.
 
     # Initialize the queue representation
     def _init(self, maxsize):
@@ -172,7 +245,7 @@ class Queue:
 
     # Check whether the queue is full
     def _full(self):
-        return self.maxsize > 0 and len(self.queue) == self.maxsize
+        return self.maxsize > 0 and len(self.queue) >= self.maxsize
 
     # Put a new item in the queue
     def _put(self, item):
@@ -180,4 +253,15 @@ class Queue:
 
     # Get an item from the queue
     def _get(self):
-        return self.queue.popleft()
+        if self.use_lifo:
+            return self.queue.pop()
+        else:
+            return self.queue.popleft()
+
+    # Remove a given item from the queue; raises ValueError if absent
+    def _remove(self, item):
+        self.queue.remove(item)
+
+    # Return a copy of the items in the queue
+    def _items(self):
+        return list(self.queue)
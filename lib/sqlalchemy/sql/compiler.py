@@ -236,35 +236,40 @@ class SQLCompiler(engine.Compiled):
     def sql_compiler(self):
         return self
         
+    @util.memoized_property
+    def _bind_plan(self):
+        """A tuple of (bindparam, compiled name, key) for each bind
+        parameter, used by construct_params()."""
+
+        return tuple((bindparam, name, bindparam.key) 
+                        for bindparam, name in self.bind_names.iteritems())
+
     def construct_params(self, params=None, _group_number=None):
         """return a dictionary of bind parameter keys and values"""
 
+        pd = {}
         if params:
-            pd = {}
-            for bindparam, name in self.bind_names.iteritems():
-                for paramname in (bindparam.key, name):
-                    if paramname in params:
-                        pd[name] = params[paramname]
-                        break
-                else:
-                    if bindparam.required:
-                        if _group_number:
-                            raise exc.InvalidRequestError("A value is required for bind parameter %r, in parameter group %d" % (bindparam.key, _group_number))
-                        else:
-                            raise exc.InvalidRequestError("A value is required for bind parameter %r" % bindparam.key)
-                    elif util.callable(bindparam.value):
-                        pd[name] = bindparam.value()
+            for bindparam, name, key in self._bind_plan:
+                if key in params:
+                    pd[name] = params[key]
+                elif name in params:
+                    pd[name] = params[name]
+                elif bindparam.required:
+                    if _group_number:
+                        raise exc.InvalidRequestError("A value is required for bind parameter %r, in parameter group %d" % (bindparam.key, _group_number))
                     else:
-                        pd[name] = bindparam.value
-            return pd
+                        raise exc.InvalidRequestError("A value is required for bind parameter %r" % bindparam.key)
+                elif util.callable(bindparam.value):
+                    pd[name] = bindparam.value()
+                else:
+                    pd[name] = bindparam.value
         else:
-            pd = {}
-            for bindparam in self.bind_names:
+            for bindparam, name, key in self._bind_plan:
                 if util.callable(bindparam.value):
-                    pd[self.bind_names[bindparam]] = bindparam.value()
+                    pd[name] = bindparam.value()
                 else:
-                    pd[self.bind_names[bindparam]] = bindparam.value
-            return pd
+                    pd[name] = bindparam.value
+        return pd
 
     params = property(construct_params, doc="""
         Return the bind params for this compiled object.
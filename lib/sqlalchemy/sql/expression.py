@@ -902,6 +902,51 @@ def _cloned_intersection(a, b):
     all_overlap = set(_expand_cloned(a)).intersection(_expand_cloned(b))
     return set(elem for elem in a if all_overlap.intersection(elem._cloned_set))
 
+# marker placed in the "anon_map" of a cache key generation
+# by elements which can't produce a key.
+_uncacheable = util.symbol('uncacheable')
+
+_anon_id_re = re.compile(r'%\((\d+) ')
+
+def _anon_cache_key(name, anon_map):
+    """return a cache key for a name which may be a _generated_label.
+
+    The id() values embedded in anonymous names are replaced by their
+    order of appearance within the statement being keyed.
+
+    """
+    if isinstance(name, _generated_label):
+        return _generated_label, _anon_id_re.sub(
+                    lambda m: '%%(%d ' %
+                        anon_map.setdefault(int(m.group(1)), len(anon_map)),
+                    name)
+    else:
+        return name
+
+def _from_cache_key(fromclause, anon_map):
+    """return a cache key referencing the given FROM clause.
+
+    Tables are referenced directly.  Other selectables are referenced
+    by their order of appearance within the statement being keyed,
+    along with that of each of their cloned predecessors, which are
+    significant when FROM clauses are correlated.
+
+    """
+    if isinstance(fromclause, TableClause):
+        return fromclause
+    key = []
+    f = fromclause
+    while f is not None:
+        key.append(anon_map.setdefault(id(f), len(anon_map)))
+        f = getattr(f, '_is_clone_of', None)
+    return tuple(key)
+
+def _cache_key_or_none(element, anon_map, nodes):
+    if element is None:
+        return None
+    else:
+        return element._gen_cache_key(anon_map, nodes)
+
 def _compound_select(keyword, *selects, **kwargs):
     return CompoundSelect(keyword, *selects, **kwargs)
 
@@ -1146,6 +1191,40 @@ class ClauseElement(Visitable):
         """
         pass
 
+    def _gen_cache_key(self, anon_map, nodes):
+        """Return a hashable key describing the structure of this
+        ClauseElement, not including the values of bind parameters.
+
+        Two statements with equal keys compile to the same SQL.
+        ``anon_map`` maps the id() of anonymous elements to their order
+        of appearance, and ``nodes`` receives each element visited, in
+        order, so that bind parameters and result columns can be located
+        positionally within a structurally identical statement.
+
+        Subclasses override this; the default marks the statement as
+        uncacheable.
+
+        """
+        anon_map[_uncacheable] = True
+        return None
+
+    def _cache_key(self):
+        """Return a hashable key describing the structure of this
+        ClauseElement, or None if the element can't be cached.
+
+        The key is much cheaper to produce than a compiled statement,
+        and two statements which differ only in the values of their
+        bind parameters produce equal keys.  Tables and columns are
+        part of the key by identity, so a key is only meaningful while
+        the :class:`.Table` objects it refers to are in use.
+
+        """
+        anon_map = {}
+        key = self._gen_cache_key(anon_map, [])
+        if _uncacheable in anon_map:
+            return None
+        return key
+
     def get_children(self, **kwargs):
         """Return immediate child elements of this :class:`ClauseElement`.
 
@@ -2173,6 +2252,16 @@ class _BindParamClause(ColumnElement):
             self.unique = True
             self.key = _generated_label("%%(%d %s)s" % (id(self), self._orig_key or 'param'))
 
+    def _gen_cache_key(self, anon_map, nodes):
+        nodes.append(self)
+        return (
+            self.__class__,
+            _anon_cache_key(self.key, anon_map),
+            self.type._cache_key,
+            self.required,
+            self.isoutparam
+        )
+
     def bind_processor(self, dialect):
         return self.type.dialect_impl(dialect).bind_processor(dialect)
 
@@ -2210,6 +2299,10 @@ class _TypeClause(ClauseElement):
     def __init__(self, type):
         self.type = type
 
+    def _gen_cache_key(self, anon_map, nodes):
+        nodes.append(self)
+        return (self.__class__, self.type._cache_key)
+
 
 class _Generative(object):
     """Allow a ClauseElement to generate itself via the
@@ -2249,8 +2342,13 @@ class Executable(_Generative):
           
         * stream_results - indicate to the dialect that results should be 
           "streamed" and not pre-buffered, if possible.  This is a limitation
-          of many DBAPIs.  The flag is currently understood only by the
-          psycopg2 dialect.
+          of many DBAPIs.  The flag is understood by the psycopg2 dialect
+          (server side cursors), the mysql-python dialect (``SSCursor``),
+          and the cx_oracle and pyodbc dialects, whose cursors stream
+          natively.  Other dialects ignore it.
+
+        * max_row_buffer - when results are streamed, the largest number
+          of rows fetched from the cursor at a time.  Defaults to 100.
 
         """
         self._execution_options = self._execution_options.union(kw)
@@ -2317,6 +2415,21 @@ class _TextClause(Executable, ClauseElement):
     def get_children(self, **kwargs):
         return self.bindparams.values()
 
+    def _gen_cache_key(self, anon_map, nodes):
+        nodes.append(self)
+        if self.typemap is not None:
+            typemap = tuple([(k, self.typemap[k]._cache_key)
+                                for k in sorted(self.typemap)])
+        else:
+            typemap = None
+        return (
+            self.__class__,
+            self.text,
+            tuple([(k, self.bindparams[k]._gen_cache_key(anon_map, nodes)) 
+                                for k in sorted(self.bindparams)]),
+            typemap
+        )
+
 
 class _Null(ColumnElement):
     """Represent the NULL keyword in a SQL statement.
@@ -2330,6 +2443,10 @@ class _Null(ColumnElement):
     def __init__(self):
         self.type = sqltypes.NULLTYPE
 
+    def _gen_cache_key(self, anon_map, nodes):
+        nodes.append(self)
+        return (self.__class__,)
+
 
 class ClauseList(ClauseElement):
     """Describe a list of clauses, separated by an operator.
@@ -2385,6 +2502,14 @@ class ClauseList(ClauseElement):
     def get_children(self, **kwargs):
         return self.clauses
 
+    def _gen_cache_key(self, anon_map, nodes):
+        nodes.append(self)
+        return (
+            self.__class__,
+            self.operator,
+            tuple([c._gen_cache_key(anon_map, nodes) for c in self.clauses])
+        )
+
     @property
     def _from_objects(self):
         return list(itertools.chain(*[c._from_objects for c in self.clauses]))
@@ -2483,6 +2608,18 @@ class _Case(ColumnElement):
         if self.else_ is not None:
             self.else_ = clone(self.else_)
 
+    def _gen_cache_key(self, anon_map, nodes):
+        nodes.append(self)
+        return (
+            self.__class__,
+            _cache_key_or_none(self.value, anon_map, nodes),
+            tuple([(x._gen_cache_key(anon_map, nodes), 
+                    y._gen_cache_key(anon_map, nodes)) 
+                    for x, y in self.whens]),
+            _cache_key_or_none(self.else_, anon_map, nodes),
+            self.type is not None and self.type._cache_key
+        )
+
     def get_children(self, **kwargs):
         if self.value is not None:
             yield self.value
@@ -2558,6 +2695,16 @@ class Function(FunctionElement):
     def _bind_param(self, obj):
         return _BindParamClause(self.name, obj, _fallback_type=self.type, unique=True)
 
+    def _gen_cache_key(self, anon_map, nodes):
+        nodes.append(self)
+        return (
+            self.__class__,
+            self.name,
+            tuple(self.packagenames),
+            self.clause_expr._gen_cache_key(anon_map, nodes),
+            self.type._cache_key
+        )
+
 
 class _Cast(ColumnElement):
 
@@ -2575,6 +2722,14 @@ class _Cast(ColumnElement):
     def get_children(self, **kwargs):
         return self.clause, self.typeclause
 
+    def _gen_cache_key(self, anon_map, nodes):
+        nodes.append(self)
+        return (
+            self.__class__,
+            self.clause._gen_cache_key(anon_map, nodes),
+            self.typeclause._gen_cache_key(anon_map, nodes)
+        )
+
     @property
     def _from_objects(self):
         return self.clause._from_objects
@@ -2595,6 +2750,14 @@ class _Extract(ColumnElement):
     def get_children(self, **kwargs):
         return self.expr,
 
+    def _gen_cache_key(self, anon_map, nodes):
+        nodes.append(self)
+        return (
+            self.__class__,
+            self.field,
+            self.expr._gen_cache_key(anon_map, nodes)
+        )
+
     @property
     def _from_objects(self):
         return self.expr._from_objects
@@ -2622,6 +2785,16 @@ class _UnaryExpression(ColumnElement):
     def get_children(self, **kwargs):
         return self.element,
 
+    def _gen_cache_key(self, anon_map, nodes):
+        nodes.append(self)
+        return (
+            self.__class__,
+            self.element._gen_cache_key(anon_map, nodes),
+            self.operator,
+            self.modifier,
+            self.type._cache_key
+        )
+
     def compare(self, other, **kw):
         """Compare this :class:`_UnaryExpression` against the given :class:`ClauseElement`."""
 
@@ -2683,6 +2856,17 @@ class _BinaryExpression(ColumnElement):
     def get_children(self, **kwargs):
         return self.left, self.right
 
+    def _gen_cache_key(self, anon_map, nodes):
+        nodes.append(self)
+        return (
+            self.__class__,
+            self.left._gen_cache_key(anon_map, nodes),
+            self.right._gen_cache_key(anon_map, nodes),
+            self.operator,
+            tuple(sorted(self.modifiers.iteritems())),
+            self.type._cache_key
+        )
+
     def compare(self, other, **kw):
         """Compare this :class:`_BinaryExpression` against the given :class:`_BinaryExpression`."""
 
@@ -2819,6 +3003,17 @@ class Join(FromClause):
     def get_children(self, **kwargs):
         return self.left, self.right, self.onclause
 
+    def _gen_cache_key(self, anon_map, nodes):
+        nodes.append(self)
+        return (
+            self.__class__,
+            _from_cache_key(self, anon_map),
+            self.left._gen_cache_key(anon_map, nodes),
+            self.right._gen_cache_key(anon_map, nodes),
+            self.onclause._gen_cache_key(anon_map, nodes),
+            self.isouter
+        )
+
     def _match_primaries(self, primary, secondary):
         global sql_util
         if not sql_util:
@@ -2932,6 +3127,15 @@ class Alias(FromClause):
         for col in self.element.columns:
             col._make_proxy(self)
 
+    def _gen_cache_key(self, anon_map, nodes):
+        nodes.append(self)
+        return (
+            self.__class__,
+            _from_cache_key(self, anon_map),
+            _anon_cache_key(self.name, anon_map),
+            self.element._gen_cache_key(anon_map, nodes)
+        )
+
     def _copy_internals(self, clone=_clone):
         self._reset_exported()
         self.element = _clone(self.element)
@@ -2975,6 +3179,13 @@ class _Grouping(ColumnElement):
     def get_children(self, **kwargs):
         return self.element,
 
+    def _gen_cache_key(self, anon_map, nodes):
+        nodes.append(self)
+        return (
+            self.__class__,
+            self.element._gen_cache_key(anon_map, nodes)
+        )
+
     @property
     def _from_objects(self):
         return self.element._from_objects
@@ -3007,6 +3218,13 @@ class _FromGrouping(FromClause):
     def get_children(self, **kwargs):
         return self.element,
 
+    def _gen_cache_key(self, anon_map, nodes):
+        nodes.append(self)
+        return (
+            self.__class__,
+            self.element._gen_cache_key(anon_map, nodes)
+        )
+
     def _copy_internals(self, clone=_clone):
         self.element = clone(self.element)
 
@@ -3073,6 +3291,16 @@ class _Label(ColumnElement):
     def get_children(self, **kwargs):
         return self.element,
 
+    def _gen_cache_key(self, anon_map, nodes):
+        nodes.append(self)
+        return (
+            self.__class__,
+            _anon_cache_key(self.name, anon_map),
+            self.element._gen_cache_key(anon_map, nodes),
+            self.type._cache_key,
+            self.quote
+        )
+
     def _copy_internals(self, clone=_clone):
         self.element = clone(self.element)
 
@@ -3125,6 +3353,26 @@ class ColumnClause(_Immutable, ColumnElement):
         self.type = sqltypes.to_instance(type_)
         self.is_literal = is_literal
 
+    def _gen_cache_key(self, anon_map, nodes):
+        nodes.append(self)
+        if isinstance(self.table, TableClause):
+            # columns of a table are keyed on identity; hash()
+            # rather than id() so that annotated copies
+            # key the same as the original column.
+            return hash(self)
+        elif self.table is not None:
+            table = _from_cache_key(self.table, anon_map)
+        else:
+            table = None
+        return (
+            self.__class__,
+            self.name,
+            table,
+            self.is_literal,
+            getattr(self, 'quote', None),
+            self.type._cache_key
+        )
+
     @util.memoized_property
     def description(self):
         # Py3K
@@ -3216,6 +3464,10 @@ class TableClause(_Immutable, FromClause):
         return self.name.encode('ascii', 'backslashreplace')
         # end Py2K
 
+    def _gen_cache_key(self, anon_map, nodes):
+        nodes.append(self)
+        return self
+
     def append_column(self, c):
         self._columns[c.name] = c
         c.table = self
@@ -3487,6 +3739,22 @@ class CompoundSelect(_SelectBaseMixin, FromClause):
         return (column_collections and list(self.c) or []) + \
             [self._order_by_clause, self._group_by_clause] + list(self.selects)
 
+    def _gen_cache_key(self, anon_map, nodes):
+        nodes.append(self)
+        return (
+            self.__class__,
+            _from_cache_key(self, anon_map),
+            self.keyword,
+            tuple([s._gen_cache_key(anon_map, nodes) for s in self.selects]),
+            self._order_by_clause._gen_cache_key(anon_map, nodes),
+            self._group_by_clause._gen_cache_key(anon_map, nodes),
+            self.use_labels,
+            self.for_update,
+            self._limit,
+            self._offset,
+            self._should_correlate
+        )
+
     def bind(self):
         if self._bind:
             return self._bind
@@ -3647,6 +3915,34 @@ class Select(_SelectBaseMixin, FromClause):
                 return True
         return False
 
+    def _gen_cache_key(self, anon_map, nodes):
+        nodes.append(self)
+        if isinstance(self._distinct, (list, tuple)):
+            distinct = tuple([
+                        isinstance(c, basestring) and c or 
+                        c._gen_cache_key(anon_map, nodes)
+                        for c in self._distinct])
+        else:
+            distinct = self._distinct
+        return (
+            self.__class__,
+            _from_cache_key(self, anon_map),
+            tuple([c._gen_cache_key(anon_map, nodes) for c in self._raw_columns]),
+            tuple([f._gen_cache_key(anon_map, nodes) for f in self._froms]),
+            _cache_key_or_none(self._whereclause, anon_map, nodes),
+            _cache_key_or_none(self._having, anon_map, nodes),
+            self._order_by_clause._gen_cache_key(anon_map, nodes),
+            self._group_by_clause._gen_cache_key(anon_map, nodes),
+            tuple([p._gen_cache_key(anon_map, nodes) for p in self._prefixes]),
+            distinct,
+            self.use_labels,
+            self.for_update,
+            self._limit,
+            self._offset,
+            self._should_correlate,
+            frozenset([_from_cache_key(f, anon_map) for f in self._correlate])
+        )
+
     def _copy_internals(self, clone=_clone):
         self._reset_exported()
         from_cloned = dict((f, clone(f))
@@ -3982,6 +4278,12 @@ class _UpdateBase(Executable, ClauseElement):
         
         """
         self._returning = cols
+
+    def _returning_cache_key(self, anon_map, nodes):
+        if self._returning:
+            return tuple([c._gen_cache_key(anon_map, nodes) for c in self._returning])
+        else:
+            return None
         
 class _ValuesBase(_UpdateBase):
 
@@ -3991,6 +4293,23 @@ class _ValuesBase(_UpdateBase):
         self.table = table
         self.parameters = self._process_colparams(values)
 
+    def _parameters_cache_key(self, anon_map, nodes):
+        if not self.parameters:
+            return None
+        key = []
+        for k, v in sorted(
+                        [(_column_as_key(k), v) for k, v in self.parameters.iteritems()], 
+                        key=operator.itemgetter(0)):
+            if _is_literal(v):
+                # literal values become bind parameters,
+                # and aren't part of the key
+                key.append((k, None))
+            else:
+                if hasattr(v, '__clause_element__'):
+                    v = v.__clause_element__()
+                key.append((k, v._gen_cache_key(anon_map, nodes)))
+        return tuple(key)
+
     @_generative
     def values(self, *args, **kwargs):
         """specify the VALUES clause for an INSERT statement, or the SET clause for an
@@ -4052,6 +4371,19 @@ class Insert(_ValuesBase):
         else:
             return ()
 
+    def _gen_cache_key(self, anon_map, nodes):
+        nodes.append(self)
+        return (
+            self.__class__,
+            self.table,
+            self._parameters_cache_key(anon_map, nodes),
+            _cache_key_or_none(self.select, anon_map, nodes),
+            tuple([p._gen_cache_key(anon_map, nodes) for p in self._prefixes]),
+            self._returning_cache_key(anon_map, nodes),
+            self.inline,
+            tuple(sorted(self.kwargs.iteritems()))
+        )
+
     def _copy_internals(self, clone=_clone):
         # TODO: coverage
         self.parameters = self.parameters.copy()
@@ -4101,6 +4433,18 @@ class Update(_ValuesBase):
         else:
             return ()
 
+    def _gen_cache_key(self, anon_map, nodes):
+        nodes.append(self)
+        return (
+            self.__class__,
+            self.table,
+            self._parameters_cache_key(anon_map, nodes),
+            _cache_key_or_none(self._whereclause, anon_map, nodes),
+            self._returning_cache_key(anon_map, nodes),
+            self.inline,
+            tuple(sorted(self.kwargs.iteritems()))
+        )
+
     def _copy_internals(self, clone=_clone):
         # TODO: coverage
         self._whereclause = clone(self._whereclause)
@@ -4160,6 +4504,16 @@ class Delete(_UpdateBase):
         else:
             self._whereclause = _literal_as_text(whereclause)
 
+    def _gen_cache_key(self, anon_map, nodes):
+        nodes.append(self)
+        return (
+            self.__class__,
+            self.table,
+            _cache_key_or_none(self._whereclause, anon_map, nodes),
+            self._returning_cache_key(anon_map, nodes),
+            tuple(sorted(self.kwargs.iteritems()))
+        )
+
     def _copy_internals(self, clone=_clone):
         # TODO: coverage
         self._whereclause = clone(self._whereclause)
@@ -4172,6 +4526,10 @@ class _IdentifiedClause(Executable, ClauseElement):
     def __init__(self, ident):
         self.ident = ident
 
+    def _gen_cache_key(self, anon_map, nodes):
+        nodes.append(self)
+        return (self.__class__, self.ident)
+
 class SavepointClause(_IdentifiedClause):
     __visit_name__ = 'savepoint'
 
@@ -204,6 +204,12 @@ def sane_rowcount(fn):
         fn,
         skip_if(lambda: not testing.db.dialect.supports_sane_rowcount)
     )
+
+def sane_multi_rowcount(fn):
+    return _chain_decorators_on(
+        fn,
+        skip_if(lambda: not testing.db.dialect.supports_sane_multi_rowcount)
+    )
     
 def python2(fn):
     return _chain_decorators_on(
@@ -88,6 +88,19 @@ class AbstractType(Visitable):
         """
         return False
 
+    def tracks_mutations(self):
+        """Return True if in-place changes to ``dict`` and ``list`` values
+        of this type should be tracked as they occur.
+        
+        The ORM then stores such values as :class:`~sqlalchemy.orm.attributes.MutableDict`
+        and :class:`~sqlalchemy.orm.attributes.MutableList` wrappers,
+        which flag their owning instance as modified when changed,
+        instead of comparing each value to a copy at flush time
+        as for :meth:`is_mutable`.
+        
+        """
+        return False
+
     def get_dbapi_type(self, dbapi):
         """Return the corresponding type object from the underlying DB-API, if
         any.
@@ -120,6 +133,30 @@ class AbstractType(Visitable):
     def _compare_type_affinity(self, other):
         return self._type_affinity is other._type_affinity
 
+    @util.memoized_property
+    def _cache_key(self):
+        """Return a hashable key describing this type, for use within
+        the cache key of a SQL expression.
+
+        The key consists of the type's class and public attributes; if
+        any of those aren't hashable, the type object itself is used.
+
+        """
+        key = [self.__class__]
+        for k, v in sorted(self.__dict__.iteritems()):
+            if k.startswith('_'):
+                continue
+            if isinstance(v, AbstractType):
+                v = v._cache_key
+            key.append((k, v))
+        key = tuple(key)
+        try:
+            hash(key)
+        except TypeError:
+            return self
+        else:
+            return key
+
     def __repr__(self):
         return "%s(%s)" % (
             self.__class__.__name__,
@@ -144,6 +181,7 @@ class TypeEngine(AbstractType):
     def __getstate__(self):
         d = self.__dict__.copy()
         d.pop('_impl_dict', None)
+        d.pop('_cache_key', None)
         return d
 
     def bind_processor(self, dialect):
@@ -369,6 +407,7 @@ class TypeDecorator(AbstractType):
     def copy(self):
         instance = self.__class__.__new__(self.__class__)
         instance.__dict__.update(self.__dict__)
+        instance.__dict__.pop('_cache_key', None)
         instance._impl_dict = {}
         return instance
 
@@ -384,6 +423,9 @@ class TypeDecorator(AbstractType):
     def is_mutable(self):
         return self.impl.is_mutable()
 
+    def tracks_mutations(self):
+        return self.impl.tracks_mutations()
+
 class MutableType(object):
     """A mixin that marks a Type as holding a mutable object.
 
@@ -1266,7 +1308,8 @@ class PickleType(MutableType, TypeDecorator):
 
     impl = LargeBinary
 
-    def __init__(self, protocol=pickle.HIGHEST_PROTOCOL, pickler=None, mutable=True, comparator=None):
+    def __init__(self, protocol=pickle.HIGHEST_PROTOCOL, pickler=None, mutable=True, 
+                    comparator=None, track_mutations=False):
         """
         Construct a PickleType.
 
@@ -1286,11 +1329,19 @@ class PickleType(MutableType, TypeDecorator):
           to compare values of this type.  Otherwise, 
           the == operator is used to compare values.
 
+        :param track_mutations: defaults to False; implements
+          :meth:`AbstractType.tracks_mutations`.  When ``True``, ``dict``
+          and ``list`` values are tracked for in-place changes as they
+          occur, rather than being compared against a copy of their
+          loaded value each time the ORM checks for changes.  Changes
+          within other kinds of objects aren't detected.
+
         """
         self.protocol = protocol
         self.pickler = pickler or pickle
         self.mutable = mutable
         self.comparator = comparator
+        self.track_mutations = track_mutations
         super(PickleType, self).__init__()
 
     def bind_processor(self, dialect):
@@ -1326,7 +1377,7 @@ class PickleType(MutableType, TypeDecorator):
         return process
 
     def copy_value(self, value):
-        if self.mutable:
+        if self.mutable or self.track_mutations:
             return self.pickler.loads(self.pickler.dumps(value, self.protocol))
         else:
             return value
@@ -1338,7 +1389,10 @@ class PickleType(MutableType, TypeDecorator):
             return x == y
 
     def is_mutable(self):
-        return self.mutable
+        return self.mutable and not self.track_mutations
+
+    def tracks_mutations(self):
+        return self.track_mutations
 
 
 class Boolean(TypeEngine, SchemaType):
@@ -168,6 +168,8 @@ class frozendict(dict):
     def __repr__(self):
         return "frozendict(%s)" % dict.__repr__(self)
 
+EMPTY_DICT = frozendict()
+
 def to_list(x, default=None):
     if x is None:
         return default
@@ -1543,6 +1545,74 @@ class WeakIdentityMapping(weakref.WeakKeyDictionary):
         return self._keyed_weakref(object, self._cleanup)
 
 
+class LRUCache(dict):
+    """Dictionary with 'squishy' removal of least
+    recently used items.
+
+    Items are tagged with an access counter; once the
+    dictionary grows past ``capacity * (1 + threshold)``
+    entries, it is pruned back down to ``capacity`` by
+    discarding the entries accessed least recently.  The
+    pruning is deliberately tolerant of concurrent access
+    so that no lock is needed around ``get()``.
+
+    """
+    def __init__(self, capacity=100, threshold=.5):
+        self.capacity = capacity
+        self.threshold = threshold
+        self._counter = 0
+
+    def _inc_counter(self):
+        self._counter += 1
+        return self._counter
+
+    def __getitem__(self, key):
+        item = dict.__getitem__(self, key)
+        item[2] = self._inc_counter()
+        return item[1]
+
+    def get(self, key, default=None):
+        try:
+            item = dict.__getitem__(self, key)
+        except KeyError:
+            return default
+        item[2] = self._inc_counter()
+        return item[1]
+
+    def values(self):
+        return [i[1] for i in dict.values(self)]
+
+    def setdefault(self, key, value):
+        if key in self:
+            return self[key]
+        else:
+            self[key] = value
+            return value
+
+    def __setitem__(self, key, value):
+        item = dict.get(self, key)
+        if item is None:
+            item = [key, value, self._inc_counter()]
+            dict.__setitem__(self, key, item)
+        else:
+            item[1] = value
+        self._manage_size()
+
+    def _manage_size(self):
+        while len(self) > self.capacity + self.capacity * self.threshold:
+            bytime = sorted(dict.values(self),
+                            key=operator.itemgetter(2),
+                            reverse=True)
+            for item in bytime[self.capacity:]:
+                try:
+                    del self[item[0]]
+                except KeyError:
+                    # if we couldn't find a key, most
+                    # likely some other thread broke in
+                    # on us. loop around and try again
+                    break
+
+
 def warn(msg, stacklevel=3):
     if isinstance(msg, basestring):
         warnings.warn(msg, exc.SAWarning, stacklevel=stacklevel)
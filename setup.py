@@ -40,7 +40,9 @@ if Feature:
                 Extension('sqlalchemy.cprocessors',
                        sources=['lib/sqlalchemy/cextension/processors.c']),
                 Extension('sqlalchemy.cresultproxy',
-                       sources=['lib/sqlalchemy/cextension/resultproxy.c'])
+                       sources=['lib/sqlalchemy/cextension/resultproxy.c']),
+                Extension('sqlalchemy.cparams',
+                       sources=['lib/sqlalchemy/cextension/params.c'])
             ],
         )}
     )
@@ -50,7 +52,9 @@ elif BUILD_CEXTENSIONS:
                 Extension('sqlalchemy.cprocessors',
                       sources=['lib/sqlalchemy/cextension/processors.c']),
                 Extension('sqlalchemy.cresultproxy',
-                      sources=['lib/sqlalchemy/cextension/resultproxy.c'])
+                      sources=['lib/sqlalchemy/cextension/resultproxy.c']),
+                Extension('sqlalchemy.cparams',
+                      sources=['lib/sqlalchemy/cextension/params.c'])
             ]
     )
 
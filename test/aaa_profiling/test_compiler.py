@@ -17,13 +17,15 @@ class CompileTest(TestBase, AssertsExecutionResults):
 
         # go through all the TypeEngine
         # objects in use and pre-load their _type_affinity
-        # entries.
+        # and _cache_key entries.
         for t in (t1, t2):
             for c in t.c:
                 c.type._type_affinity
+                c.type._cache_key
         from sqlalchemy import types
         for t in types.type_map.values():
             t._type_affinity
+            t._cache_key
             
     @profiling.function_call_count(69, {'2.4': 44, '3.0':77, '3.1':77})
     def test_insert(self):
@@ -42,3 +44,19 @@ class CompileTest(TestBase, AssertsExecutionResults):
         s = select([t1], t1.c.c2==t2.c.c1)
         s.compile()
 
+    # the cache key used by the engine's compiled cache
+    # should stay well below the cost of compiling the
+    # same statement, measured above.
+
+    @profiling.function_call_count(17)
+    def test_insert_cache_key(self):
+        t1.insert()._cache_key()
+
+    @profiling.function_call_count(66)
+    def test_update_whereclause_cache_key(self):
+        t1.update().where(t1.c.c2==12)._cache_key()
+
+    @profiling.function_call_count(98)
+    def test_select_cache_key(self):
+        s = select([t1], t1.c.c2==t2.c.c1)
+        s._cache_key()
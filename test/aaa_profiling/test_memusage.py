@@ -4,6 +4,7 @@ from sqlalchemy.orm.mapper import _mapper_registry
 from sqlalchemy.orm.session import _sessions
 from sqlalchemy.util import jython
 import operator
+import sys
 from sqlalchemy.test import testing
 from sqlalchemy import MetaData, Integer, String, ForeignKey, PickleType
 from sqlalchemy.test.schema import Table, Column
@@ -402,6 +403,50 @@ class MemUsageTest(EnsureZeroed):
         finally:
             metadata.drop_all()
 
+    @testing.skip_if(lambda: sys.version_info < (2, 6),
+                        "sys.getsizeof() requires Python 2.6")
+    def test_state_size(self):
+        """measure the bytes held by InstanceState per loaded object."""
+        
+        metadata = MetaData(testing.db)
+
+        table1 = Table("mytable", metadata,
+            Column('col1', Integer, primary_key=True, test_needs_autoincrement=True),
+            Column('col2', String(30)))
+
+        class Foo(object):
+            pass
+            
+        mapper(Foo, table1)
+        metadata.create_all()
+        try:
+            table1.insert().execute([{'col2':'foo%d' % i} for i in range(100)])
+            
+            session = create_session()
+            # the objects stay referenced, so that the states measured
+            # are those of live objects
+            objects = session.query(Foo).all()
+            states = [sa.orm.attributes.instance_state(o) for o in objects]
+            size = 0
+            for state in states:
+                assert state.obj() is not None
+                size += sys.getsizeof(state)
+                if hasattr(state, '__dict__'):
+                    size += sys.getsizeof(state.__dict__)
+                for d in (state.committed_state, state.parents,
+                            state.pending, state.callables):
+                    # the auxiliary dictionaries aren't allocated
+                    # for a plain load
+                    assert d is sa.util.EMPTY_DICT
+            per_state = size / len(states)
+            print "bytes per loaded object state:", per_state
+            
+            # about 200 bytes on 64-bit CPython 2.7 using __slots__,
+            # versus over 1000 with a __dict__
+            assert per_state < 400, per_state
+        finally:
+            metadata.drop_all()
+            
     def test_type_compile(self):
         from sqlalchemy.dialects.sqlite.base import dialect as SQLiteDialect
         cast = sa.cast(column('x'), sa.Integer)
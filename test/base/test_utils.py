@@ -709,6 +709,34 @@ class WeakIdentityMappingTest(TestBase):
         eq_(wim._weakrefs, {})
 
 
+class LRUCacheTest(TestBase):
+    def test_get_set(self):
+        lru = util.LRUCache(10)
+        lru['a'] = 1
+        eq_(lru['a'], 1)
+        eq_(lru.get('a'), 1)
+        eq_(lru.get('b'), None)
+        eq_(lru.get('b', 5), 5)
+        lru['a'] = 2
+        eq_(lru['a'], 2)
+        eq_(lru.values(), [2])
+        assert_raises(KeyError, lambda: lru['b'])
+
+    def test_prune(self):
+        lru = util.LRUCache(10, threshold=.2)
+        for i in range(12):
+            lru[i] = i
+        eq_(len(lru), 12)
+
+        # refresh the oldest entries
+        for i in range(5):
+            lru.get(i)
+
+        lru[12] = 12
+        eq_(len(lru), 10)
+        eq_(sorted(lru.keys()), [0, 1, 2, 3, 4, 8, 9, 10, 11, 12])
+
+
 class TestFormatArgspec(TestBase):
     def test_specs(self):
         def test(fn, wanted, grouped=None):
@@ -6,6 +6,7 @@ from sqlalchemy.test.schema import Table
 from sqlalchemy.test.schema import Column
 import sqlalchemy as tsa
 from sqlalchemy.test import TestBase, testing, engines
+from sqlalchemy.engine.base import StatementStats
 
 
 users, metadata = None, None
@@ -111,6 +112,224 @@ class ExecuteTest(TestBase):
             (1, None)
         ])
 
+class CompiledCacheTest(TestBase):
+    @classmethod
+    def setup_class(cls):
+        global users, metadata
+        metadata = MetaData(testing.db)
+        users = Table('users', metadata,
+            Column('user_id', INT, primary_key = True, test_needs_autoincrement=True),
+            Column('user_name', VARCHAR(20)),
+        )
+        metadata.create_all()
+
+    @engines.close_first
+    def teardown(self):
+        testing.db.connect().execute(users.delete())
+
+    @classmethod
+    def teardown_class(cls):
+        metadata.drop_all()
+
+    def test_select_bind_values(self):
+        engine = testing.db
+        engine.execute(users.insert(),
+                        {'user_id':7, 'user_name':'jack'},
+                        {'user_id':8, 'user_name':'ed'})
+        cache = engine.compiled_cache
+        cache.clear()
+
+        for id_, name in ((7, 'jack'), (8, 'ed'), (7, 'jack')):
+            eq_(
+                engine.execute(
+                    select([users.c.user_name]).where(users.c.user_id==id_)
+                ).fetchall(),
+                [(name, )]
+            )
+        eq_(len(cache), 1)
+        eq_((cache.hits, cache.misses), (2, 1))
+
+        # execution parameters take precedence
+        eq_(
+            engine.execute(
+                select([users.c.user_name]).where(users.c.user_id==7),
+                user_id_1=8
+            ).scalar(),
+            'ed'
+        )
+
+        # a change in structure is a distinct entry
+        engine.execute(
+            select([users.c.user_name]).where(users.c.user_id>7)
+        ).fetchall()
+        eq_(len(cache), 3)
+        eq_((cache.hits, cache.misses), (2, 3))
+
+    def test_insert_values(self):
+        engine = testing.db
+        cache = engine.compiled_cache
+        cache.clear()
+
+        engine.execute(users.insert().values(user_id=7, user_name='jack'))
+        engine.execute(users.insert().values(user_id=8, user_name='ed'))
+        engine.execute(users.insert(),
+                        {'user_id':9, 'user_name':'fred'},
+                        {'user_id':10, 'user_name':'chuck'})
+        engine.execute(users.insert(),
+                        {'user_id':11, 'user_name':'wendy'},
+                        {'user_id':12, 'user_name':'sally'})
+        eq_((cache.hits, cache.misses), (2, 2))
+        eq_(
+            engine.execute(users.select().order_by(users.c.user_id)).fetchall(),
+            [(7, 'jack'), (8, 'ed'), (9, 'fred'), (10, 'chuck'),
+            (11, 'wendy'), (12, 'sally')]
+        )
+
+    def test_anonymous_alias(self):
+        engine = testing.db
+        engine.execute(users.insert(),
+                        {'user_id':7, 'user_name':'jack'},
+                        {'user_id':8, 'user_name':'ed'})
+        cache = engine.compiled_cache
+        cache.clear()
+
+        for id_, name in ((7, 'jack'), (8, 'ed')):
+            u = users.alias()
+            lower = func.lower(u.c.user_name).label(None)
+            s = select([u.c.user_name, lower]).\
+                        where(u.c.user_id==id_).apply_labels()
+            row = engine.execute(s).first()
+
+            # result columns are targeted in terms of the
+            # statement executed, not the one compiled
+            eq_(row[u.c.user_name], name)
+            eq_(row[lower], name)
+        eq_((cache.hits, cache.misses), (1, 1))
+
+    def test_text(self):
+        engine = testing.db
+        engine.execute(users.insert(),
+                        {'user_id':7, 'user_name':'jack'},
+                        {'user_id':8, 'user_name':'ed'})
+        cache = engine.compiled_cache
+        cache.clear()
+
+        for id_, name in ((7, 'jack'), (8, 'ed')):
+            eq_(
+                engine.execute(
+                    select([users.c.user_name]).\
+                        where(tsa.text("user_id=:id", bindparams=[bindparam('id', id_)]))
+                ).scalar(),
+                name
+            )
+        eq_((cache.hits, cache.misses), (1, 1))
+
+    def test_uncacheable(self):
+        from sqlalchemy.ext.compiler import compiles
+        from sqlalchemy.sql.expression import ColumnElement
+
+        class UserName(ColumnElement):
+            type = VARCHAR()
+
+        @compiles(UserName)
+        def visit_user_name(element, compiler, **kw):
+            return "user_name"
+
+        engine = testing.db
+        cache = engine.compiled_cache
+        cache.clear()
+        for i in range(2):
+            engine.execute(
+                select([users.c.user_id]).where(UserName()=='jack')
+            ).fetchall()
+        eq_(len(cache), 0)
+        eq_((cache.hits, cache.misses), (0, 2))
+
+    def test_disabled(self):
+        engine = engines.testing_engine(options={'compiled_cache_size':0})
+        assert engine.compiled_cache is None
+        eq_(engine.execute(select([tsa.literal(5)])).scalar(), 5)
+
+class StatementStatsTest(TestBase):
+    @classmethod
+    def setup_class(cls):
+        global users, metadata
+        metadata = MetaData(testing.db)
+        users = Table('users', metadata,
+            Column('user_id', INT, primary_key = True, test_needs_autoincrement=True),
+            Column('user_name', VARCHAR(20)),
+        )
+        metadata.create_all()
+
+    @engines.close_first
+    def teardown(self):
+        testing.db.statement_stats = None
+        testing.db.connect().execute(users.delete())
+
+    @classmethod
+    def teardown_class(cls):
+        metadata.drop_all()
+
+    def test_counters(self):
+        engine = testing.db
+        stats = engine.statement_stats = StatementStats()
+        engine.execute(users.insert(), 
+                        {'user_id':7, 'user_name':'jack'},
+                        {'user_id':8, 'user_name':'ed'})
+        engine.execute(users.insert(), {'user_id':9, 'user_name':'fred'})
+        eq_((stats.executions, stats.parameter_sets, stats.rows), (2, 3, 0))
+
+        eq_(len(engine.execute(users.select()).fetchall()), 3)
+        r = engine.execute(users.select())
+        r.fetchone()
+        r.fetchmany(1)
+        r.close()
+        eq_(engine.execute(select([users.c.user_id])).scalar(), 7)
+        eq_((stats.executions, stats.parameter_sets, stats.rows), (5, 6, 6))
+        assert stats.time > 0
+        eq_(stats.slow_statements(), [])
+
+        stats.reset()
+        eq_((stats.executions, stats.parameter_sets, stats.rows), (0, 0, 0))
+
+    def test_slow_statements(self):
+        engine = testing.db
+        stats = engine.statement_stats = StatementStats(slow_threshold=0, 
+                                                        log_size=2)
+        engine.execute(users.insert(), 
+                        {'user_id':7, 'user_name':'jack'},
+                        {'user_id':8, 'user_name':'ed'})
+        eq_(len(engine.execute(users.select()).fetchall()), 2)
+        engine.execute(users.select()).first()
+
+        slow = stats.slow_statements()
+        eq_(
+            [(re.sub(r'[\n\t]', '', s.statement), s.parameter_count, s.rows) for s in slow],
+            [
+                ("SELECT users.user_id, users.user_name FROM users", 1, 2),
+                ("SELECT users.user_id, users.user_name FROM users", 1, 1),
+            ]
+        )
+        assert slow[0].duration >= 0
+
+        engine.statement_stats.slow_threshold = 1000
+        engine.execute(users.select()).fetchall()
+        eq_(len(stats.slow_statements()), 2)
+
+    def test_options(self):
+        engine = engines.testing_engine()
+        assert engine.statement_stats is None
+        eq_(engine.execute(select([tsa.literal(5)])).scalar(), 5)
+
+        engine = engines.testing_engine(options={'statement_stats':True})
+        assert engine.statement_stats.slow_threshold is None
+
+        engine = engines.testing_engine(
+                            options={'slow_statement_threshold':.5,
+                                    'slow_statement_log_size':10})
+        eq_(engine.statement_stats.slow_threshold, .5)
+        eq_(engine.statement_stats.log_size, 10)
+
 class ProxyConnectionTest(TestBase):
 
     @testing.fails_on('firebird', 'Data type unknown')
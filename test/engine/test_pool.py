@@ -3,7 +3,7 @@ from sqlalchemy import pool, interfaces, create_engine, select
 import sqlalchemy as tsa
 from sqlalchemy.test import TestBase, testing
 from sqlalchemy.test.util import gc_collect, lazy_gc
-from sqlalchemy.test.testing import eq_
+from sqlalchemy.test.testing import eq_, assert_raises
 
 mcid = 1
 class MockDBAPI(object):
@@ -570,6 +570,287 @@ class QueuePoolTest(PoolTestBase):
     def test_max_overflow(self):
         self._test_overflow(40, 5)
  
+    def test_fifo(self):
+        p = pool.QueuePool(creator = mock_dbapi.connect, pool_size = 3, max_overflow = 0)
+        conns = [p.connect() for i in range(3)]
+        raw = [c.connection for c in conns]
+        for c in conns:
+            c.close()
+        del c
+        eq_([p.connect().connection for i in range(3)], raw)
+
+    def test_lifo(self):
+        p = pool.QueuePool(creator = mock_dbapi.connect, pool_size = 3, max_overflow = 0, use_lifo=True)
+        conns = [p.connect() for i in range(3)]
+        raw = [c.connection for c in conns]
+        for c in conns:
+            c.close()
+        del c
+        c1 = p.connect()
+        assert c1.connection is raw[2]
+        c1.close()
+        c1 = p.connect()
+        assert c1.connection is raw[2]
+        c2 = p.connect()
+        assert c2.connection is raw[1]
+
+        p2 = p.recreate()
+        assert p2._pool.use_lifo
+
+    def test_queue_threaded(self):
+        # exercise the unlocked fast paths of put()/get() against
+        # blocked waiters; every connection must come back exactly once
+        p = pool.QueuePool(creator = mock_dbapi.connect, pool_size = 3, 
+                                max_overflow = 0, timeout=10, use_lifo=True)
+        errors = []
+        def whammy():
+            try:
+                for i in range(50):
+                    c = p.connect()
+                    time.sleep(.0005)
+                    c.close()
+            except Exception, e:
+                errors.append(e)
+        threads = [threading.Thread(target=whammy) for i in range(10)]
+        for th in threads:
+            th.start()
+        for th in threads:
+            th.join()
+        eq_(errors, [])
+        eq_(p.checkedin(), 3)
+        eq_(p.checkedout(), 0)
+
+    def test_maintain_idle_timeout(self):
+        p = pool.QueuePool(creator = mock_dbapi.connect, pool_size = 3, 
+                                max_overflow = 0, idle_timeout=10)
+        c1, c2 = p.connect(), p.connect()
+        raw1, raw2 = c1.connection, c2.connection
+        c1.close()
+        c2.close()
+        eq_(p.checkedin(), 2)
+
+        p.maintain()
+        eq_(p.checkedin(), 2)
+
+        p._pool.queue[0].lastused -= 20
+        p.maintain()
+        eq_(p.checkedin(), 1)
+        eq_(p.checkedout(), 0)
+        assert raw1.closed
+        assert not raw2.closed
+        assert p.connect().connection is raw2
+
+    def test_maintain_recycle(self):
+        p = pool.QueuePool(creator = mock_dbapi.connect, pool_size = 3, 
+                                max_overflow = 0, recycle=30)
+        # as though run every 10 seconds, without starting the thread
+        p._maintenance_interval = 10
+        p._maintenance_stop = threading.Event()
+        c1, c2 = p.connect(), p.connect()
+        raw1, raw2 = c1.connection, c2.connection
+        c1.close()
+        c2.close()
+        p._pool.queue[0].starttime -= 25
+        p.maintain()
+        eq_(p.checkedin(), 2)
+        assert raw1.closed
+        assert not raw2.closed
+        eq_(
+            set([p._pool.queue[0].connection, p._pool.queue[1].connection]) & 
+                set([raw1, raw2]), 
+            set([raw2])
+        )
+
+    def test_maintain_one_at_a_time(self):
+        """connections are replaced one at a time, so that checkouts
+        made meanwhile find the others in the pool."""
+
+        dbapi = MockDBAPI()
+        checkouts = []
+        def creator():
+            conn = dbapi.connect('foo.db')
+            if replacing:
+                # a checkout while a replacement is being opened
+                eq_(p.checkedin(), 2)
+                c = p.connect()
+                checkouts.append(c.connection)
+                c.close()
+            return conn
+        replacing = False
+        p = pool.QueuePool(creator=creator, pool_size=3, max_overflow=5,
+                                recycle=30)
+        # as though run every 10 seconds, without starting the thread
+        p._maintenance_interval = 10
+        p._maintenance_stop = threading.Event()
+        conns = [p.connect() for i in range(3)]
+        raws = set([c.connection for c in conns])
+        for c in conns:
+            c.close()
+        # due for replacement by maintenance, not yet upon checkout
+        for rec in p._pool.queue:
+            rec.starttime -= 25
+
+        replacing = True
+        p.maintain()
+        eq_(len(checkouts), 3)
+        eq_(p.checkedin(), 3)
+        eq_(p.overflow(), 0)
+        eq_(p.metrics.overflow_high_water, 0)
+        assert not raws.intersection([rec.connection for rec in p._pool.queue])
+
+    def test_maintain_put_back_full(self):
+        """a replaced connection which no longer fits in the pool
+        is closed."""
+
+        dbapi = MockDBAPI()
+        opened = []
+        def creator():
+            conn = dbapi.connect('foo.db')
+            opened.append(conn)
+            if len(opened) == 4:
+                # the overflow connection is returned while the first
+                # is being replaced, filling the pool
+                c2.close()
+                c3.close()
+            return conn
+        p = pool.QueuePool(creator=creator, pool_size=2, max_overflow=1)
+        c1, c2, c3 = p.connect(), p.connect(), p.connect()
+        raw1 = c1.connection
+        c1.close()
+        eq_(p.overflow(), 1)
+        p._pool.queue[0].starttime -= 100
+        p._invalidate_time = time.time() - 50
+
+        p.maintain()
+        assert raw1.closed
+        assert opened[3].closed
+        eq_(p.checkedin(), 2)
+        eq_(p.overflow(), 0)
+
+    def test_maintain_invalidated(self):
+        p = pool.QueuePool(creator = mock_dbapi.connect, pool_size = 3, 
+                                max_overflow = 0)
+        c1 = p.connect()
+        c1.invalidate()
+        eq_(p.checkedin(), 1)
+        assert p._pool.queue[0].connection is None
+        p.maintain()
+        assert p._pool.queue[0].connection is not None
+
+    def test_maintenance_thread(self):
+        p = pool.QueuePool(creator = mock_dbapi.connect, pool_size = 3, 
+                                max_overflow = 0, maintenance_interval=1)
+        try:
+            # the thread starts upon the first checkout
+            assert p._maintenance_stop is None
+            p.connect().close()
+            for i in range(50):
+                if p.checkedin() == 3:
+                    break
+                time.sleep(.1)
+            eq_(p.checkedin(), 3)
+            eq_(p.checkedout(), 0)
+
+            p2 = p.recreate()
+            p2.connect().close()
+            assert p2._maintenance_stop is not None
+            p2.dispose()
+            assert p2._maintenance_stop.isSet()
+        finally:
+            p.dispose()
+        assert p._maintenance_stop.isSet()
+
+        p = pool.QueuePool(creator = mock_dbapi.connect, pool_size = 3, 
+                                max_overflow = 0, maintenance_interval=1)
+        p.connect().close()
+        stop = p._maintenance_stop
+        del p
+        gc_collect()
+        assert stop.isSet()
+
+    def test_maintenance_thread_listeners(self):
+        """the maintenance thread opens no connection before
+        create_engine() has added the dialect's first_connect listener."""
+
+        import sqlite3
+        for i in range(20):
+            canary = []
+            e = create_engine('sqlite://',
+                        creator=lambda: sqlite3.connect(':memory:',
+                                                check_same_thread=False),
+                        poolclass=pool.QueuePool, pool_size=3, max_overflow=0,
+                        pool_maintenance_interval=1,
+                        listeners=[{'connect':lambda conn, rec: canary.append(conn)}])
+            try:
+                e.execute(select([1])).close()
+                for j in range(50):
+                    if e.pool.checkedin() == 3:
+                        break
+                    time.sleep(.02)
+                eq_(e.pool.checkedin(), 3)
+                eq_(len(canary), 3)
+                assert 'server_version_info' in e.dialect.__dict__
+            finally:
+                e.pool.dispose()
+
+    def test_metrics(self):
+        p = pool.QueuePool(creator = mock_dbapi.connect, pool_size = 1, 
+                                max_overflow = 1, timeout=.1, recycle=30)
+        c1 = p.connect()
+        c2 = p.connect()
+        assert_raises(tsa.exc.TimeoutError, p.connect)
+        c1.close()
+        c2.invalidate()
+        p._pool.queue[0].starttime -= 40
+        c1 = p.connect()
+        m = p.metrics
+        eq_(
+            (m.checkouts, m.timeouts, m.invalidations, m.recycles, 
+                m.overflow_high_water),
+            (4, 1, 1, 1, 1)
+        )
+        eq_(m.wait_count, 0)
+        eq_(m.hold_counts, [0] * 7)
+        m.reset()
+        eq_(m.checkouts, 0)
+
+    def test_metrics_timing(self):
+        p = pool.QueuePool(creator = mock_dbapi.connect, pool_size = 1, 
+                                max_overflow = 0, record_timing=True)
+        c1 = p.connect()
+        c1.close()
+        c1 = p.connect()
+        time.sleep(.2)
+        c1.close()
+        m = p.metrics
+        eq_(m.wait_count, 2)
+        eq_(sum(m.hold_counts), 2)
+        eq_(m.hold_counts[3], 1)
+        assert .2 <= m.max_hold_time < 1
+        assert m.hold_time >= m.max_hold_time
+        assert m.wait_time < 1
+
+        assert p.recreate()._record_timing
+
+    def test_leak_threshold(self):
+        p = pool.QueuePool(creator = mock_dbapi.connect, pool_size = 1, 
+                                max_overflow = 0, leak_threshold=.1)
+        def go():
+            return p.connect()
+        c1 = go()
+        eq_(p.leaked(), [])
+        time.sleep(.2)
+        leaked = p.leaked()
+        eq_(len(leaked), 1)
+        held, stack = leaked[0]
+        assert held >= .2
+        assert "in go" in stack
+        c1.close()
+        eq_(p.leaked(), [])
+
+        assert_raises(tsa.exc.InvalidRequestError, 
+                    pool.QueuePool(creator = mock_dbapi.connect).leaked)
+
     def test_mixed_close(self):
         p = pool.QueuePool(creator = mock_dbapi.connect, pool_size = 3, max_overflow = -1, use_threadlocal = True)
         c1 = p.connect()
@@ -641,6 +922,83 @@ class QueuePoolTest(PoolTestBase):
         c1 = p.connect()
         assert c1.connection.id != c_id
  
+    def test_pre_ping(self):
+        dbapi = MockDBAPI()
+        canary = []
+        def ping(conn):
+            canary.append(conn.id)
+            if conn.id in dead:
+                raise tsa.exc.DisconnectionError("database is gone")
+        dead = set()
+        
+        p = pool.QueuePool(creator = lambda: dbapi.connect('foo.db'), pool_size = 2, max_overflow = 0, use_threadlocal = False, pre_ping=ping)
+
+        # new connections aren't pinged
+        c1, c2 = p.connect(), p.connect()
+        c1_id, c2_id = c1.connection.id, c2.connection.id
+        eq_(canary, [])
+        c1.close()
+        c2.close()
+        
+        c1 = p.connect()
+        eq_(canary, [c1_id])
+        assert c1.connection.id == c1_id
+        c1.close()
+        
+        # a ping which detects a disconnect replaces the connection,
+        # and invalidates every connection older than the failure
+        dead.update([c1_id, c2_id])
+        c1 = p.connect()
+        assert c1.connection.id not in (c1_id, c2_id)
+        c2 = p.connect()
+        assert c2.connection.id not in (c1_id, c2_id)
+        
+        # only the first checkout pinged
+        eq_(len(canary), 2)
+        
+    def test_pre_ping_error(self):
+        dbapi = MockDBAPI()
+        canary = []
+        def ping(conn):
+            canary.append(conn.id)
+            if conn.id in dead:
+                raise Exception("this connection is unusable")
+        dead = set()
+
+        p = pool.QueuePool(creator = lambda: dbapi.connect('foo.db'), pool_size = 2, max_overflow = 0, use_threadlocal = False, pre_ping=ping)
+        c1, c2 = p.connect(), p.connect()
+        c1_id, c2_id = c1.connection.id, c2.connection.id
+        c1.close()
+        c2.close()
+
+        # any other error replaces only the failing connection
+        dead.add(c1_id)
+        c1 = p.connect()
+        assert c1.connection.id not in (c1_id, c2_id)
+        c2 = p.connect()
+        assert c2.connection.id == c2_id
+        eq_(canary, [c1_id, c2_id])
+
+    def test_pre_ping_true(self):
+        assert_raises(tsa.exc.ArgumentError, pool.QueuePool,
+                        creator = mock_dbapi.connect, pre_ping=True)
+
+    def test_pre_ping_interval(self):
+        dbapi = MockDBAPI()
+        canary = []
+        def ping(conn):
+            canary.append(conn.id)
+        
+        p = pool.QueuePool(creator = lambda: dbapi.connect('foo.db'), pool_size = 1, max_overflow = 0, use_threadlocal = False, pre_ping=ping, pre_ping_interval=1)
+        c1 = p.connect()
+        c1.close()
+        c1 = p.connect()
+        c1.close()
+        eq_(canary, [])
+        time.sleep(1.5)
+        c1 = p.connect()
+        eq_(len(canary), 1)
+
     def test_recreate(self):
         dbapi = MockDBAPI()
         p = pool.QueuePool(creator = lambda: dbapi.connect('foo.db'), pool_size = 1, max_overflow = 0, use_threadlocal = False)
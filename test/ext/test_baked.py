@@ -0,0 +1,114 @@
+from sqlalchemy.test.testing import eq_, assert_raises
+from sqlalchemy import bindparam
+from sqlalchemy.orm import mapper, relation, create_session, eagerload, \
+    compile_mappers
+from sqlalchemy.orm import exc as orm_exc
+from sqlalchemy.ext.baked import Bakery
+from sqlalchemy.test import testing
+
+from test.orm import _fixtures
+from test.orm._fixtures import User, Address, users, addresses
+
+
+class BakedTest(_fixtures.FixtureTest):
+    run_setup_mappers = 'once'
+    run_inserts = 'once'
+    run_deletes = None
+
+    @classmethod
+    def setup_mappers(cls):
+        mapper(User, users, properties={
+            'addresses':relation(Address, backref='user', order_by=addresses.c.id),
+        })
+        mapper(Address, addresses)
+        compile_mappers()
+
+    def _lookup(self, bakery, session, name):
+        bq = bakery(lambda s: s.query(User))
+        bq += lambda q: q.filter(User.name == bindparam('name'))
+        return bq(session).params(name=name).one()
+
+    def test_params(self):
+        bakery = Bakery()
+        sess = create_session()
+        eq_(self._lookup(bakery, sess, 'jack'), User(id=7))
+        eq_(self._lookup(bakery, sess, 'ed'), User(id=8))
+        eq_(len(bakery), 1)
+
+    def test_construction_not_repeated(self):
+        bakery = Bakery()
+        sess = create_session()
+        canary = []
+        def initial(s):
+            canary.append('initial')
+            return s.query(User)
+        def criteria(q):
+            canary.append('criteria')
+            return q.filter(User.id == bindparam('id'))
+
+        for id_ in (7, 8, 9):
+            bq = bakery(initial)
+            bq += criteria
+            eq_(bq(sess).params(id=id_).all(), [User(id=id_)])
+        eq_(canary, ['initial', 'criteria'])
+
+    def test_steps_distinct(self):
+        bakery = Bakery()
+        sess = create_session()
+        bq = bakery(lambda s: s.query(User).order_by(User.id))
+        eq_(bq(sess).all(), [User(id=7), User(id=8), User(id=9), User(id=10)])
+
+        bq2 = bq.with_criteria(lambda q: q.filter(User.id > bindparam('id')))
+        eq_(bq2(sess).params(id=8).all(), [User(id=9), User(id=10)])
+
+        # the original is unchanged
+        eq_(bq(sess).all(), [User(id=7), User(id=8), User(id=9), User(id=10)])
+        eq_(len(bakery), 2)
+
+    def test_first_one(self):
+        bakery = Bakery()
+        sess = create_session()
+        bq = bakery(lambda s: s.query(User).order_by(User.id))
+        bq += lambda q: q.filter(User.id > bindparam('id'))
+        for i in range(2):
+            eq_(bq(sess).params(id=7).first(), User(id=8))
+            eq_(bq(sess).params(id=10).first(), None)
+            assert_raises(orm_exc.MultipleResultsFound,
+                            bq(sess).params(id=7).one)
+            assert_raises(orm_exc.NoResultFound,
+                            bq(sess).params(id=10).one)
+
+    def test_eagerload(self):
+        bakery = Bakery()
+        bq = bakery(lambda s: s.query(User).options(eagerload(User.addresses)))
+        bq += lambda q: q.filter(User.id == bindparam('id'))
+        for id_ in (7, 8, 7):
+            sess = create_session()
+            u = bq(sess).params(id=id_).one()
+            def go():
+                eq_(u, self.static.user_address_result[id_ - 7])
+            self.assert_sql_count(testing.db, go, 0)
+
+    def test_column_entities(self):
+        bakery = Bakery()
+        sess = create_session()
+        bq = bakery(lambda s: s.query(User.id, User.name))
+        bq += lambda q: q.filter(User.id == bindparam('id'))
+        eq_(bq(sess).params(id=7).all(), [(7, 'jack')])
+        eq_(bq(sess).params(id=8).all(), [(8, 'ed')])
+
+    def test_autoflush(self):
+        bakery = Bakery()
+        sess = create_session(autoflush=True)
+        bq = bakery(lambda s: s.query(User))
+        bq += lambda q: q.filter(User.name == bindparam('name'))
+        u = bq(sess).params(name='jack').one()
+        u.name = 'jack jr.'
+        try:
+            eq_(bq(sess).params(name='jack jr.').one(), u)
+        finally:
+            sess.rollback()
+            sess.expunge_all()
+            users.update().values(name='jack').\
+                    where(users.c.id==7).execute()
+
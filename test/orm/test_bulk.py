@@ -0,0 +1,231 @@
+"""tests of the Session.bulk_XXX() methods, which bypass the unit of work."""
+
+from sqlalchemy.test.testing import eq_, assert_raises, assert_raises_message
+from sqlalchemy.test import testing
+from sqlalchemy import Integer, String, ForeignKey, exc as sa_exc
+from sqlalchemy.test.schema import Table, Column
+from sqlalchemy.orm import mapper, create_session
+from sqlalchemy.test.assertsql import CompiledSQL
+from test.orm import _base, _fixtures
+
+
+class BulkTest(_fixtures.FixtureTest):
+    run_inserts = None
+
+    @testing.resolve_artifact_names
+    def test_bulk_save_objects_insert(self):
+        mapper(User, users)
+
+        sess = create_session()
+        objects = [User(id=1, name='u1'), User(id=2, name='u2'),
+                    User(id=3, name='u3')]
+
+        self.assert_sql_execution(
+            testing.db,
+            lambda: sess.bulk_save_objects(objects),
+            CompiledSQL("INSERT INTO users (id, name) VALUES (:id, :name)",
+             [{'id':1, 'name':'u1'}, {'id':2, 'name':'u2'},
+              {'id':3, 'name':'u3'}]),
+        )
+
+        # objects aren't part of the session
+        for o in objects:
+            assert o not in sess
+        eq_(sess.query(User).order_by(User.id).all(), objects)
+
+    @testing.resolve_artifact_names
+    def test_bulk_save_objects_update(self):
+        mapper(User, users)
+
+        sess = create_session()
+        sess.bulk_insert_mappings(User, [
+            dict(id=1, name='u1'), dict(id=2, name='u2'), dict(id=3, name='u3')
+        ])
+        u1, u2, u3 = sess.query(User).order_by(User.id).all()
+        u1.name = 'u1new'
+        u3.name = 'u3new'
+
+        self.assert_sql_execution(
+            testing.db,
+            lambda: sess.bulk_save_objects([u1, u2, u3]),
+            CompiledSQL("UPDATE users SET name=:name WHERE users.id = :users_id",
+             [{'name':'u1new', 'users_id':1}, {'name':'u3new', 'users_id':3}]),
+        )
+
+        # changes are committed on the objects
+        assert not sess.dirty
+        self.assert_sql_count(testing.db, sess.flush, 0)
+
+        sess.expunge_all()
+        eq_(sess.query(User).order_by(User.id).all(),
+            [User(id=1, name='u1new'), User(id=2, name='u2'),
+             User(id=3, name='u3new')])
+
+    @testing.resolve_artifact_names
+    def test_bulk_insert_mappings(self):
+        mapper(User, users)
+
+        sess = create_session()
+        mappings = [dict(id=1, name='u1'), dict(id=2, name='u2'),
+                    dict(name='u3'), dict(id=4, name='u4')]
+
+        self.assert_sql_execution(
+            testing.db,
+            lambda: sess.bulk_insert_mappings(User, mappings),
+            CompiledSQL("INSERT INTO users (id, name) VALUES (:id, :name)",
+             [{'id':1, 'name':'u1'}, {'id':2, 'name':'u2'}]),
+            CompiledSQL("INSERT INTO users (name) VALUES (:name)",
+             {'name':'u3'}),
+            CompiledSQL("INSERT INTO users (id, name) VALUES (:id, :name)",
+             [{'id':4, 'name':'u4'}]),
+        )
+
+        # the given dictionaries aren't modified
+        eq_(mappings[2], dict(name='u3'))
+        eq_(
+            [u.name for u in sess.query(User).order_by(User.id)],
+            ['u1', 'u2', 'u3', 'u4']
+        )
+
+    @testing.resolve_artifact_names
+    def test_bulk_update_mappings(self):
+        mapper(User, users)
+
+        sess = create_session()
+        sess.bulk_insert_mappings(User, [
+            dict(id=1, name='u1'), dict(id=2, name='u2'), dict(id=3, name='u3')
+        ])
+
+        self.assert_sql_execution(
+            testing.db,
+            lambda: sess.bulk_update_mappings(User, [
+                dict(id=1, name='u1new'), dict(id=3, name='u3new')
+            ]),
+            CompiledSQL("UPDATE users SET name=:name WHERE users.id = :users_id",
+             [{'name':'u1new', 'users_id':1}, {'name':'u3new', 'users_id':3}]),
+        )
+        eq_(
+            [u.name for u in sess.query(User).order_by(User.id)],
+            ['u1new', 'u2', 'u3new']
+        )
+
+    @testing.resolve_artifact_names
+    def test_bulk_update_requires_pk(self):
+        mapper(User, users)
+
+        sess = create_session()
+        assert_raises_message(
+            sa_exc.InvalidRequestError,
+            "Primary key attribute 'id' is required",
+            sess.bulk_update_mappings, User, [dict(name='u1')]
+        )
+
+    @testing.resolve_artifact_names
+    def test_rollback(self):
+        mapper(User, users)
+
+        sess = create_session(autocommit=False)
+        sess.bulk_insert_mappings(User, [dict(id=1, name='u1')])
+        assert_raises(
+            sa_exc.DBAPIError,
+            sess.bulk_insert_mappings, User, [dict(id=2, name=None)]
+        )
+        sess.rollback()
+        eq_(sess.query(User).count(), 0)
+
+
+class BulkInheritanceTest(_base.MappedTest):
+    @classmethod
+    def define_tables(cls, metadata):
+        Table('people', metadata,
+            Column('person_id', Integer, primary_key=True,
+                                    test_needs_autoincrement=True),
+            Column('name', String(50)),
+            Column('type', String(30)))
+
+        Table('engineers', metadata,
+            Column('engineer_id', Integer, ForeignKey('people.person_id'),
+                                    primary_key=True),
+            Column('primary_language', String(50)))
+
+    @classmethod
+    def setup_classes(cls):
+        class Person(_base.ComparableEntity):
+            pass
+        class Engineer(Person):
+            pass
+
+    @classmethod
+    @testing.resolve_artifact_names
+    def setup_mappers(cls):
+        mapper(Person, people, polymorphic_on=people.c.type,
+                                    polymorphic_identity='person')
+        mapper(Engineer, engineers, inherits=Person,
+                                    polymorphic_identity='engineer')
+
+    @testing.resolve_artifact_names
+    def test_bulk_insert_joined_inh(self):
+        sess = create_session()
+
+        self.assert_sql_execution(
+            testing.db,
+            lambda: sess.bulk_insert_mappings(Engineer, [
+                dict(person_id=1, name='e1', primary_language='python'),
+                dict(person_id=2, name='e2', primary_language='java'),
+            ]),
+            CompiledSQL("INSERT INTO people (person_id, name, type) "
+                "VALUES (:person_id, :name, :type)",
+             [{'person_id':1, 'name':'e1', 'type':'engineer'},
+              {'person_id':2, 'name':'e2', 'type':'engineer'}]),
+            CompiledSQL("INSERT INTO engineers (engineer_id, primary_language) "
+                "VALUES (:engineer_id, :primary_language)",
+             [{'engineer_id':1, 'primary_language':'python'},
+              {'engineer_id':2, 'primary_language':'java'}]),
+        )
+
+        eq_(sess.query(Person).order_by(Person.person_id).all(), [
+            Engineer(person_id=1, name='e1', primary_language='python'),
+            Engineer(person_id=2, name='e2', primary_language='java'),
+        ])
+
+    @testing.resolve_artifact_names
+    def test_bulk_insert_joined_inh_generated_pk(self):
+        sess = create_session()
+        sess.bulk_save_objects([
+            Engineer(name='e1', primary_language='python'),
+            Engineer(name='e2', primary_language='java'),
+            Person(name='p1'),
+        ])
+
+        eq_(sess.query(Person).order_by(Person.person_id).all(), [
+            Engineer(name='e1', primary_language='python'),
+            Engineer(name='e2', primary_language='java'),
+            Person(name='p1'),
+        ])
+
+    @testing.resolve_artifact_names
+    def test_bulk_update_joined_inh(self):
+        sess = create_session()
+        sess.bulk_insert_mappings(Engineer, [
+            dict(person_id=1, name='e1', primary_language='python'),
+            dict(person_id=2, name='e2', primary_language='java'),
+        ])
+
+        self.assert_sql_execution(
+            testing.db,
+            lambda: sess.bulk_update_mappings(Engineer, [
+                dict(person_id=1, name='e1new'),
+                dict(person_id=2, primary_language='c'),
+            ]),
+            CompiledSQL("UPDATE people SET name=:name "
+                "WHERE people.person_id = :people_person_id",
+             [{'name':'e1new', 'people_person_id':1}]),
+            CompiledSQL("UPDATE engineers SET primary_language=:primary_language "
+                "WHERE engineers.engineer_id = :engineers_engineer_id",
+             [{'primary_language':'c', 'engineers_engineer_id':2}]),
+        )
+
+        eq_(sess.query(Person).order_by(Person.person_id).all(), [
+            Engineer(person_id=1, name='e1new', primary_language='python'),
+            Engineer(person_id=2, name='e2', primary_language='c'),
+        ])
@@ -6,9 +6,10 @@ T1/T2.
 
 """
 from sqlalchemy.test import testing
-from sqlalchemy import Integer, String, ForeignKey
+from sqlalchemy import Integer, String, ForeignKey, topological
 from sqlalchemy.test.schema import Table, Column
-from sqlalchemy.orm import mapper, relation, backref, create_session
+from sqlalchemy.orm import mapper, relation, backref, create_session, \
+    class_mapper
 from sqlalchemy.test.testing import eq_
 from sqlalchemy.test.assertsql import RegexSQL, ExactSQL, CompiledSQL, AllOf
 from test.orm import _base
@@ -130,6 +131,73 @@ class SelfReferentialTest(_base.MappedTest):
         
         sess.expire_all()
         assert c2.parent_c1 is None
+
+    @testing.resolve_artifact_names
+    def test_sort_cached(self):
+        mapper(C1, t1, properties={
+            'children':relation(C1),
+            'c2s':relation(mapper(C2, t2))
+        })
+        
+        sorts = []
+        canary = topological.sort_with_cycles
+        def sort_with_cycles(tuples, allitems):
+            sorts.append(set(allitems))
+            return canary(tuples, allitems)
+        topological.sort_with_cycles = sort_with_cycles
+        try:
+            sess = create_session()
+            for i in range(3):
+                c1 = C1('c1')
+                c1.children.append(C1('child'))
+                c1.c2s.append(C2('c2'))
+                sess.add(c1)
+                sess.flush()
+            eq_(sorts, [set([class_mapper(C1), class_mapper(C2)])])
+            
+            # a flush involving different mappers is sorted separately
+            c2 = C2('c2')
+            sess.add(c2)
+            sess.flush()
+            eq_(len(sorts), 2)
+
+            # as is every flush once mappers change
+            class_mapper(C1).add_property('parent', 
+                relation(C1, remote_side=t1.c.c1, viewonly=True))
+            c2.data = 'c2 modified'
+            sess.flush()
+            eq_(len(sorts), 3)
+        finally:
+            topological.sort_with_cycles = canary
+
+    @testing.resolve_artifact_names
+    def test_flush_plan_cached(self):
+        mapper(C1, t1, properties={
+            'children':relation(C1)
+        })
+        
+        prop = class_mapper(C1).get_property('children')
+        calls = []
+        canary = prop.register_processors
+        def register_processors(uowcommit):
+            calls.append(uowcommit)
+            return canary(uowcommit)
+        prop.register_processors = register_processors
+
+        sess = create_session()
+        for i in range(3):
+            c1 = C1('c1')
+            c1.children.append(C1('child'))
+            sess.add(c1)
+            sess.flush()
+            assert c1.children[0].parent_c1 == c1.c1
+        eq_(len(calls), 1)
+        
+        class_mapper(C1).add_property('parent', 
+            relation(C1, remote_side=t1.c.c1, viewonly=True))
+        sess.add(C1('c1'))
+        sess.flush()
+        eq_(len(calls), 2)
         
 class SelfReferentialNoPKTest(_base.MappedTest):
     """A self-referential relationship that joins on a column other than the primary key column"""
@@ -110,6 +110,44 @@ class GetTest(QueryTest):
             UserThing(id=10)
         )
 
+    def test_get_cached_statement(self):
+        """test that get() reuses a single statement per mapper on an identity map miss."""
+
+        s = create_session()
+        m = class_mapper(User)
+        m._get_statement_cache.clear()
+
+        eq_(s.query(User).get(7), User(id=7, name='jack'))
+        eq_(s.query(User).get(8), User(id=8, name='ed'))
+        assert s.query(User).get(19) is None
+        eq_(len(m._get_statement_cache), 1)
+        template, bind_keys, compiled = m._get_statement_cache.values()[0]
+        eq_(len(compiled), 1)
+        
+        # queries with options or criterion go the long way
+        s.expunge_all()
+        u = s.query(User).options(eagerload('addresses')).get(7)
+        def go():
+            eq_(u.addresses, [Address(id=1)])
+        self.assert_sql_count(testing.db, go, 0)
+        eq_(len(m._get_statement_cache), 1)
+
+    def test_get_cached_statement_reset(self):
+        """test that properties added to a compiled mapper reset its get() statement."""
+
+        class LocalUser(_base.ComparableEntity):
+            pass
+        m = mapper(LocalUser, users)
+        s = create_session()
+        eq_(s.query(LocalUser).get(7), LocalUser(id=7, name='jack'))
+
+        m.add_property('upper_name', column_property(func.upper(users.c.name)))
+        s.expunge_all()
+        u = s.query(LocalUser).get(7)
+        def go():
+            eq_(u.upper_name, 'JACK')
+        self.assert_sql_count(testing.db, go, 0)
+
     def test_no_criterion(self):
         """test that get()/load() does not use preexisting filter/etc. criterion"""
 
@@ -1171,6 +1209,28 @@ class YieldTest(QueryTest):
         except StopIteration:
             pass
 
+    def test_stream_options(self):
+        sess = create_session()
+        q = sess.query(User).yield_per(2)
+        eq_(q._execution_options, 
+            dict(stream_results=True, max_row_buffer=2))
+        eq_([u.id for u in q.order_by(User.id)], [7, 8, 9, 10])
+
+    @testing.fails_on('mysql+mysqldb', "unbuffered cursor doesn't allow "
+                        "another statement until the result is consumed")
+    def test_lazyload(self):
+        sess = create_session()
+        q = sess.query(User).yield_per(1).order_by(User.id)
+        eq_([len(u.addresses) for u in q], [1, 3, 1, 0])
+
+    def test_lazyload_buffered(self):
+        sess = create_session()
+        q = sess.query(User).yield_per(1).\
+                    execution_options(stream_results=False).order_by(User.id)
+        eq_(q._execution_options,
+            dict(stream_results=False, max_row_buffer=1))
+        eq_([len(u.addresses) for u in q], [1, 3, 1, 0])
+
 class TextTest(QueryTest):
     def test_fulltext(self):
         assert [User(id=7), User(id=8), User(id=9),User(id=10)] == create_session().query(User).from_statement("select * from users order by id").all()
@@ -0,0 +1,214 @@
+"""basic tests of "select IN" loaded attributes"""
+
+from sqlalchemy.test.testing import eq_
+from sqlalchemy.test import testing
+from sqlalchemy.orm import mapper, relation, create_session, backref, \
+    selectinload, selectinload_all
+from sqlalchemy.test.assertsql import CompiledSQL
+from test.orm import _base, _fixtures
+from test.orm._fixtures import Node
+
+
+class SelectInTest(_fixtures.FixtureTest, testing.AssertsCompiledSQL):
+    run_inserts = 'once'
+    run_deletes = None
+
+    @testing.resolve_artifact_names
+    def test_basic(self):
+        mapper(User, users, properties={
+            'addresses':relation(mapper(Address, addresses), lazy='selectin',
+                                        order_by=Address.id)
+        })
+        sess = create_session()
+        q = sess.query(User)
+
+        def go():
+            eq_(self.static.user_address_result, q.order_by(User.id).all())
+        self.assert_sql_count(testing.db, go, 2)
+
+    @testing.resolve_artifact_names
+    def test_statement(self):
+        mapper(User, users, properties={
+            'addresses':relation(mapper(Address, addresses), lazy='selectin',
+                                        order_by=Address.id)
+        })
+        sess = create_session()
+
+        self.assert_sql_execution(testing.db,
+            lambda: sess.query(User).filter(User.id.in_([7, 8])).all(),
+            CompiledSQL(
+                "SELECT users.id AS users_id, users.name AS users_name "
+                "FROM users WHERE users.id IN (:id_1, :id_2)",
+                {'id_1':7, 'id_2':8}
+            ),
+            CompiledSQL(
+                "SELECT addresses.id AS addresses_id, addresses.user_id AS "
+                "addresses_user_id, addresses.email_address AS "
+                "addresses_email_address FROM addresses "
+                "WHERE addresses.user_id IN (:user_id_1, :user_id_2) "
+                "ORDER BY addresses.id",
+                {'user_id_1':7, 'user_id_2':8}
+            )
+        )
+
+    @testing.resolve_artifact_names
+    def test_batch_size(self):
+        mapper(User, users, properties={
+            'addresses':relation(mapper(Address, addresses), lazy='selectin',
+                                        order_by=Address.id, selectin_batch_size=3)
+        })
+        sess = create_session()
+        def go():
+            eq_(self.static.user_address_result,
+                    sess.query(User).order_by(User.id).all())
+        self.assert_sql_count(testing.db, go, 3)
+
+    @testing.resolve_artifact_names
+    def test_options(self):
+        mapper(User, users, properties={
+            'addresses':relation(mapper(Address, addresses), order_by=Address.id)
+        })
+        sess = create_session()
+        q = sess.query(User).options(selectinload('addresses'))
+
+        def go():
+            eq_(self.static.user_address_result, q.order_by(User.id).all())
+        self.assert_sql_count(testing.db, go, 2)
+
+    @testing.resolve_artifact_names
+    def test_options_chained(self):
+        mapper(User, users, properties={
+            'orders':relation(Order, order_by=orders.c.id)
+        })
+        mapper(Order, orders, properties={
+            'items':relation(Item, secondary=order_items, order_by=items.c.id)
+        })
+        mapper(Item, items)
+        sess = create_session()
+        q = sess.query(User).options(selectinload_all('orders.items'))
+
+        def go():
+            eq_(self.static.user_order_result, q.order_by(User.id).all())
+        self.assert_sql_count(testing.db, go, 3)
+
+    @testing.resolve_artifact_names
+    def test_many_to_many(self):
+        mapper(Keyword, keywords)
+        mapper(Item, items, properties = dict(
+                keywords = relation(Keyword, secondary=item_keywords,
+                                    lazy='selectin', order_by=keywords.c.id)))
+
+        q = create_session().query(Item).order_by(Item.id)
+        def go():
+            eq_(self.static.item_keyword_result, q.all())
+        self.assert_sql_count(testing.db, go, 2)
+
+    @testing.resolve_artifact_names
+    def test_many_to_one(self):
+        mapper(Address, addresses, properties = dict(
+            user = relation(mapper(User, users), lazy='selectin')
+        ))
+        sess = create_session()
+        q = sess.query(Address)
+
+        def go():
+            a = q.filter(addresses.c.id==1).one()
+            assert a.user is not None
+            u1 = sess.query(User).get(7)
+            assert a.user is u1
+        self.assert_sql_count(testing.db, go, 2)
+
+        # a second load locates the related objects
+        # in the identity map
+        sess.expunge_all()
+        u1 = sess.query(User).get(8)
+        def go():
+            for a in q.filter(addresses.c.user_id==8).all():
+                assert a.user is u1
+        self.assert_sql_count(testing.db, go, 1)
+
+    @testing.resolve_artifact_names
+    def test_backref(self):
+        mapper(User, users, properties={
+            'addresses':relation(mapper(Address, addresses), lazy='selectin',
+                                order_by=Address.id,
+                                backref=backref('user', lazy='selectin'))
+        })
+        sess = create_session()
+        def go():
+            result = sess.query(User).order_by(User.id).all()
+            eq_(self.static.user_address_result, result)
+            for u in result:
+                for a in u.addresses:
+                    assert a.user is u
+        self.assert_sql_count(testing.db, go, 2)
+
+    @testing.resolve_artifact_names
+    def test_self_referential(self):
+        mapper(Node, nodes, properties={
+            'children':relation(Node, lazy='selectin', order_by=nodes.c.id)
+        })
+        sess = create_session()
+        n1 = Node(data='n1')
+        n1.children.append(Node(data='n11'))
+        n1.children.append(Node(data='n12'))
+        n1.children[1].children.append(Node(data='n121'))
+        sess.add(n1)
+        sess.flush()
+        sess.expunge_all()
+        try:
+            def go():
+                n = sess.query(Node).filter_by(data='n1').one()
+                eq_(Node(data='n1', children=[
+                    Node(data='n11'),
+                    Node(data='n12', children=[
+                        Node(data='n121')
+                    ])
+                ]), n)
+            # one SELECT for each level, plus one for the
+            # (empty) level beneath the leaf nodes
+            self.assert_sql_count(testing.db, go, 4)
+        finally:
+            sess.expunge_all()
+            nodes.delete().execute()
+
+    @testing.resolve_artifact_names
+    def test_existing_unloaded(self):
+        """the collection is loaded for objects already in the session
+        where it was not yet loaded."""
+
+        mapper(User, users, properties={
+            'addresses':relation(mapper(Address, addresses), order_by=Address.id)
+        })
+        sess = create_session()
+        result = sess.query(User).order_by(User.id).all()
+        def go():
+            sess.query(User).options(selectinload('addresses')).\
+                        order_by(User.id).all()
+            eq_(self.static.user_address_result, result)
+        self.assert_sql_count(testing.db, go, 2)
+
+
+    @testing.resolve_artifact_names
+    def test_yield_per_expunge(self):
+        mapper(User, users, properties={
+            'addresses':relation(mapper(Address, addresses), lazy='selectin',
+                                        order_by=Address.id)
+        })
+        sess = create_session()
+        u9 = sess.query(User).get(9)
+
+        result, sizes = [], []
+        for u in sess.query(User).order_by(User.id).yield_per(2, expunge=True):
+            result.append(u)
+            sizes.append(len(sess.identity_map))
+        eq_(self.static.user_address_result, result)
+
+        # user 9 and its address were already present, and remain
+        eq_(sizes, [8, 8, 3, 3])
+        eq_(set(sess.identity_map.keys()), set([(User, (9,)), (Address, (5,))]))
+        assert result[2] is u9 and u9 in sess
+        for u in (result[0], result[1], result[3]):
+            assert u not in sess
+            for a in u.addresses:
+                assert a not in sess
@@ -1009,6 +1009,60 @@ class SessionTest(_fixtures.FixtureTest):
         self.assert_(s.prune() == 0)
         self.assert_(len(s.identity_map) == 0)
 
+    @testing.resolve_artifact_names
+    def test_lru_identity_map(self):
+        s = create_session(weak_identity_map=4)
+        mapper(User, users)
+
+        for x in xrange(10):
+            s.add(User(name='u%s' % x))
+        s.flush()
+        gc_collect()
+        
+        # only the most recently added are kept; the LRU cache
+        # allows up to 1.5 times its capacity before trimming
+        assert 4 <= len(s.identity_map) <= 4 * 1.5
+        
+        # as are the most recently retrieved
+        u7 = s.query(User).filter_by(name='u7').one()
+        id7 = u7.id
+        del u7
+        for x in xrange(5):
+            s.query(User).get(id7)
+            s.query(User).filter_by(name='u%s' % x).one()
+        gc_collect()
+        assert sa.orm.class_mapper(User).identity_key_from_primary_key(
+                                                [id7]) in s.identity_map
+        
+        # instances which are referenced elsewhere, modified,
+        # or deleted remain present
+        all_users = s.query(User).order_by(User.id).all()
+        u0, u1, u2 = all_users[0:3]
+        u1.name = 'u1 modified'
+        s.delete(u2)
+        del all_users, u1, u2
+        gc_collect()
+        names = set(u.name for u in s.identity_map.values())
+        assert 'u0' in names
+        assert 'u1 modified' in names
+        assert 'u2' in names
+        s.flush()
+        assert len(s.identity_map) > 0
+        
+        del u0
+        s.prune()
+        gc_collect()
+        eq_(len(s.identity_map), 0)
+        
+        s.expunge_all()
+        assert isinstance(s.identity_map, sa.orm.identity.LRUInstanceDict)
+
+        # zero, None and False select the strong map
+        for value in (0, None, False):
+            s = create_session(weak_identity_map=value)
+            assert isinstance(s.identity_map,
+                                sa.orm.identity.StrongInstanceDict)
+
     @testing.resolve_artifact_names
     def test_no_save_cascade_1(self):
         mapper(Address, addresses)
@@ -1366,6 +1420,7 @@ class SessionInterface(testing.TestBase):
     # TODO: expand with message body assertions.
 
     _class_methods = set((
+        'bulk_insert_mappings', 'bulk_update_mappings', 
         'connection', 'execute', 'get_bind', 'scalar'))
 
     def _public_session_methods(self):
@@ -1405,6 +1460,8 @@ class SessionInterface(testing.TestBase):
 
         raises_('add_all', (user_arg,))
 
+        raises_('bulk_save_objects', (user_arg,))
+
         raises_('delete', user_arg)
 
         raises_('expire', user_arg)
@@ -1442,6 +1499,10 @@ class SessionInterface(testing.TestBase):
             assert_raises(sa.orm.exc.UnmappedClassError,
                               callable_, *args, **kw)
 
+        raises_('bulk_insert_mappings', user_arg, [{}])
+
+        raises_('bulk_update_mappings', user_arg, [{}])
+
         raises_('connection', mapper=user_arg)
 
         raises_('execute', 'SELECT 1', mapper=user_arg)
@@ -0,0 +1,248 @@
+"""basic tests of subquery eager loaded attributes"""
+
+from sqlalchemy.test.testing import eq_
+from sqlalchemy.test import testing
+from sqlalchemy import bindparam
+from sqlalchemy.orm import mapper, relation, create_session, aliased, \
+    subqueryload, subqueryload_all
+from sqlalchemy.test.assertsql import CompiledSQL, RegexSQL
+from test.orm import _fixtures
+from test.orm._fixtures import Node
+
+
+class SubqueryTest(_fixtures.FixtureTest, testing.AssertsCompiledSQL):
+    run_inserts = 'once'
+    run_deletes = None
+
+    @testing.resolve_artifact_names
+    def test_basic(self):
+        mapper(User, users, properties={
+            'addresses':relation(mapper(Address, addresses), lazy='subquery',
+                                        order_by=Address.id)
+        })
+        sess = create_session()
+        q = sess.query(User)
+
+        def go():
+            eq_(self.static.user_address_result, q.order_by(User.id).all())
+        self.assert_sql_count(testing.db, go, 2)
+
+    @testing.resolve_artifact_names
+    def test_statement(self):
+        mapper(User, users, properties={
+            'addresses':relation(mapper(Address, addresses), lazy='subquery',
+                                        order_by=Address.id)
+        })
+        sess = create_session()
+
+        self.assert_sql_execution(testing.db,
+            lambda: sess.query(User).filter(User.id.in_([7, 8])).\
+                                order_by(User.id).all(),
+            CompiledSQL(
+                "SELECT users.id AS users_id, users.name AS users_name "
+                "FROM users WHERE users.id IN (:id_1, :id_2) "
+                "ORDER BY users.id",
+                {'id_1':7, 'id_2':8}
+            ),
+            CompiledSQL(
+                "SELECT addresses.id AS addresses_id, addresses.user_id AS "
+                "addresses_user_id, addresses.email_address AS "
+                "addresses_email_address, anon_1.users_id AS anon_1_users_id "
+                "FROM addresses, (SELECT DISTINCT users.id AS users_id "
+                "FROM users WHERE users.id IN (:id_1, :id_2)) AS anon_1 "
+                "WHERE anon_1.users_id = addresses.user_id "
+                "ORDER BY addresses.id",
+                {'id_1':7, 'id_2':8}
+            )
+        )
+
+    @testing.resolve_artifact_names
+    def test_limit(self):
+        """the ORDER BY of the original query is retained
+        along with LIMIT/OFFSET."""
+
+        mapper(User, users, properties={
+            'addresses':relation(mapper(Address, addresses), lazy='subquery',
+                                        order_by=Address.id)
+        })
+        sess = create_session()
+        q = sess.query(User).order_by(User.id.desc())
+
+        def go():
+            eq_(list(reversed(self.static.user_address_result))[1:3],
+                    q[1:3])
+        self.assert_sql_count(testing.db, go, 2)
+
+    @testing.resolve_artifact_names
+    def test_limit_join_to_many(self):
+        """a parent repeated by a join to a collection within a
+        LIMIT doesn't load duplicate related rows."""
+
+        mapper(User, users, properties={
+            'addresses':relation(mapper(Address, addresses), lazy='subquery',
+                                        order_by=Address.id)
+        })
+        sess = create_session()
+        q = sess.query(User).join('addresses').\
+                    filter(User.id.in_([8, 9])).\
+                    order_by(User.id, Address.id).limit(3)
+
+        def go():
+            eq_(self.static.user_address_result[1:2], q.all())
+        # LIMIT/OFFSET rendering varies by dialect
+        self.assert_sql_execution(testing.db, go,
+            RegexSQL(
+                r"^SELECT users.id AS users_id, users.name AS users_name "
+                r"FROM users JOIN addresses ON users.id = addresses.user_id "
+                r"WHERE users.id IN \(.*\) "
+                r"ORDER BY users.id, addresses.id"
+            ),
+            RegexSQL(
+                r"^SELECT addresses.id AS addresses_id, addresses.user_id AS "
+                r"addresses_user_id, addresses.email_address AS "
+                r"addresses_email_address, anon_1.users_id AS anon_1_users_id "
+                r"FROM addresses, \(SELECT DISTINCT anon_2.users_id AS users_id "
+                r"FROM \(SELECT users.id AS users_id "
+                r"FROM users JOIN addresses ON users.id = addresses.user_id "
+                r"WHERE users.id IN \(.*\) "
+                r"ORDER BY users.id, addresses.id.*\) AS anon_2\) AS anon_1 "
+                r"WHERE anon_1.users_id = addresses.user_id "
+                r"ORDER BY addresses.id"
+            )
+        )
+
+    @testing.resolve_artifact_names
+    def test_params(self):
+        mapper(User, users, properties={
+            'addresses':relation(mapper(Address, addresses), lazy='subquery',
+                                        order_by=Address.id)
+        })
+        sess = create_session()
+        q = sess.query(User).filter(User.id==bindparam('id'))
+
+        def go():
+            eq_(self.static.user_address_result[1:2], q.params(id=8).all())
+            eq_(self.static.user_address_result[0:1], q.params(id=7).all())
+        self.assert_sql_count(testing.db, go, 4)
+
+    @testing.resolve_artifact_names
+    def test_options(self):
+        mapper(User, users, properties={
+            'addresses':relation(mapper(Address, addresses), order_by=Address.id)
+        })
+        sess = create_session()
+        q = sess.query(User).options(subqueryload('addresses'))
+
+        def go():
+            eq_(self.static.user_address_result, q.order_by(User.id).all())
+        self.assert_sql_count(testing.db, go, 2)
+
+    @testing.resolve_artifact_names
+    def test_options_chained(self):
+        mapper(User, users, properties={
+            'orders':relation(Order, order_by=orders.c.id)
+        })
+        mapper(Order, orders, properties={
+            'items':relation(Item, secondary=order_items, order_by=items.c.id)
+        })
+        mapper(Item, items)
+        sess = create_session()
+        q = sess.query(User).options(subqueryload_all('orders.items'))
+
+        def go():
+            eq_(self.static.user_order_result, q.order_by(User.id).all())
+        self.assert_sql_count(testing.db, go, 3)
+
+    @testing.resolve_artifact_names
+    def test_many_to_many(self):
+        mapper(Keyword, keywords)
+        mapper(Item, items, properties = dict(
+                keywords = relation(Keyword, secondary=item_keywords,
+                                    lazy='subquery', order_by=keywords.c.id)))
+
+        q = create_session().query(Item).order_by(Item.id)
+        def go():
+            eq_(self.static.item_keyword_result, q.all())
+        self.assert_sql_count(testing.db, go, 2)
+
+    @testing.resolve_artifact_names
+    def test_aliased(self):
+        mapper(User, users, properties={
+            'addresses':relation(mapper(Address, addresses), lazy='subquery',
+                                        order_by=Address.id)
+        })
+        sess = create_session()
+        ua = aliased(User)
+
+        def go():
+            eq_(self.static.user_address_result[1:2],
+                    sess.query(ua).filter(ua.id==8).all())
+        self.assert_sql_count(testing.db, go, 2)
+
+    @testing.resolve_artifact_names
+    def test_from_statement(self):
+        """a query which can't be embedded as a subquery
+        loads using IN."""
+
+        mapper(User, users, properties={
+            'addresses':relation(mapper(Address, addresses), lazy='subquery',
+                                        order_by=Address.id)
+        })
+        sess = create_session()
+
+        self.assert_sql_execution(testing.db,
+            lambda: sess.query(User).from_statement(
+                        "select * from users where id=7").all(),
+            CompiledSQL(
+                "select * from users where id=7", {}
+            ),
+            CompiledSQL(
+                "SELECT addresses.id AS addresses_id, addresses.user_id AS "
+                "addresses_user_id, addresses.email_address AS "
+                "addresses_email_address FROM addresses "
+                "WHERE addresses.user_id IN (:user_id_1) "
+                "ORDER BY addresses.id",
+                {'user_id_1':7}
+            )
+        )
+
+    @testing.resolve_artifact_names
+    def test_get(self):
+        mapper(User, users, properties={
+            'addresses':relation(mapper(Address, addresses), lazy='subquery',
+                                        order_by=Address.id)
+        })
+        sess = create_session()
+        def go():
+            eq_(self.static.user_address_result[0], sess.query(User).get(7))
+        self.assert_sql_count(testing.db, go, 2)
+
+    @testing.resolve_artifact_names
+    def test_self_referential(self):
+        mapper(Node, nodes, properties={
+            'children':relation(Node, lazy='subquery', order_by=nodes.c.id)
+        })
+        sess = create_session()
+        n1 = Node(data='n1')
+        n1.children.append(Node(data='n11'))
+        n1.children.append(Node(data='n12'))
+        n1.children[1].children.append(Node(data='n121'))
+        sess.add(n1)
+        sess.flush()
+        sess.expunge_all()
+        try:
+            def go():
+                n = sess.query(Node).filter_by(data='n1').one()
+                eq_(Node(data='n1', children=[
+                    Node(data='n11'),
+                    Node(data='n12', children=[
+                        Node(data='n121')
+                    ])
+                ]), n)
+            # one SELECT for each level, plus one for the
+            # (empty) level beneath the leaf nodes
+            self.assert_sql_count(testing.db, go, 4)
+        finally:
+            sess.expunge_all()
+            nodes.delete().execute()
+
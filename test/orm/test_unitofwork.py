@@ -141,6 +141,41 @@ class VersioningTest(_base.MappedTest):
         else:
             s1.commit()
 
+    @testing.emits_warning(r'.*does not support updated rowcount')
+    @engines.close_open_connections
+    @testing.resolve_artifact_names
+    def test_batch_update(self):
+        """version counters are checked and incremented for objects 
+        updated using executemany()."""
+        
+        mapper(Foo, version_table, 
+                version_id_col=version_table.c.version_id)
+
+        s1 = create_session(autocommit=False)
+        f1 = Foo(value='f1')
+        f2 = Foo(value='f2')
+        s1.add_all((f1, f2))
+        s1.commit()
+
+        f1.value = 'f1rev2'
+        f2.value = 'f2rev2'
+        s1.commit()
+        eq_((f1.version_id, f2.version_id), (2, 2))
+
+        s2 = create_session(autocommit=False)
+        f2_s = s2.query(Foo).get(f2.id)
+        f2_s.value = 'f2rev3'
+        s2.commit()
+
+        f1.value = 'f1rev3mine'
+        f2.value = 'f2rev3mine'
+
+        if testing.db.dialect.supports_sane_rowcount:
+            assert_raises(sa.orm.exc.ConcurrentModificationError, s1.commit)
+            s1.rollback()
+        else:
+            s1.commit()
+
     @testing.emits_warning(r'.*does not support updated rowcount')
     @engines.close_open_connections
     @testing.resolve_artifact_names
@@ -582,6 +617,130 @@ class PickledDictsTest(_base.MappedTest):
                          'SamAcc': False} } ])
 
 
+class TrackedMutationsTest(_base.MappedTest):
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table('mutable_t', metadata,
+            Column('id', Integer, primary_key=True,
+                   test_needs_autoincrement=True),
+            Column('data', sa.PickleType(track_mutations=True)))
+
+    @classmethod
+    def setup_classes(cls):
+        class Foo(_base.BasicEntity):
+            pass
+
+    @classmethod
+    @testing.resolve_artifact_names
+    def setup_mappers(cls):
+        mapper(Foo, mutable_t)
+
+    @testing.resolve_artifact_names
+    def test_dict(self):
+        session = create_session(autocommit=False)
+        f1 = Foo(data={'a':1})
+        session.add(f1)
+        session.commit()
+        
+        assert isinstance(f1.data, sa.orm.attributes.MutableDict)
+        assert not session.identity_map._mutable_attrs
+        self.sql_count_(0, session.commit)
+        
+        f1.data['b'] = 2
+        assert f1 in session.dirty
+        eq_(sa.orm.attributes.get_history(f1, 'data'), 
+            ([{'a':1, 'b':2}], (), [{'a':1}]))
+        self.sql_count_(1, session.commit)
+
+        # stored as a plain dict
+        assert mutable_t.select().execute().first()['data'].__class__ is dict
+        
+        for change in (
+            lambda d: d.update(c=3),
+            lambda d: d.pop('a'),
+            lambda d: d.setdefault('d', 4),
+            lambda d: d.__delitem__('b'),
+            lambda d: d.clear(),
+        ):
+            session.expunge_all()
+            f1 = session.query(Foo).one()
+            expected = dict(f1.data)
+            change(expected)
+            change(f1.data)
+            assert f1 in session.dirty
+            self.sql_count_(1, session.commit)
+            session.expunge_all()
+            eq_(session.query(Foo).one().data, expected)
+        
+        # setdefault() of an existing key isn't a change
+        f1 = session.query(Foo).one()
+        f1.data['e'] = 5
+        session.commit()
+        f1.data.setdefault('e', 6)
+        assert f1 not in session.dirty
+        
+    @testing.resolve_artifact_names
+    def test_list(self):
+        session = create_session(autocommit=False)
+        session.add(Foo(data=[3, 1]))
+        session.commit()
+        session.expunge_all()
+        
+        for change in (
+            lambda l: l.append(2),
+            lambda l: l.sort(),
+            lambda l: l.extend([5, 6]),
+            lambda l: l.__setitem__(0, 7),
+            lambda l: l.__setslice__(1, 3, [8]),
+            lambda l: l.__iadd__([9]),
+            lambda l: l.remove(9),
+            lambda l: l.reverse(),
+            lambda l: l.__delitem__(0),
+        ):
+            f1 = session.query(Foo).one()
+            assert isinstance(f1.data, sa.orm.attributes.MutableList)
+            expected = list(f1.data)
+            change(expected)
+            change(f1.data)
+            assert f1 in session.dirty
+            self.sql_count_(1, session.commit)
+            session.expunge_all()
+            eq_(session.query(Foo).one().data, expected)
+            session.expunge_all()
+
+    @testing.resolve_artifact_names
+    def test_replace_and_share(self):
+        session = create_session(autocommit=False)
+        f1, f2 = Foo(data={'a':1}), Foo(data={'b':2})
+        session.add_all([f1, f2])
+        session.commit()
+
+        old = f1.data
+        f1.data = {'c':3}
+        session.commit()
+        
+        # a replaced value no longer affects its former owner
+        old['d'] = 4
+        assert f1 not in session.dirty
+        
+        # a value shared with another instance is copied
+        f2.data = f1.data
+        assert f2.data is not f1.data
+        f2.data['e'] = 5
+        assert f2 in session.dirty
+        assert f1 not in session.dirty
+        session.commit()
+        
+        session.expire(f1)
+        f1.data['f'] = 6
+        session.commit()
+        session.expunge_all()
+        eq_(
+            [f.data for f in session.query(Foo).order_by(Foo.id)],
+            [{'c':3, 'f':6}, {'c':3, 'e':5}]
+        )
+
 class PKTest(_base.MappedTest):
 
     @classmethod
@@ -1034,6 +1193,37 @@ class DefaultTest(_base.MappedTest):
         self.assert_(h2.foober == h3.foober == h4.foober == 'im foober')
         eq_(h5.foober, 'im the new foober')
 
+    @testing.fails_on('firebird', 'Data type unknown on the parameter')
+    @testing.resolve_artifact_names
+    def test_insert_batch(self):
+        """defaults are populated or expired for objects 
+        inserted using executemany()."""
+        
+        mapper(Hoho, default_t)
+
+        h1 = Hoho(id=1)
+        h2 = Hoho(id=2)
+        h3 = Hoho(id=3, foober='im the new foober')
+
+        session = create_session(autocommit=False)
+        session.add_all((h1, h2, h3))
+        
+        def go():
+            session.commit()
+        # h1, h2 together, then h3
+        self.sql_count_(2, go)
+
+        def go():
+            self.assert_(h1.foober == h2.foober == 'im foober')
+            eq_(h3.foober, 'im the new foober')
+        self.sql_count_(0, go)
+
+        def go():
+            self.assert_(h1.hoho == h2.hoho == h3.hoho == hohoval)
+        self.sql_count_(3, go)
+
+        self.assert_(h1.counter == h2.counter == h3.counter == 7)
+
     @testing.fails_on('firebird', 'Data type unknown on the parameter')
     @testing.resolve_artifact_names
     def test_eager_defaults(self):
@@ -1252,18 +1442,27 @@ class OneToManyTest(_fixtures.FixtureTest):
         u1.addresses.append(a3)
         del u1.addresses[0]
 
+        if testing.db.dialect.supports_sane_multi_rowcount:
+            address_updates = [
+                ("UPDATE addresses SET user_id=:user_id "
+                 "WHERE addresses.id = :addresses_id",
+                 [{'user_id': None, 'addresses_id': a1.id},
+                  {'user_id': u1.id, 'addresses_id': a3.id}])]
+        else:
+            address_updates = [
+                ("UPDATE addresses SET user_id=:user_id "
+                 "WHERE addresses.id = :addresses_id",
+                 {'user_id': None, 'addresses_id': a1.id}),
+
+                ("UPDATE addresses SET user_id=:user_id "
+                 "WHERE addresses.id = :addresses_id",
+                 {'user_id': u1.id, 'addresses_id': a3.id})]
+
         self.assert_sql(testing.db, session.flush, [
             ("UPDATE users SET name=:name "
              "WHERE users.id = :users_id",
-             {'users_id': u2.id, 'name': 'user2modified'}),
-
-            ("UPDATE addresses SET user_id=:user_id "
-             "WHERE addresses.id = :addresses_id",
-             {'user_id': None, 'addresses_id': a1.id}),
-
-            ("UPDATE addresses SET user_id=:user_id "
-             "WHERE addresses.id = :addresses_id",
-             {'user_id': u1.id, 'addresses_id': a3.id})])
+             {'users_id': u2.id, 'name': 'user2modified'})] +
+             address_updates)
 
     @testing.resolve_artifact_names
     def test_child_move(self):
@@ -2107,6 +2306,127 @@ class SaveTest2(_fixtures.FixtureTest):
              {'user_id': 2, 'email_address': 'a2'}),
         )
 
+    @testing.resolve_artifact_names
+    def test_batch_insert(self):
+        """INSERTs for objects whose primary key is present are 
+        sent using executemany()."""
+        
+        mapper(User, users, properties={
+            'addresses':relation(Address)
+        })
+        mapper(Address, addresses)
+
+        session = create_session()
+        session.add_all([
+            User(id=1, name='u1', addresses=[
+                        Address(id=1, email_address='a1'),
+                        Address(id=2, email_address='a2')]),
+            User(id=2, name='u2', addresses=[
+                        Address(id=3, email_address='a3')]),
+        ])
+
+        self.assert_sql_execution(
+            testing.db, 
+            session.flush, 
+            CompiledSQL("INSERT INTO users (id, name) VALUES (:id, :name)",
+             [{'id':1, 'name': 'u1'}, {'id':2, 'name': 'u2'}]),
+            CompiledSQL("INSERT INTO addresses (id, user_id, email_address) "
+             "VALUES (:id, :user_id, :email_address)",
+             [{'id':1, 'user_id': 1, 'email_address': 'a1'},
+              {'id':2, 'user_id': 1, 'email_address': 'a2'},
+              {'id':3, 'user_id': 2, 'email_address': 'a3'}]),
+        )
+        session.expunge_all()
+        eq_(session.query(User).order_by(User.id).all(), [
+            User(id=1, addresses=[Address(id=1), Address(id=2)]),
+            User(id=2, addresses=[Address(id=3)])
+        ])
+
+    @testing.resolve_artifact_names
+    def test_batch_insert_ordering(self):
+        """An object without a primary key is inserted individually, 
+        maintaining order."""
+        
+        mapper(User, users)
+
+        session = create_session()
+        session.add_all([User(id=1, name='u1'), User(id=2, name='u2'),
+                        User(name='u3'), User(id=4, name='u4'), 
+                        User(id=5, name='u5')])
+
+        self.assert_sql_execution(
+            testing.db, 
+            session.flush, 
+            CompiledSQL("INSERT INTO users (id, name) VALUES (:id, :name)",
+             [{'id':1, 'name': 'u1'}, {'id':2, 'name': 'u2'}]),
+            CompiledSQL("INSERT INTO users (name) VALUES (:name)",
+             {'name': 'u3'}),
+            CompiledSQL("INSERT INTO users (id, name) VALUES (:id, :name)",
+             [{'id':4, 'name': 'u4'}, {'id':5, 'name': 'u5'}]),
+        )
+
+    @testing.requires.sane_multi_rowcount
+    @testing.resolve_artifact_names
+    def test_batch_update(self):
+        """UPDATEs of the same set of columns are sent using executemany()."""
+        
+        mapper(User, users)
+
+        session = create_session()
+        u1, u2, u3 = User(id=1, name='u1'), User(id=2, name='u2'), \
+                            User(id=3, name='u3')
+        session.add_all([u1, u2, u3])
+        session.flush()
+        
+        u1.name = 'u1new'
+        u2.name = 'u2new'
+        u3.name = sa.func.lower('U3NEW')
+        
+        self.assert_sql_execution(
+            testing.db, 
+            session.flush, 
+            CompiledSQL("UPDATE users SET name=:name WHERE users.id = :users_id",
+             [{'name': 'u1new', 'users_id': 1}, {'name': 'u2new', 'users_id': 2}]),
+            CompiledSQL("UPDATE users SET name=lower(:lower_1) "
+             "WHERE users.id = :users_id",
+             {'lower_1': 'U3NEW', 'users_id': 3}),
+        )
+        session.expunge_all()
+        eq_(
+            [u.name for u in session.query(User).order_by(User.id)],
+            ['u1new', 'u2new', 'u3new']
+        )
+
+    @testing.requires.sane_multi_rowcount
+    @testing.resolve_artifact_names
+    def test_batch_update_concurrent_delete(self):
+        """the rowcount of a batched UPDATE is checked against the
+        number of objects updated."""
+
+        mapper(User, users)
+
+        session = create_session()
+        u1, u2, u3 = User(id=1, name='u1'), User(id=2, name='u2'), \
+                            User(id=3, name='u3')
+        session.add_all([u1, u2, u3])
+        session.flush()
+
+        users.delete(users.c.id == 2).execute()
+
+        u1.name = 'u1new'
+        u2.name = 'u2new'
+        u3.name = 'u3new'
+
+        self.assert_sql_execution(
+            testing.db,
+            lambda: assert_raises(sa.orm.exc.ConcurrentModificationError,
+                                    session.flush),
+            CompiledSQL("UPDATE users SET name=:name WHERE users.id = :users_id",
+             [{'name': 'u1new', 'users_id': 1},
+              {'name': 'u2new', 'users_id': 2},
+              {'name': 'u3new', 'users_id': 3}]),
+        )
+
 class SaveTest3(_base.MappedTest):
     @classmethod
     def define_tables(cls, metadata):
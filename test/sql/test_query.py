@@ -1,7 +1,7 @@
 from sqlalchemy.test.testing import eq_
 import datetime
 from sqlalchemy import *
-from sqlalchemy import exc, sql, util
+from sqlalchemy import exc, sql, util, types
 from sqlalchemy.engine import default, base
 from sqlalchemy.test import *
 from sqlalchemy.test.testing import eq_, assert_raises_message, assert_raises
@@ -426,6 +426,60 @@ class QueryTest(TestBase):
         r = s.execute(userid='fred').fetchall()
         assert len(r) == 1
 
+    def test_cached_parameter_plan(self):
+        class Upper(types.TypeDecorator):
+            impl = String
+            def process_bind_param(self, value, dialect):
+                return value.upper()
+
+        compiled = users.insert().values(
+                        user_name=bindparam('name', type_=Upper)).\
+                        compile(dialect=testing.db.dialect)
+        conn = testing.db.connect()
+        try:
+            conn.execute(compiled, user_id=7, name='jack')
+            plan = compiled._parameter_plan
+            assert plan is not None
+            conn.execute(compiled, [dict(user_id=8, name='ed'), 
+                                    dict(user_id=9, name='fred')])
+            assert compiled._parameter_plan is plan
+        finally:
+            conn.close()
+        eq_(
+            select([users.c.user_name]).order_by(users.c.user_id).\
+                execute().fetchall(),
+            [('JACK',), ('ED',), ('FRED',)]
+        )
+
+    def test_convert_params(self):
+        # exercises the C extension version when present
+        upper = lambda value: value.upper()
+        compiled_parameters = [
+            {'a':1, 'b':'x', 'c':None},
+            {'a':2, 'b':'y', 'c':'z'},
+        ]
+        eq_(
+            default.positional_params(compiled_parameters, ['c', 'b', 'a', 'b'],
+                                        [(1, upper), (3, upper)], tuple),
+            [(None, 'X', 1, 'X'), ('z', 'Y', 2, 'Y')]
+        )
+        eq_(
+            default.positional_params(compiled_parameters, ['a'], [], list),
+            [[1], [2]]
+        )
+        assert_raises(KeyError, default.positional_params, 
+                        compiled_parameters, ['d'], [], tuple)
+
+        eq_(
+            default.named_params(compiled_parameters, 
+                                    [('b', upper), ('d', upper)], None),
+            [{'a':1, 'b':'X', 'c':None}, {'a':2, 'b':'Y', 'c':'z'}]
+        )
+        r = default.named_params([{u'a':1}], [], 'utf-8')
+        eq_(r, [{'a':1}])
+        assert type(r[0].keys()[0]) is str
+        eq_(compiled_parameters[0], {'a':1, 'b':'x', 'c':None})
+
     def test_bindparam_detection(self):
         dialect = default.DefaultDialect(paramstyle='qmark')
         prep = lambda q: str(sql.text(q).compile(dialect=dialect))
@@ -668,6 +722,113 @@ class QueryTest(TestBase):
         r = r.first()
         eq_([x.lower() for x in r.keys()], ['user_id', 'user_name'])
 
+    def test_cached_result_metadata(self):
+        users.insert().execute(user_id=1, user_name='foo')
+        compiled = users.select().compile(dialect=testing.db.dialect)
+        conn = testing.db.connect()
+        try:
+            r1 = conn.execute(compiled)
+            r2 = conn.execute(compiled)
+            assert r1._metadata._processors is r2._metadata._processors
+            assert r1._metadata._keymap is not r2._metadata._keymap
+            eq_([x.lower() for x in r2.keys()], ['user_id', 'user_name'])
+            row = r2.first()
+            eq_(row[users.c.user_name], 'foo')
+            eq_(row['user_name'], 'foo')
+            r1.close()
+
+            # a different description produces new metadata
+            description, plan = compiled._result_metadata
+            compiled._result_metadata = (description[0:1], plan)
+            r3 = conn.execute(compiled)
+            assert r3._metadata._processors is not r2._metadata._processors
+            eq_(r3.first()[users.c.user_id], 1)
+        finally:
+            conn.close()
+
+    def test_cached_result_metadata_aliased(self):
+        # structurally identical statements share a Compiled; 
+        # columns are targeted per-statement
+        users.insert().execute(user_id=1, user_name='foo')
+        for i in range(3):
+            a = users.alias()
+            row = select([a.c.user_id, a.c.user_name]).execute().first()
+            eq_(row[a.c.user_id], 1)
+            eq_(row[a.c.user_name], 'foo')
+
+    def test_fetchcolumns(self):
+        class Upper(types.TypeDecorator):
+            impl = String
+            def process_result_value(self, value, dialect):
+                return value.upper()
+
+        users.insert().execute([dict(user_id=i, user_name='n%d' % i) 
+                                for i in range(1, 8)])
+        s = select([users.c.user_id, 
+                    users.c.user_name, 
+                    cast(users.c.user_name, Upper)]).order_by(users.c.user_id)
+
+        r = s.execute()
+        ids, names, upper_names = r.fetchcolumns(size=3)
+        assert r.closed
+        eq_(ids, range(1, 8))
+        eq_(names, ['n%d' % i for i in range(1, 8)])
+        eq_(upper_names, ['N%d' % i for i in range(1, 8)])
+
+        r = s.execute()
+        r.fetchone()
+        eq_(r.fetchcolumns()[0], range(2, 8))
+
+        eq_(s.where(users.c.user_id > 10).execute().fetchcolumns(), 
+            [[], [], []])
+
+        assert_raises(exc.InvalidRequestError, 
+                    users.update().execute(user_name='x').fetchcolumns)
+
+    def test_fetchcolumns_arrays(self):
+        users.insert().execute([dict(user_id=i, user_name='n%d' % i) 
+                                for i in range(1, 4)])
+        ids, names = users.select().order_by(users.c.user_id).\
+                            execute().fetchcolumns(arrays=True)
+        eq_(list(ids), [1, 2, 3])
+        eq_(list(names), ['n1', 'n2', 'n3'])
+        try:
+            import numpy
+        except ImportError:
+            import array
+            assert isinstance(ids, array.array)
+            assert isinstance(names, list)
+        else:
+            assert isinstance(ids, numpy.ndarray)
+
+    def test_stream_results(self):
+        users.insert().execute([dict(user_id=i, user_name='n%d' % i) 
+                                for i in range(1, 31)])
+        s = users.select().order_by(users.c.user_id)
+
+        r = s.execute()
+        assert not isinstance(r, base.BufferedRowResultProxy)
+        eq_([row[0] for row in r], range(1, 31))
+
+        r = s.execution_options(stream_results=True, max_row_buffer=7).execute()
+        if not testing.db.dialect.supports_server_side_cursors:
+            return
+        assert isinstance(r, base.BufferedRowResultProxy)
+        sizes = []
+        for row in r:
+            sizes.append(r._bufsize)
+        eq_(max(sizes), 7)
+        eq_(len(sizes), 30)
+
+        r = testing.db.connect().execution_options(stream_results=True).\
+                            execute("select user_id from query_users")
+        assert isinstance(r, base.BufferedRowResultProxy)
+        eq_(len(r.fetchall()), 30)
+
+        # statements which don't return rows aren't streamed
+        r = users.delete().execution_options(stream_results=True).execute()
+        assert not isinstance(r, base.BufferedRowResultProxy)
+
     def test_items(self):
         users.insert().execute(user_id=1, user_name='foo')
         r = users.select().execute().first()
@@ -1853,3 +1853,100 @@ class SchemaTest(TestBase, AssertsCompiledSQL):
                     "INSERT INTO remote_owner.remotetable (rem_id, datatype_id, value) VALUES "
                     "(:rem_id, :datatype_id, :value)")
 
+
+class CacheKeyTest(TestBase):
+    def _assert_equal(self, *stmts):
+        keys = [s._cache_key() for s in stmts]
+        for k in keys:
+            assert k is not None
+            eq_(k, keys[0])
+            eq_(hash(k), hash(keys[0]))
+
+    def _assert_distinct(self, *stmts):
+        keys = [s._cache_key() for s in stmts]
+        for i, k in enumerate(keys):
+            assert k is not None
+            for j, other in enumerate(keys):
+                if i != j:
+                    assert k != other, "%s == %s" % (stmts[i], stmts[j])
+
+    def test_bind_values_not_significant(self):
+        self._assert_equal(
+            select([table1]).where(table1.c.myid==5),
+            select([table1]).where(table1.c.myid==10),
+        )
+        self._assert_equal(
+            table1.update().where(table1.c.name=='a').values(description='x'),
+            table1.update().where(table1.c.name=='b').values(description='y'),
+        )
+        self._assert_equal(
+            table1.insert().values(myid=5, name='a'),
+            table1.insert().values(myid=7, name='b'),
+        )
+
+    def test_structure_significant(self):
+        self._assert_distinct(
+            select([table1]).where(table1.c.myid==5),
+            select([table1]).where(table1.c.myid>5),
+            select([table1]).where(table2.c.otherid==5),
+            select([table1]).where(table1.c.myid==5).limit(5),
+            select([table1]).where(table1.c.myid==5).order_by(table1.c.name),
+            select([table1.c.name]).where(table1.c.myid==5),
+            select([table1], distinct=True).where(table1.c.myid==5),
+            select([table1]).where(table1.c.myid==5).apply_labels(),
+        )
+        self._assert_distinct(
+            table1.insert().values(myid=5),
+            table1.insert().values(name='x'),
+            table2.insert().values(otherid=5),
+        )
+
+    def test_anonymous_alias(self):
+        def stmt():
+            a = table1.alias()
+            return select([a.c.myid, func.lower(a.c.name).label(None)]).\
+                    where(a.c.myid==5)
+        self._assert_equal(stmt(), stmt())
+
+        a1, a2 = table1.alias(), table1.alias()
+        self._assert_distinct(
+            select([a1.c.myid, a2.c.myid]).where(a1.c.myid==a2.c.myid),
+            select([a1.c.myid, a1.c.myid]).where(a1.c.myid==a2.c.myid),
+        )
+
+    def test_correlated_subquery(self):
+        def stmt(value):
+            s = select([table2.c.othername]).\
+                    where(table2.c.otherid==table1.c.myid).as_scalar()
+            return select([table1.c.name, s]).where(table1.c.myid==value)
+        self._assert_equal(stmt(5), stmt(10))
+
+    def test_text(self):
+        self._assert_equal(
+            text("select * from mytable where myid=:myid"),
+            text("select * from mytable where myid=:myid"),
+        )
+        self._assert_distinct(
+            text("select * from mytable where myid=:myid"),
+            text("select * from mytable where name=:name"),
+        )
+
+    def test_type_significant(self):
+        self._assert_distinct(
+            select([cast(table1.c.name, String(10))]),
+            select([cast(table1.c.name, String(20))]),
+            select([cast(table1.c.name, Integer)]),
+        )
+
+    def test_custom_element_uncacheable(self):
+        from sqlalchemy.ext.compiler import compiles
+        from sqlalchemy.sql.expression import ColumnElement
+
+        class MyThing(ColumnElement):
+            pass
+
+        @compiles(MyThing)
+        def visit_thing(element, compiler, **kw):
+            return "THING"
+
+        eq_(select([table1]).where(table1.c.myid==MyThing())._cache_key(), None)